@@ -0,0 +1,116 @@
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+
+from microbatch import DELAY_MS_BOUNDS, Histogram
+
+
+class Overloaded(Exception):
+    # status 429 (클라이언트 한도 초과) / 503 (서버 포화), retry_after 는 다시 시도할 때까지의 초
+    def __init__(self, status, message, retry_after):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+# ------------------------
+# 클라이언트별 토큰 버킷
+# ------------------------
+# 초당 rate 개씩 차고 최대 burst 개까지 쌓인다. 요청 하나에 토큰 하나.
+# 클라이언트 수가 max_clients 를 넘으면 오래 안 온 클라이언트부터 잊는다 (다시 오면 가득 찬 버킷으로 시작).
+class RateLimiter:
+    def __init__(self, rate=50.0, burst=100, max_clients=10_000, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._clock = clock
+        self._buckets = OrderedDict()      # client -> (토큰, 마지막 갱신 시각)
+        self._lock = threading.Lock()
+        self.limited = 0
+
+    def acquire(self, client, cost=1.0):
+        now = self._clock()
+        with self._lock:
+            tokens, last = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[client] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+            if not allowed:
+                self.limited += 1
+                raise Overloaded(429, f"요청 한도 초과 (초당 {self.rate:g}개)", (cost - tokens) / self.rate)
+
+    def stats(self):
+        with self._lock:
+            return {"rate": self.rate, "burst": self.burst, "clients": len(self._buckets), "limited": self.limited}
+
+
+# ------------------------
+# 작업 슬롯 + 제한된 대기열
+# ------------------------
+# 동시에 처리하는 요청은 concurrency 개까지. 나머지는 max_queue 개까지만 줄을 서고 max_wait 초가 지나면 포기한다.
+# 줄이 꽉 찼으면 기다리지 않고 바로 503 — 받아들인 요청의 대기 시간이 max_wait 를 넘지 않게 하는 것이 목적이다.
+class WorkQueue:
+    def __init__(self, concurrency=64, max_queue=256, max_wait=0.25):
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.active = 0
+        self._waiters = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.shed_full = 0
+        self.shed_timeout = 0
+        self.wait_ms = Histogram(DELAY_MS_BOUNDS)
+
+    async def acquire(self):
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            self.wait_ms.observe(0.0)
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.shed_full += 1
+            raise Overloaded(503, "대기열이 가득 찼습니다", self.max_wait)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append(future)
+        self.queued += 1
+        start = loop.time()
+        try:
+            # 슬롯은 release 가 future 에 넘겨준다 (active 는 그대로)
+            await asyncio.wait_for(future, self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            # 포기한 요청은 대기열에서 바로 뺀다 — 남겨 두면 "가득 참" 판정과 waiting 에 계속 잡힌다
+            if future.done() and not future.cancelled():
+                self.release()          # 포기하는 순간 슬롯을 넘겨받았으면 다음 요청에 넘긴다
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.shed_timeout += 1
+            raise Overloaded(503, f"{self.max_wait:g}초 안에 처리를 시작하지 못했습니다", self.max_wait) from None
+        self.admitted += 1
+        self.wait_ms.observe((loop.time() - start) * 1e3)
+
+    def release(self):
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():       # 취소되는 중인 요청은 건너뛴다
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self):
+        return {"concurrency": self.concurrency, "max_queue": self.max_queue, "max_wait_ms": self.max_wait * 1e3,
+                "active": self.active, "waiting": len(self._waiters), "admitted": self.admitted,
+                "queued": self.queued, "shed_queue_full": self.shed_full, "shed_timeout": self.shed_timeout,
+                "queue_wait_ms": self.wait_ms.snapshot()}
@@ -0,0 +1,453 @@
+import argparse
+import asyncio
+import datetime
+import functools
+import json
+import re
+from urllib.parse import parse_qsl, urlsplit
+
+from admission import Overloaded, RateLimiter, WorkQueue
+from congestion_model import (DEFAULT_RECOMMEND, DEFAULT_VARIANT, VARIANTS, drift_report, get_model,
+                              get_recommendations)
+from microbatch import MicroBatcher
+from singleflight import AsyncSingleFlight
+
+# ------------------------
+# 엔드포인트
+# ------------------------
+# GET  /health                                   모델 버전
+# GET  /metrics                                  배치 / 합친 요청 / 입장 제어 지표, 실측 피드의 드리프트 경고
+# GET  /predict?station=강남&date=2025-09-21&time=17:30[&variant=..][&live=1]
+# GET  /recommend?station=..&date=..&time=..[&variant=..][&k=..][&window=..][&step=..]
+#      k 1~100, window 0~1440 (분, 기준 시각 ±), step 1~1440 (분) — 범위 밖이면 400
+# POST /predict/bulk   {"variant": .., "queries": [{"station", "date", "time"}, ...]}
+#
+# GET 응답은 (모델 버전, URL) 이 같으면 항상 같으므로 ETag = 모델 버전, If-None-Match 가 맞으면 본문 없이 304.
+# 304 는 대기열 / 배치 / 계산 전에 모델 버전만 보고 돌려준다 (역 / 시각 검사도 하지 않는다).
+# live=1 은 최근 실측 보정 (nowcast) 값이라 캐시하지 않는다 (Cache-Control: no-store).
+#
+# 입장 제어 (/health, /metrics 제외): 클라이언트 (접속 주소) 마다 토큰 버킷 → 429,
+# X-Client-Id 헤더는 trusted_proxies 에 있는 주소 (앞단 프록시) 에서 온 요청일 때만 클라이언트로 인정한다 —
+# 아니면 헤더를 바꿔 가며 한도를 피할 수 있다.
+# 작업 슬롯이 차면 제한된 대기열에서 최대 max_wait 초 → 넘치거나 시간이 지나면 503. 둘 다 Retry-After 를 붙인다.
+MAX_BODY = 16 * 1024 * 1024
+MAX_BULK = 100_000
+MAX_AGE = 60
+BATCH_SIZE = 256
+BATCH_DELAY = 0.002
+RATE = 50.0
+BURST = 100
+CONCURRENCY = 64
+MAX_QUEUE = 256
+MAX_WAIT = 0.25
+UNLIMITED = {"/health", "/metrics"}
+CACHED = {"/predict", "/recommend"}
+DRIFT_FIELDS = ("station", "band", "z", "mean_error", "std_error", "n")
+# 날짜는 이 범위만 (자정을 넘는 추천 후보가 datetime 범위를 넘지 않게)
+DATE_RANGE = (datetime.date(2000, 1, 1), datetime.date(2099, 12, 31))
+# /recommend 의 (질의 이름, get_recommendations 인자, 최소, 최대) — 후보 수는 최대 2 * 1440 + 1 개
+RECOMMEND_LIMITS = (("k", "k", 1, 100), ("window", "window_minutes", 0, 24 * 60),
+                    ("step", "step_minutes", 1, 24 * 60))
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Response:
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.headers = dict(headers or {})
+        self.body = b"" if body is None else json.dumps(body, ensure_ascii=False).encode()
+        if body is not None:
+            self.headers.setdefault("Content-Type", "application/json; charset=utf-8")
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 429: "Too Many Requests", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+
+# ------------------------
+# 질의 해석
+# ------------------------
+def parse_time(value):
+    # "17:30" 또는 17.5 → 시간 단위 float (batch_predict.parse_times 와 같은 규칙: 분 < 60, 음수 없음)
+    clock = re.fullmatch(r"(\d{1,2}):(\d{2})", value.strip())
+    try:
+        if clock:
+            h, m = int(clock[1]), int(clock[2])
+            if m >= 60:
+                raise ValueError(value)
+            t = h + m / 60
+        elif ":" in value:
+            raise ValueError(value)
+        else:
+            t = float(value)
+    except ValueError:
+        raise HTTPError(400, f"시각 형식이 아닙니다: {value}") from None
+    if not 0 <= t < 24:
+        raise HTTPError(400, f"시각은 0 ~ 24 사이여야 합니다: {value}")
+    return t
+
+
+def parse_query(params):
+    try:
+        station = params["station"]
+        date = datetime.date.fromisoformat(params["date"])
+    except KeyError as exc:
+        raise HTTPError(400, f"{exc.args[0]} 값이 없습니다") from None
+    except ValueError:
+        raise HTTPError(400, f"날짜 형식이 아닙니다: {params['date']}") from None
+    if not DATE_RANGE[0] <= date <= DATE_RANGE[1]:
+        raise HTTPError(400, f"날짜는 {DATE_RANGE[0]} ~ {DATE_RANGE[1]} 사이여야 합니다: {date}")
+    return station, date, parse_time(params.get("time", ""))
+
+
+def lookup_model(variant):
+    if variant not in VARIANTS:
+        raise HTTPError(404, f"알 수 없는 변형: {variant}")
+    return get_model(variant)
+
+
+def check_station(model, station):
+    try:
+        model.row(station)
+    except KeyError:
+        raise HTTPError(404, f"알 수 없는 역: {station}") from None
+
+
+# ------------------------
+# 앱 (소켓과 무관 — 서버와 TestClient 가 같이 쓴다)
+# ------------------------
+class App:
+    def __init__(self, variant=DEFAULT_VARIANT, max_age=MAX_AGE, batch_size=BATCH_SIZE, batch_delay=BATCH_DELAY,
+                 rate=RATE, burst=BURST, concurrency=CONCURRENCY, max_queue=MAX_QUEUE, max_wait=MAX_WAIT,
+                 trusted_proxies=()):
+        self.variant = variant
+        self.trusted_proxies = frozenset(trusted_proxies)
+        self.max_age = max_age
+        # rate <= 0 이면 클라이언트별 한도 없음
+        self.limiter = RateLimiter(rate, burst) if rate > 0 else None
+        self.queue = WorkQueue(concurrency, max_queue, max_wait)
+        # 동시에 들어온 /predict 를 모아 한 번의 배열 계산으로 (batch_size=1 이면 하나씩)
+        self.batcher = MicroBatcher(score_batch, batch_size, batch_delay)
+        # 같은 (모델 버전, 변형, 역, 날짜, 시각) 질의가 계산 중이면 새로 계산하지 않고 그 결과를 같이 받는다
+        self.flight = AsyncSingleFlight()
+        self.not_modified = 0
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/metrics"): self.metrics,
+            ("GET", "/predict"): self.predict,
+            ("GET", "/recommend"): self.recommend,
+            ("POST", "/predict/bulk"): self.bulk,
+        }
+
+    async def handle(self, method, target, headers=None, body=b"", client=None):
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        handler = self.routes.get((method, url.path))
+        try:
+            if handler is None:
+                known = any(path == url.path for _, path in self.routes)
+                raise HTTPError(405 if known else 404, f"{method} {url.path}")
+            if url.path in UNLIMITED:
+                return await handler(params, headers, body)
+            # 거절은 계산 전에, 가능한 한 싸게: 한도 확인 → 슬롯 (또는 제한된 대기)
+            if self.limiter is not None:
+                self.limiter.acquire(self.client_id(headers, client))
+            # 조건부 GET 은 모델 버전만 보면 답이 정해진다 — 슬롯 / 배치 / 계산 없이 바로 304
+            not_modified = self._not_modified(url.path, params, headers)
+            if not_modified is not None:
+                return not_modified
+            await self.queue.acquire()
+            try:
+                return await handler(params, headers, body)
+            finally:
+                self.queue.release()
+        except HTTPError as exc:
+            return Response(exc.status, {"error": str(exc)})
+        except Overloaded as exc:
+            return Response(exc.status, {"error": str(exc)},
+                            {"Retry-After": str(exc.retry_after), "Cache-Control": "no-store"})
+
+    def client_id(self, headers, client):
+        if client in self.trusted_proxies:
+            return headers.get("x-client-id") or client
+        return client or "-"
+
+    def _cache_headers(self, model):
+        return {"ETag": f'"{model.model_version}"', "Cache-Control": f"public, max-age={self.max_age}"}
+
+    def _not_modified(self, path, params, headers):
+        # 캐시하는 GET (live 가 아닌 /predict, /recommend) 이고 If-None-Match 가 지금 모델 버전이면 304, 아니면 None
+        if path not in CACHED or params.get("live") in ("1", "true") or not headers.get("if-none-match"):
+            return None
+        cache_headers = self._cache_headers(lookup_model(params.get("variant", self.variant)))
+        if not etag_matches(headers["if-none-match"], cache_headers["ETag"]):
+            return None
+        self.not_modified += 1
+        return Response(304, headers=cache_headers)
+
+    def _cached(self, model, headers, payload, live=False):
+        # 같은 모델 버전이면 같은 답 — 클라이언트 / 프록시가 재검증만 하도록
+        if live:
+            return Response(200, payload, {"Cache-Control": "no-store"})
+        cache_headers = self._cache_headers(model)
+        if etag_matches(headers.get("if-none-match"), cache_headers["ETag"]):
+            return Response(304, headers=cache_headers)
+        return Response(200, payload, cache_headers)
+
+    async def health(self, params, headers, body):
+        model = get_model(self.variant)
+        return Response(200, {"status": "ok", "model_version": model.model_version},
+                        {"Cache-Control": "no-store"})
+
+    async def metrics(self, params, headers, body):
+        return Response(200, {"model_version": get_model(self.variant).model_version,
+                              "batching": self.batcher.stats(), "coalescing": self.flight.stats(),
+                              "not_modified": self.not_modified,
+                              "admission": {"rate_limit": self.limiter.stats() if self.limiter else None,
+                                            "queue": self.queue.stats()},
+                              "drift": {name: [dict(zip(DRIFT_FIELDS, cell)) for cell in cells]
+                                        for name, cells in drift_report().items()}},
+                        {"Cache-Control": "no-store"})
+
+    async def predict(self, params, headers, body):
+        model = lookup_model(params.get("variant", self.variant))
+        station, date, t = parse_query(params)
+        check_station(model, station)
+        live = params.get("live") in ("1", "true")
+        when = datetime.datetime.combine(date, datetime.time()) + datetime.timedelta(hours=t) if live else None
+        weekday, month = date.weekday(), date.month
+        if live:
+            # 실측 보정은 역마다 상태를 보므로 하나씩 — 앱 화면과 같은 반올림 순서: 인원 → 정수, CDI → 소수 둘째 자리
+            pred = int(round(model.predict(station, t, weekday, month, when)))
+            cdi = round(model.cdi(station, pred, weekday, month), 2)
+            code = model.grade(cdi)
+        else:
+            row = model.row(station)
+            key = ("predict", model.model_version, model.name, row, date, t)
+            pred, cdi, code = await self.flight.do(key, lambda: self.batcher.submit((model, row, t, weekday, month)))
+        payload = {"station": station, "date": date.isoformat(), "time": t, "pred": pred, "cdi": cdi,
+                   "grade": code, "level": model.labels[code], "model_version": model.model_version}
+        return self._cached(model, headers, payload, live)
+
+    async def recommend(self, params, headers, body):
+        variant = params.get("variant", self.variant)
+        model = lookup_model(variant)
+        station, date, t = parse_query(params)
+        check_station(model, station)
+        options = {**DEFAULT_RECOMMEND, **VARIANTS[variant].get("recommend", {})}
+        for key, name, low, high in RECOMMEND_LIMITS:
+            if key in params:
+                try:
+                    options[name] = int(params[key])
+                except ValueError:
+                    raise HTTPError(400, "k / window / step 은 정수여야 합니다") from None
+            if not low <= options[name] <= high:
+                raise HTTPError(400, f"{key} 는 {low} ~ {high} 사이여야 합니다")
+        key = ("recommend", model.model_version, variant, model.row(station), date, t, tuple(sorted(options.items())))
+        recs = await self.flight.do(key, lambda: self._recommend(model, station, date, t, options))
+        payload = {"station": station, "date": date.isoformat(), "time": t, "model_version": model.model_version,
+                   "recommendations": [{"date": when.date().isoformat(), "time": when.strftime("%H:%M"), "pred": p,
+                                        "cdi": c, "level": lv} for when, p, c, lv in recs]}
+        return self._cached(model, headers, payload)
+
+    async def _recommend(self, model, station, date, t, options):
+        # 후보가 수천 개면 수 ms — 이벤트 루프를 막지 않도록 스레드에서
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(get_recommendations, station, date, t, model=model, **options))
+
+    async def bulk(self, params, headers, body):
+        try:
+            request = json.loads(body or b"{}")
+            queries = request["queries"]
+            if not isinstance(queries, list) or not all(isinstance(q, dict) for q in queries):
+                raise TypeError(queries)
+        except (ValueError, KeyError, TypeError):
+            raise HTTPError(400, '본문은 {"queries": [{"station", "date", "time"}, ...]} 형태의 JSON 이어야 합니다') from None
+        if len(queries) > MAX_BULK:
+            raise HTTPError(413, f"한 번에 {MAX_BULK}개까지")
+        model = lookup_model(request.get("variant", self.variant))
+        # 벡터 계산이라도 수만 건이면 수십 ms — 이벤트 루프를 막지 않도록 스레드에서
+        results = await asyncio.get_running_loop().run_in_executor(None, bulk_predict, queries, model)
+        return Response(200, {"model_version": model.model_version, "results": results},
+                        {"ETag": f'"{model.model_version}"', "Cache-Control": "no-store"})
+
+
+def score_batch(items):
+    # [(모델, 역 행 번호, 시각, 요일, 월)] → [(인원, CDI, 등급 코드)] — 모델 (변형) 별로 묶어 StationModel.score_array 한 번씩
+    import numpy as np
+    groups = {}
+    for i, item in enumerate(items):
+        groups.setdefault(id(item[0]), []).append(i)
+    results = [None] * len(items)
+    for idx in groups.values():
+        model = items[idx[0]][0]
+        rows, times, weekdays, months = (np.array(col) for col in list(zip(*(items[i] for i in idx)))[1:])
+        pred, cdi, grade = model.score_array(rows, times, weekdays, months)
+        for i, p, c, g in zip(idx, pred.tolist(), cdi.tolist(), grade.tolist()):
+            results[i] = (int(p), c, g)
+    return results
+
+
+def bulk_predict(queries, model):
+    # batch_predict 의 청크 계산 그대로 — 모르는 역은 pred / cdi 가 null, grade -1
+    import numpy as np
+    import pandas as pd
+
+    from batch_predict import QUERY_KEYS, parse_dates, parse_times, predict_frame
+    if not queries:
+        return []
+    try:
+        df = pd.DataFrame.from_records(queries, columns=QUERY_KEYS)
+    except (TypeError, ValueError):
+        raise HTTPError(400, "queries 의 각 항목은 {station, date, time} 객체여야 합니다") from None
+    bad = df.isna().any(axis=1).to_numpy().nonzero()[0]
+    if len(bad):
+        raise HTTPError(400, f"{int(bad[0])}번째 질의에 station / date / time 중 빠진 값이 있습니다")
+    df = df.astype(str)
+    # 날짜 / 시각이 틀린 질의는 /predict 와 같이 400 (batch_predict 라면 그 행만 비워 둔다). 모르는 역만 grade -1.
+    for key, bad in (("date", ~parse_dates(df["date"])[2]), ("time", np.isnan(parse_times(df["time"])))):
+        if bad.any():
+            i = int(bad.nonzero()[0][0])
+            raise HTTPError(400, f"{i}번째 질의의 {key} 를 해석할 수 없습니다: {df[key].iloc[i]}")
+    try:
+        df = predict_frame(df, model)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise HTTPError(400, f"질의를 해석할 수 없습니다: {exc!r}") from None
+    return [{"station": s, "date": d, "time": t, "pred": None if p != p else int(p), "cdi": None if c != c else c,
+             "grade": int(g), "level": lv}
+            for s, d, t, p, c, g, lv in zip(*(df[k].tolist() for k in QUERY_KEYS + ["pred", "cdi", "grade", "level"]))]
+
+
+def etag_matches(header, etag):
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+# ------------------------
+# HTTP/1.1 (keep-alive, Content-Length 본문만)
+# ------------------------
+async def read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "잘못된 요청 줄") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY:
+        raise HTTPError(413, "본문이 너무 큽니다")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, version, headers, body
+
+
+def encode_response(response, keep_alive):
+    headers = dict(response.headers)
+    headers["Content-Length"] = str(len(response.body))
+    headers["Connection"] = "keep-alive" if keep_alive else "close"
+    head = f"HTTP/1.1 {response.status} {REASONS.get(response.status, '')}\r\n"
+    head += "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+    return head.encode("latin-1") + b"\r\n" + response.body
+
+
+async def handle_connection(app, reader, writer):
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except HTTPError as exc:
+                writer.write(encode_response(Response(exc.status, {"error": str(exc)}), False))
+                break
+            if request is None:
+                break
+            method, target, version, headers, body = request
+            try:
+                peer = writer.get_extra_info("peername")
+                response = await app.handle(method, target, headers, body, peer[0] if peer else None)
+            except Exception as exc:      # 요청 하나의 오류가 연결 / 서버를 죽이지 않게
+                response = Response(500, {"error": repr(exc)})
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+            writer.write(encode_response(response, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(app, host="127.0.0.1", port=8000):
+    server = await asyncio.start_server(lambda r, w: handle_connection(app, r, w), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+# ------------------------
+# 테스트 클라이언트 (소켓 없이 App.handle 을 직접 호출)
+# ------------------------
+class TestClient:
+    def __init__(self, app=None):
+        self.app = app or App()
+        self._loop = asyncio.new_event_loop()
+
+    def request(self, method, target, headers=None, body=b"", client="testclient"):
+        return self._loop.run_until_complete(self.app.handle(method, target, headers, body, client))
+
+    def get(self, target, headers=None):
+        return self.request("GET", target, headers)
+
+    def post(self, target, json_body=None, headers=None):
+        return self.request("POST", target, headers, json.dumps(json_body, ensure_ascii=False).encode())
+
+    def close(self):
+        self._loop.close()
+
+
+if __name__ == "__main__":
+    from congestion_model import FEED_SOURCE, start_nowcast_feed, start_watcher
+
+    parser = argparse.ArgumentParser(description="혼잡도 예측 JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--variant", default=DEFAULT_VARIANT)
+    parser.add_argument("--max-age", type=int, default=MAX_AGE)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="한 번에 모을 /predict 요청 수 (1 이면 배치 없음)")
+    parser.add_argument("--batch-delay-ms", type=float, default=BATCH_DELAY * 1e3, help="첫 요청이 기다리는 최대 시간")
+    parser.add_argument("--rate", type=float, default=RATE, help="클라이언트별 초당 요청 수 (0 이면 제한 없음)")
+    parser.add_argument("--burst", type=int, default=BURST)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="동시에 처리할 요청 수")
+    parser.add_argument("--max-queue", type=int, default=MAX_QUEUE, help="슬롯을 기다릴 수 있는 요청 수")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT * 1e3, help="대기열에서 기다리는 최대 시간")
+    parser.add_argument("--trusted-proxy", action="append", default=[], metavar="ADDR",
+                        help="X-Client-Id 헤더를 믿을 앞단 프록시 주소 (여러 번 줄 수 있다)")
+    parser.add_argument("--feed", default=FEED_SOURCE,
+                        help="live=1 보정에 쓸 실측 피드 (파일 / - / tcp://호스트:포트, 기본은 CROWD_FEED_SOURCE)")
+    args = parser.parse_args()
+
+    start_watcher()
+    if args.feed:
+        start_nowcast_feed(args.feed)
+    print(f"http://{args.host}:{args.port}")
+    app = App(args.variant, args.max_age, args.batch_size, args.batch_delay_ms / 1e3,
+              args.rate, args.burst, args.concurrency, args.max_queue, args.max_wait_ms / 1e3, args.trusted_proxy)
+    asyncio.run(serve(app, args.host, args.port))
@@ -0,0 +1,169 @@
+import datetime
+
+import streamlit as st
+
+from cache import cached_query, resource, stats_caption
+from congestion_model import DEFAULT_RECOMMEND, VARIANTS, drift_report, get_model, get_recommendations
+from grading import COLORS, ICONS
+from intervals import below_intervals, format_interval
+
+DEFAULT_DATE = datetime.date(2025, 9, 21)
+
+
+# ------------------------
+# 공통 화면 조각
+# ------------------------
+def banner(title, color=None):
+    style = "text-align: center; padding: 10px; border-radius: 10px;"
+    if color:
+        style += f" background-color: {color};"
+    st.markdown(f"<h1 style='{style}'>{title}</h1>", unsafe_allow_html=True)
+
+
+def format_when(when, date):
+    # 고른 날짜와 다른 날 (자정 전후) 이면 날짜도 붙인다
+    if when.date() == date:
+        return when.strftime("%H:%M")
+    return f"{when.month}/{when.day} {when:%H:%M}"
+
+
+def legend(model, icons=False):
+    # CDI 기준표: 등급표의 하한값에서 바로 만든다
+    bounds = (0.0,) + tuple(model.cutoffs)
+    rows = []
+    for code in reversed(range(len(model.labels))):
+        mark = ICONS[code] if icons else f"<span style='color:{COLORS[code]};'>●</span>"
+        if code == len(bounds) - 1:
+            text = f"CDI ≥ {bounds[code]:.2f}"
+        elif code == 0:
+            text = f"CDI < {bounds[1]:.2f}"
+        else:
+            text = f"{bounds[code]:.2f} ≤ CDI < {bounds[code + 1]:.2f}"
+        rows.append(f"{mark} {model.labels[code]}: {text}")
+    st.markdown("<div style='border:1px solid #ccc; padding:10px; margin-top:10px'><b>CDI 기준표</b><br>"
+                + "<br>".join(rows) + "</div>", unsafe_allow_html=True)
+
+
+# ------------------------
+# 변형 페이지 (congestion_model.VARIANTS 설정 하나 = 페이지 하나)
+# ------------------------
+def variant_page(name):
+    def page():
+        render_variant(name)
+    page.__name__ = name
+    return page
+
+
+def render_variant(name):
+    config = VARIANTS[name]
+    layout = config.get("layout", {})
+    recommend = {**DEFAULT_RECOMMEND, **config.get("recommend", {})}
+    # 이번 실행은 이 모델 하나로 끝까지 (도중에 모델 파일이 바뀌어도 섞이지 않는다)
+    model = get_model(name)
+
+    banner("지하철 혼잡도 분석", layout.get("color"))
+    st.caption(config["title"])
+
+    with st.form(f"{name}_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            station = st.selectbox("역 선택", model.stations)
+        with col2:
+            date = st.date_input("날짜 선택", value=DEFAULT_DATE)
+        with col3:
+            hour = st.selectbox("시", list(range(0, 24)), index=17)
+            minute = st.selectbox("분", list(range(0, 60)), index=30)
+        submitted = st.form_submit_button("🔍 검색")
+
+    weekday, month = date.weekday(), date.month
+    if submitted:
+        t = hour + minute / 60
+        when = datetime.datetime.combine(date, datetime.time(hour, minute))
+        # 현재 값은 실측 보정 (nowcast) 때문에 매번 (보정이 없으면 예측 테이블에서), 추천은 역/날짜/시각이 같으면 캐시에서
+        pred, cdi, code = model.score(station, weekday, month, hour, minute, when)
+        recs = cached_query((name, model.model_version, station, date, hour, minute),
+                            lambda: get_recommendations(station, date, t, model=model, **recommend))
+
+        st.markdown(f"<div style='display:flex; justify-content:space-between; border:2px solid black; "
+                    f"padding:10px; border-radius:5px;'><b>🚉 {station}</b><b>{date} {hour:02d}:{minute:02d}</b></div>",
+                    unsafe_allow_html=True)
+        st.markdown("### 현재 혼잡도")
+        icon = f" {ICONS[code]}" if layout.get("icons") else ""
+        st.markdown(f"<h3 style='color:{COLORS[code]};'>{model.labels[code]}{icon}</h3>", unsafe_allow_html=True)
+        st.write(f"예상 인원: {pred:,}명 / CDI: {cdi}")
+        if layout.get("legend"):
+            legend(model, layout.get("icons"))
+
+        st.markdown("### 추천 시간대")
+        for col, (rec_when, rec_pred, rec_cdi, rec_level) in zip(st.columns(max(len(recs), 1)), recs):
+            with col:
+                st.markdown(f"<div style='border:2px solid #999; border-radius:10px; padding:10px; text-align:center;'>"
+                            f"<b>{format_when(rec_when, date)}</b><br>{rec_level}<br>{rec_pred:,}명 (CDI {rec_cdi})</div>",
+                            unsafe_allow_html=True)
+
+    if layout.get("intervals"):
+        intervals_panel(name, model, station, date)
+
+    st.sidebar.caption(f"모델 {model.model_version}")
+    drifting = sorted({cell[0] for cell in drift_report().get(model.coefficient_set, [])})
+    if drifting:
+        st.sidebar.warning(f"실측과 예측 오차가 평소와 다른 역: {', '.join(drifting)}")
+    st.sidebar.caption(stats_caption())
+
+
+def intervals_panel(name, model, station, date):
+    st.markdown("### 여유 시간대 찾기")
+    level = st.selectbox("이 등급보다 덜 붐비는 시간", model.labels[1:], index=1, key=f"{name}_level")
+    if st.button("시간대 찾기", key=f"{name}_intervals"):
+        weekday, month = date.weekday(), date.month
+        limit = model.cutoffs[model.labels.index(level) - 1] * model.max_value(station, weekday, month)
+        row = tuple(model.coefficients[model.row(station)].tolist())
+        found = below_intervals(row, weekday, month, limit)
+        if found:
+            for interval in found:
+                st.write(format_interval(interval))
+        else:
+            st.info(f"{date} {station}은 하루 종일 {level} 이상입니다.")
+
+
+# ------------------------
+# 전체 역 페이지
+# ------------------------
+@resource(max_entries=2)
+def _network(variant, model_version):
+    # 모델 버전마다 하나 — 모든 세션이 같은 행렬을 쓴다. 모델이 바뀌면 옛 버전은 밀려난다 (교체 중에는 둘이 같이 있다)
+    from network import Network
+    return Network.from_model(get_model(variant))
+
+
+def network_page():
+    from congestion_model import DEFAULT_VARIANT
+
+    model = get_model(DEFAULT_VARIANT)
+    network = _network(DEFAULT_VARIANT, model.model_version)
+    now = datetime.datetime.now()
+    banner("지금 가장 여유로운 역", "pink")
+
+    with st.form("network_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            date = st.date_input("날짜", value=now.date())
+        with col2:
+            hour = st.number_input("시", min_value=0, max_value=23, value=now.hour, step=1)
+            minute = st.number_input("분", min_value=0, max_value=59, value=now.minute, step=1)
+        with col3:
+            k = st.number_input("몇 개", min_value=1, max_value=len(network), value=min(10, len(network)), step=1)
+            basis = st.radio("비교 기준", ["혼잡도(CDI)", "예상 인원"])
+        submitted = st.form_submit_button("검색")
+
+    if submitted:
+        import pandas as pd
+
+        by = "cdi" if basis == "혼잡도(CDI)" else "prediction"
+        result = network.least_crowded(hour + minute / 60, date.weekday(), date.month, k=int(k), by=by)
+        df = pd.DataFrame(result, columns=["역", "예상 인원", "CDI", "혼잡도"])
+        df["예상 인원"] = df["예상 인원"].round().astype(int)
+        df["CDI"] = df["CDI"].round(2)
+        df.index = range(1, len(df) + 1)
+        st.markdown(f"### {date} {hour:02}:{minute:02} 기준 ({len(network)}개 역)")
+        st.table(df)
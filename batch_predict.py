@@ -0,0 +1,171 @@
+import argparse
+import collections
+import os
+import sys
+import time as _time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from crowd_engine import canonical_station
+
+# ------------------------
+# 입력 / 출력 형식
+# ------------------------
+# 질의 한 행 = station(역 이름) / date(YYYY-MM-DD) / time(HH:MM 또는 시간 단위 숫자), 그 밖의 열은 그대로 따라 나간다.
+# 출력은 입력 열 + pred(예상 인원) / cdi / grade(등급 코드) / level(등급 이름).
+# 모르는 역이나 날짜 / 시각이 비었거나 틀린 행은 pred / cdi 가 비고 grade 가 -1, level 이 "".
+# 계획용 (미래 날짜) 이라 실측 보정 (nowcast) 은 하지 않는다.
+QUERY_KEYS = ["station", "date", "time"]
+CHUNKSIZE = 200_000
+RESULT_TYPES = {"pred": "float64", "cdi": "float64", "grade": "int8", "level": "string"}
+
+
+def read_queries(path, chunksize=CHUNKSIZE):
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        # 모든 열을 문자열로 — 청크마다 형식을 추측하면 같은 열이 숫자 / 문자열 / 빈 열로 갈린다 (write_chunks)
+        yield from pd.read_csv(sys.stdin if path == "-" else path, chunksize=chunksize, dtype=str)
+
+
+def query_schema(path):
+    # 입력 열의 형식: Parquet 은 파일에 적힌 그대로, CSV 는 None (모두 문자열)
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).schema_arrow
+    return None
+
+
+def parse_times(values):
+    # "17:30" / "17:30:00" / "17.5" / 17.5 → 시간 단위 float, 한 열에 형식이 섞여 있어도 된다.
+    # 비었거나 형식이 틀리거나 (분 / 초 ≥ 60, 음수) 0 ~ 24 밖이면 NaN.
+    # 문자열은 종류가 하루 1440개 정도라 고유값만 나눠 읽는다.
+    if pd.api.types.is_numeric_dtype(values):
+        hours = values.to_numpy(dtype=np.float64)
+    else:
+        codes, uniques = pd.factorize(values)
+        text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+        parts = text.str.extract(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$").astype(np.float64)
+        minutes, seconds = parts[1], parts[2].fillna(0)
+        clock = (parts[0] + minutes / 60 + seconds / 3600).where((minutes < 60) & (seconds < 60))
+        plain = pd.to_numeric(text.where(~text.str.contains(":")), errors="coerce")
+        parsed = clock.fillna(plain).to_numpy(dtype=np.float64)
+        hours = np.append(parsed, np.nan)[codes]       # code -1 (빈 값) → 마지막 칸의 NaN
+    with np.errstate(invalid="ignore"):
+        return np.where((hours >= 0) & (hours < 24), hours, np.nan)
+
+
+def parse_dates(values):
+    # (요일, 월, 날짜가 맞는지) — 비었거나 날짜가 아니면 맞지 않는 행
+    codes, uniques = pd.factorize(values)
+    dates = pd.DatetimeIndex(pd.to_datetime(pd.Series(uniques, dtype=object), errors="coerce"))
+    valid = np.append(~dates.isna(), False)[codes]
+    weekday = np.append(dates.weekday.to_numpy(), -1)[codes]
+    month = np.append(dates.month.to_numpy(), -1)[codes]
+    return np.nan_to_num(weekday, nan=-1).astype(np.int64), np.nan_to_num(month, nan=-1).astype(np.int64), valid
+
+
+# ------------------------
+# 청크 하나 계산
+# ------------------------
+def predict_frame(df, model):
+    missing = [c for c in QUERY_KEYS if c not in df.columns]
+    if missing:
+        raise ValueError(f"질의 파일에 {', '.join(missing)} 열이 없습니다")
+    # 역 이름은 고유값만 정규화해서 찾는다 (청크 안에 역 종류는 많지 않다)
+    codes, names = pd.factorize(df["station"])
+    index = model.artifact.station_index
+    rows = np.array([index.get(canonical_station(str(n)), -1) for n in names] + [-1], dtype=np.intp)[codes]
+    # 모르는 역 / 빈 값 / 형식이 틀린 날짜나 시각은 계산하지 않고 pred / cdi 가 비고 grade -1
+    weekday, month, valid_date = parse_dates(df["date"])
+    times = parse_times(df["time"])
+    known = (rows >= 0) & valid_date & ~np.isnan(times)
+    pred_k, cdi_k, grade_k = model.score_array(rows[known], times[known], weekday[known], month[known])
+
+    pred = np.full(len(df), np.nan)
+    cdi = np.full(len(df), np.nan)
+    grade = np.full(len(df), -1, dtype=np.int8)
+    pred[known], cdi[known], grade[known] = pred_k, cdi_k, grade_k
+    level = np.asarray(list(model.labels) + [""], dtype=object)[grade]
+    return df.assign(pred=pred, cdi=cdi, grade=grade, level=level)
+
+
+# 작업 프로세스마다 모델 파일을 한 번만 읽는다 (mmap 이라 프로세스끼리 페이지를 같이 쓴다)
+_worker_model = None
+
+
+def _init_worker(path, variant):
+    global _worker_model
+    from congestion_model import StationModel, load_artifact
+    _worker_model = StationModel(variant, load_artifact(path))
+
+
+def _predict_chunk(df):
+    return predict_frame(df, _worker_model)
+
+
+def predict_chunks(chunks, path, variant, workers=None):
+    # 결과 청크를 입력 순서대로 내보낸다. 동시에 들고 있는 청크는 작업자 수의 2배까지라 메모리가 입력 크기와 무관하다.
+    if workers == 1:
+        _init_worker(path, variant)
+        yield from map(_predict_chunk, chunks)
+        return
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path, variant)) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_predict_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_chunks(results, output, input_schema=None):
+    # 청크마다 이어 쓴다 — .parquet 이면 행 그룹 하나씩, 아니면 CSV (output 이 "-" 면 표준 출력)
+    # 열 형식은 첫 청크에서 추측하지 않고 고정한다: 결과 열은 RESULT_TYPES, 입력 열은 input_schema (query_schema),
+    # 거기 없으면 문자열. 첫 청크에서 비어 있던 열 / 청크마다 숫자였다 문자열이었다 하는 열도 같은 형식으로 쓴다.
+    import pyarrow as pa
+    import pyarrow.csv as pcsv
+    import pyarrow.parquet as pq
+    rows = 0
+    writer = schema = None
+    try:
+        for df in results:
+            if schema is None:
+                known = {} if input_schema is None else {f.name: f.type for f in input_schema}
+                schema = pa.schema([(name, pa.type_for_alias(RESULT_TYPES[name]) if name in RESULT_TYPES
+                                     else known.get(name, pa.string())) for name in df.columns])
+                if output.endswith(".parquet"):
+                    writer = pq.ParquetWriter(output, schema)
+                else:
+                    writer = pcsv.CSVWriter(sys.stdout.buffer if output == "-" else output, schema)
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+            rows += len(df)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+if __name__ == "__main__":
+    from congestion_model import DEFAULT_VARIANT, MODEL_PATH
+
+    parser = argparse.ArgumentParser(description="질의 파일 (역, 날짜, 시각) 전체에 예상 인원 / CDI / 등급 붙이기")
+    parser.add_argument("input", help="CSV / Parquet 질의 파일 (- 는 표준 입력 CSV)")
+    parser.add_argument("-o", "--output", default="-", help="결과 파일 (.csv / .parquet, 기본은 표준 출력 CSV)")
+    parser.add_argument("--variant", default=DEFAULT_VARIANT)
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    args = parser.parse_args()
+
+    start = _time.perf_counter()
+    chunks = read_queries(args.input, args.chunksize)
+    rows = write_chunks(predict_chunks(chunks, args.model, args.variant, args.workers), args.output,
+                        query_schema(args.input))
+    print(f"{rows} rows, {_time.perf_counter() - start:.1f}s", file=sys.stderr)
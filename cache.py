@@ -0,0 +1,110 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from singleflight import SingleFlight
+
+try:
+    import streamlit as st
+except ImportError:     # CLI / 배치 작업에서는 streamlit 없이도 import 가능해야 한다
+    st = None
+
+
+# ------------------------
+# 모델 테이블 (세션 간 공유, 변하지 않음)
+# ------------------------
+def resource(fn=None, max_entries=None):
+    # streamlit 안에서는 st.cache_resource (모든 세션이 같은 객체 공유), 밖에서는 프로세스 단위 캐시
+    # 인자에 모델 버전이 들어가는 것처럼 키가 계속 바뀌면 max_entries 로 오래된 것을 버린다: @resource(max_entries=4)
+    if fn is None:
+        return functools.partial(resource, max_entries=max_entries)
+    if st is not None:
+        return st.cache_resource(show_spinner=False, max_entries=max_entries)(fn)
+    return functools.lru_cache(maxsize=max_entries)(fn)
+
+
+# ------------------------
+# 검색 결과 (TTL + LRU)
+# ------------------------
+class TTLCache:
+    def __init__(self, maxsize=4096, ttl=600.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data = OrderedDict()      # key -> (만료 시각, 값), 오래 안 쓴 것이 앞
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expires, value = item
+                if expires > self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        # 계산은 lock 밖에서. 같은 키를 이미 다른 세션이 계산 중이면 그 결과를 기다린다 (계산 중 저장까지 끝낸다).
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._flight.do(key, lambda: self._compute_and_set(key, compute))
+        return value
+
+    def _compute_and_set(self, key, compute):
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "coalesced": self._flight.saved,
+            }
+
+
+_MISSING = object()
+
+# 프로세스 전체에서 하나 — 모든 세션/재실행이 함께 쓴다
+query_cache = TTLCache()
+
+
+def cached_query(key, compute):
+    return query_cache.get_or_compute(key, compute)
+
+
+def stats_caption():
+    s = query_cache.stats()
+    return (f"캐시 적중 {s['hits']} / 미스 {s['misses']} (적중률 {s['hit_rate']:.0%}), "
+            f"항목 {s['size']}/{s['maxsize']}, 제거 {s['evictions']}, 만료 {s['expirations']}, "
+            f"동시 요청 합침 {s['coalesced']}")
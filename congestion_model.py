@@ -0,0 +1,602 @@
+import datetime
+import os
+import threading
+
+from grading import GRADE_TABLES, LABELS, SPACED_LABELS, grade_code
+
+# ------------------------
+# 모델 변형 정의
+# ------------------------
+# 앱마다 다른 역 표기 / CDI 기준값 / 등급 기준을 데이터로만 적어 둔다 (모델 파일이 없을 때의 기본값).
+# numpy 와 계수 행렬은 해당 변형을 처음 쓸 때 불러오므로, 변형을 추가해도
+# 그 변형을 쓰지 않는 페이지의 import 시간은 늘지 않는다.
+
+# 계수 세트: "standard" 는 crowd_engine.COEFFICIENTS, 나머지는 [절편, 시간, 시간^2, 요일, 월] (역 순서: 강남, 서울역, 사당, 홍대입구)
+COEFFICIENT_SETS = {
+    # streamlit_app 변형: 소수 첫째 자리까지 반올림한 계수
+    "rounded": [
+        [-7548.7, 1692.1, -50.0, -323.5, -9.2],
+        [-3513.2, 819.5, -26.8, -80.6, 8.9],
+        [-117.5, 337.1, -12.3, -61.4, 9.5],
+        [-5115.8, 1080.5, -30.0, 85.3, 19.9],
+    ],
+    # streamlit_app5 변형: 별도로 다시 추정한 회귀식 (사당은 시간^2 항 없음)
+    "app5": [
+        [362.50, 0.01, 0.29, -12.16, -3.24],
+        [254.34, -0.01, -0.30, -9.78, 1.15],
+        [510.15, -13.06, 0.00, -24.36, 2.12],
+        [859.58, -0.04, -1.06, 56.08, 0.27],
+    ],
+}
+
+STATION_NAMES = ["강남", "서울역", "사당", "홍대입구"]
+STATION_NAMES_WITH_SUFFIX = ["강남역", "서울역", "사당역", "홍대입구역"]
+
+# max_values 가 "daily_peak" 이면 그날(역/요일/월)의 하루 최대값으로 나눈다
+# 화면 설정 (모델 파일에는 들어가지 않는다):
+#   title      페이지 이름
+#   recommend  추천 시간대 탐색 범위 (DEFAULT_RECOMMEND 에서 바꿀 값만)
+#   layout     color (제목 배경색), wide (넓은 화면), legend (CDI 기준표), icons (등급 아이콘), intervals (여유 시간대 찾기)
+DEFAULT_RECOMMEND = {"window_minutes": 30, "step_minutes": 5, "k": 3}
+
+VARIANTS = {
+    "streamlit_app": {
+        "stations": ["서울역", "강남역", "사당역", "홍대입구역"],
+        "coefficients": "rounded",
+        "max_values": "daily_peak",
+        "cutoffs": GRADE_TABLES["peak"].cutoffs,
+        "labels": LABELS,
+        "title": "하루 최대값 기준",
+        "recommend": {"window_minutes": 60},
+        "layout": {"intervals": True},
+    },
+    "streamlit_app2": {
+        "stations": STATION_NAMES_WITH_SUFFIX,
+        "coefficients": "standard",
+        "max_values": {"강남": 1400, "서울역": 1100, "사당": 950, "홍대입구": 1000},
+        "cutoffs": GRADE_TABLES["standard"].cutoffs,
+        "labels": SPACED_LABELS,
+        "title": "고정 기준값 (소형)",
+        "layout": {"legend": True},
+    },
+    "streamlit_app3": {
+        "stations": STATION_NAMES_WITH_SUFFIX,
+        "coefficients": "standard",
+        "max_values": "daily_peak",
+        "cutoffs": GRADE_TABLES["even"].cutoffs,
+        "labels": LABELS,
+        "title": "하루 최대값 기준 (5단계 균등)",
+        "layout": {},
+    },
+    "streamlit_app4": {
+        "stations": STATION_NAMES_WITH_SUFFIX,
+        "coefficients": "standard",
+        "max_values": {"강남": 6923, "서울역": 3287, "사당": 1938, "홍대입구": 4486},
+        "cutoffs": GRADE_TABLES["even"].cutoffs,
+        "labels": LABELS,
+        "title": "수동 기준값 (5단계 균등)",
+        "layout": {},
+    },
+    "streamlit_app5": {
+        "stations": ["서울역", "강남", "홍대입구", "사당"],
+        "coefficients": "app5",
+        "max_values": {"강남": 3472, "서울역": 2306, "사당": 1599, "홍대입구": 3434},
+        "cutoffs": GRADE_TABLES["standard"].cutoffs,
+        "labels": LABELS,
+        "title": "재추정 회귀식",
+        "layout": {},
+    },
+    # streamlit_app6 은 기준값이 정해진 적이 없어 같은 등급표를 쓰는 streamlit_app4 의 값을 쓴다
+    "streamlit_app6": {
+        "stations": STATION_NAMES,
+        "coefficients": "standard",
+        "max_values": {"강남": 6923, "서울역": 3287, "사당": 1938, "홍대입구": 4486},
+        "cutoffs": GRADE_TABLES["even"].cutoffs,
+        "labels": SPACED_LABELS,
+        "title": "기본",
+        "layout": {"color": "#ffb6c1", "wide": True, "legend": True},
+    },
+    "streamlit_app7": {
+        "stations": STATION_NAMES,
+        "coefficients": "standard",
+        "max_values": {"강남": 14353.4, "서울역": 10099.0, "사당": 5620.2, "홍대입구": 9476.4},
+        "cutoffs": GRADE_TABLES["standard"].cutoffs,
+        "labels": LABELS,
+        "title": "상위 5개 평균 기준",
+        "layout": {"legend": True},
+    },
+    "streamlit_app8": {
+        "stations": STATION_NAMES,
+        "coefficients": "standard",
+        "max_values": {"강남": 14353.4, "서울역": 10099.0, "사당": 5620.2, "홍대입구": 9476.4},
+        "cutoffs": GRADE_TABLES["standard"].cutoffs,
+        "labels": LABELS,
+        "title": "상위 5개 평균 기준 (2)",
+        "layout": {},
+    },
+    "streamlit_app9": {
+        "stations": STATION_NAMES,
+        "coefficients": "standard",
+        "max_values": {"강남": 14353.4, "서울역": 10099.0, "사당": 5620.2, "홍대입구": 9476.4},
+        "cutoffs": GRADE_TABLES["standard"].cutoffs,
+        "labels": LABELS,
+        "title": "상위 5개 평균 기준 (3)",
+        "recommend": {"window_minutes": 15},
+        "layout": {"color": "#ffe0f0", "wide": True},
+    },
+    "streamlit_app10": {
+        "stations": STATION_NAMES,
+        "coefficients": "standard",
+        "max_values": {"강남": 9805, "서울역": 4248, "사당": 3524, "홍대입구": 6821},
+        "cutoffs": GRADE_TABLES["standard"].cutoffs,
+        "labels": LABELS,
+        "title": "수동 기준값 (아이콘)",
+        "recommend": {"window_minutes": 45, "step_minutes": 15},
+        "layout": {"color": "#ffe4e1", "legend": True, "icons": True},
+    },
+    "streamlit_app11": {
+        "stations": STATION_NAMES_WITH_SUFFIX,
+        "coefficients": "standard",
+        "max_values": {"강남": 8206, "서울역": 5522, "사당": 2945, "홍대입구": 3434},
+        "cutoffs": GRADE_TABLES["narrow"].cutoffs,
+        "labels": LABELS,
+        "title": "상위 10% 기준",
+        "layout": {"color": "pink"},
+    },
+    "streamlit_app12": {
+        "stations": STATION_NAMES_WITH_SUFFIX,
+        "coefficients": "standard",
+        "max_values": {"강남": 5974, "서울역": 2660, "사당": 2164, "홍대입구": 4951},
+        "cutoffs": GRADE_TABLES["narrow"].cutoffs,
+        "labels": LABELS,
+        "title": "수동 기준값 (좁은 구간)",
+        "recommend": {"step_minutes": 15},
+        "layout": {"color": "pink", "wide": True},
+    },
+    "streamlit_app13": {
+        "stations": STATION_NAMES_WITH_SUFFIX,
+        "coefficients": "standard",
+        "max_values": {"강남": 9180, "서울역": 7870, "사당": 6025, "홍대입구": 8572},
+        "cutoffs": GRADE_TABLES["narrow"].cutoffs,
+        "labels": LABELS,
+        "title": "상위 10% 기준 (2)",
+        "recommend": {"step_minutes": 15},
+        "layout": {"color": "#ffc0cb", "legend": True},
+    },
+    "streamlit_app14": {
+        "stations": STATION_NAMES,
+        "coefficients": "standard",
+        "max_values": {"강남": 7382, "서울역": 3283, "사당": 3001, "홍대입구": 6419},
+        "cutoffs": GRADE_TABLES["narrow"].cutoffs,
+        "labels": LABELS,
+        "title": "수동 기준값 (좁은 구간 2)",
+        "layout": {"color": "pink"},
+    },
+}
+
+DEFAULT_VARIANT = "streamlit_app6"
+
+
+# ------------------------
+# 모델 파일
+# ------------------------
+# 재학습한 모델은 이 경로에 파일만 놓으면 된다 (model_artifact.py 형식). 없으면 위의 기본값을 쓴다.
+MODEL_PATH = os.environ.get("CROWD_MODEL_PATH",
+                            os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "crowd_model.bin"))
+
+# 변형마다 역 x 요일 x 월 x 분 예측 테이블 (forecast_table 형식) 을 두는 곳. 역이 많으면 만드는 데 초 단위 / 수백 MB 라
+# 요청 경로에서는 만들지 않는다: 처음 쓰는 변형은 백그라운드 스레드가, 모델 파일이 바뀌면 감시 스레드가 교체 전에
+# (쓰던 변형만, 해시가 같으면 이전 테이블 그대로) 만든다. 준비되기 전에는 계산한다.
+# 빈 문자열이면 테이블 없이 매번 계산한다 (역이 많아 파일이 커지는 경우 등).
+TABLE_DIR = os.environ.get("CROWD_TABLE_DIR",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "tables"))
+
+
+def load_artifact(path=MODEL_PATH):
+    import model_artifact
+    if os.path.exists(path):
+        return model_artifact.load_artifact(path)
+    return model_artifact.builtin_artifact()
+
+
+def display_stations(names, stations):
+    # 변형의 역 목록 (화면 표기) 을 모델 파일의 역 (stations, 정규화된 이름) 에 맞춘다:
+    # 모델 파일에 없는 역은 빼고, 변형에 없던 역은 뒤에 붙인다 — 변형이 "강남역" 처럼 "역" 을 붙여 쓰면 새 역에도 붙인다
+    from crowd_engine import canonical_station
+    present = set(stations)
+    listed = [n for n in names if canonical_station(n) in present]
+    seen = {canonical_station(n) for n in listed}
+    suffix = any(n.endswith("역") and canonical_station(n) != n for n in names)
+    extra = [s if not suffix or s.endswith("역") else s + "역" for s in stations if s not in seen]
+    return listed + extra
+
+
+# ------------------------
+# 모델
+# ------------------------
+_UNSET = object()
+
+
+class StationModel:
+    def __init__(self, name, artifact):
+        spec = artifact.variants[name]
+        self.name = name
+        self.artifact = artifact
+        self.model_version = artifact.model_version
+        self.stations = display_stations(spec["stations"], artifact.stations)
+        self.cutoffs = spec["cutoffs"]
+        self.labels = list(spec["labels"])
+        self.coefficient_set = spec["coefficients"]
+        self.coefficients = artifact.coefficient_sets[spec["coefficients"]]
+        self.max_values = spec["max_values"]      # NaN 이면 그날의 하루 최대값
+        self._table = _UNSET
+        self._table_lock = threading.Lock()
+        self._table_thread = None
+
+    def table(self):
+        # 이 변형의 예측 테이블 (1분 슬롯, mmap). 아직 없으면 백그라운드에서 만들기 시작하고 None (계산으로 대신한다)
+        table = self._table
+        if table is _UNSET:
+            with self._table_lock:
+                if self._table is _UNSET and self._table_thread is None:
+                    self._table_thread = threading.Thread(target=self.build_table, name=f"table-{self.name}",
+                                                          daemon=True)
+                    self._table_thread.start()
+            return None
+        return table
+
+    @property
+    def table_requested(self):
+        return self._table is not _UNSET or self._table_thread is not None
+
+    def build_table(self, previous=None):
+        # 이 스레드에서 테이블을 읽거나 만든다. previous: 이전 스냅샷의 같은 변형 — 만들 값이 같으면 그 테이블을 그대로
+        with self._table_lock:
+            if self._table is _UNSET:
+                self._table = self._load_table(previous)
+        return self._table
+
+    def _load_table(self, previous=None):
+        if not TABLE_DIR:
+            return None
+        from forecast_table import load_or_build, params_digest
+        params = params_digest(self.max_values, self.cutoffs, 1, self.coefficients, stations=self.artifact.stations)
+        reuse = None if previous is None else previous._table
+        if reuse not in (_UNSET, None) and reuse.params == params:
+            return reuse
+        try:
+            os.makedirs(TABLE_DIR, exist_ok=True)
+            return load_or_build(os.path.join(TABLE_DIR, f"{self.name}.bin"), self.max_values, self.cutoffs,
+                                 slot_minutes=1, coefficients=self.coefficients, stations=self.artifact.stations)
+        except OSError:         # 읽기 전용 디렉터리 등
+            return None
+
+    def row(self, station):
+        return self.artifact.row(station)
+
+    def predict(self, station, time, weekday, month, when=None):
+        # when (datetime) 을 주면 최근 실측으로 보정한 값 — 실측이 없거나 먼 시각이면 보정 없음
+        from crowd_engine import predict_array
+        pred = float(predict_array(self.row(station), time, weekday, month, self.coefficients))
+        if when is not None:
+            pred = get_nowcaster(self.coefficient_set).correct(self.artifact.stations[self.row(station)], when, pred)
+        return pred
+
+    def max_value(self, station, weekday=None, month=None):
+        row = self.row(station)
+        value = float(self.max_values[row])
+        if value == value:
+            return value
+        from crowd_engine import daily_peak
+        return daily_peak(tuple(self.coefficients[row].tolist()), weekday, month)[1]
+
+    def cdi(self, station, pred, weekday=None, month=None):
+        return pred / self.max_value(station, weekday, month)
+
+    def grade(self, cdi):
+        return grade_code(cdi, self)
+
+    def score_array(self, rows, times, weekdays, months):
+        # 질의 여러 개 (같은 길이의 1차원 배열) 를 한 번에: 앱 화면과 같은 반올림 (인원 → 정수, CDI → 소수 둘째 자리) 후 등급
+        import numpy as np
+
+        from crowd_engine import grade_array, peak_array, predict_array
+        rows = np.asarray(rows, dtype=np.intp)
+        pred = predict_array(rows, times, weekdays, months, self.coefficients).round()
+        max_values = np.asarray(self.max_values)[rows]
+        daily = np.isnan(max_values)
+        if daily.any():
+            weekdays, months = np.broadcast_to(weekdays, rows.shape), np.broadcast_to(months, rows.shape)
+            max_values[daily] = peak_array(self.coefficients[rows[daily]], weekdays[daily], months[daily])[1]
+        cdi = (pred / max_values).round(2)
+        # 값이 없으면 (NaN) 등급도 없다: grade_array 는 NaN 을 맨 위 등급으로 보내므로 -1 로 바꾼다
+        grade = grade_array(cdi, self.cutoffs).astype(np.int8)
+        grade[~np.isfinite(cdi)] = -1
+        return pred, cdi, grade
+
+    def score(self, station, weekday, month, hour, minute, when=None):
+        # 화면의 질의 하나: (인원 정수, CDI 소수 둘째 자리, 등급 코드)
+        # 실측 보정이 없으면 예측 테이블을 읽고 (등급도 테이블의 값), 있으면 계산해서 보정한다
+        table = self.table()
+        if table is not None and (when is None or self._correction(station, when) == 0):
+            row = self.row(station)
+            pred = int(round(float(table.counts[row, weekday, month - 1, table.slot(hour, minute)]) * table.scale))
+            cdi = round(self.cdi(station, pred, weekday, month), 2)
+            return pred, cdi, int(table.grades[row, weekday, month - 1, table.slot(hour, minute)])
+        pred = int(round(self.predict(station, hour + minute / 60, weekday, month, when)))
+        cdi = round(self.cdi(station, pred, weekday, month), 2)
+        return pred, cdi, self.grade(cdi)
+
+    def _correction(self, station, when):
+        return get_nowcaster(self.coefficient_set).correction(self.artifact.stations[self.row(station)], when)
+
+    def level(self, cdi):
+        return self.labels[self.grade(cdi)]
+
+
+# ------------------------
+# 스냅샷 (모델 파일 하나 + 거기서 만든 변형 모델들)
+# ------------------------
+class Snapshot:
+    def __init__(self, artifact, prebuild=False):
+        self.artifact = artifact
+        self.model_version = artifact.model_version
+        self._models = {}
+        self._lock = threading.Lock()
+        if prebuild:
+            for name in artifact.variants:
+                self._models[name] = StationModel(name, artifact)
+
+    def build_tables(self, previous=None):
+        # 이전 스냅샷에서 테이블을 쓰던 (부른 적 있는) 변형만 — 교체 전에 감시 스레드에서 부른다
+        if previous is None:
+            return
+        for name, model in self._models.items():
+            old = previous._models.get(name)
+            if old is not None and old.table_requested:
+                model.build_table(old)
+
+    def model(self, variant=DEFAULT_VARIANT):
+        model = self._models.get(variant)
+        if model is None:
+            # 처음 쓰는 변형만 lock 을 잡고 만든다 (세션/스레드가 동시에 불러도 한 번)
+            with self._lock:
+                model = self._models.get(variant)
+                if model is None:
+                    model = StationModel(variant, self.artifact)
+                    self._models[variant] = model
+        return model
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def current_snapshot():
+    # 읽기 경로에는 lock 이 없다: 전역 참조 하나를 읽을 뿐이고, 교체는 참조 대입 한 번으로 끝난다.
+    # 재실행 한 번 동안 같은 스냅샷을 쓰려면 맨 앞에서 한 번 받아 두고 계속 쓴다.
+    snapshot = _snapshot
+    if snapshot is None:
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if snapshot is None:
+                snapshot = _publish(Snapshot(load_artifact()))
+    return snapshot
+
+
+def _publish(snapshot):
+    global _snapshot
+    _snapshot = snapshot
+    return snapshot
+
+
+def get_artifact():
+    return current_snapshot().artifact
+
+
+def get_model(variant=DEFAULT_VARIANT):
+    return current_snapshot().model(variant)
+
+
+# ------------------------
+# 모델 파일 감시 / 교체
+# ------------------------
+class ModelWatcher(threading.Thread):
+    def __init__(self, path=MODEL_PATH, interval=2.0):
+        super().__init__(name="model-watcher", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.reloads = 0
+        self.errors = 0
+        self.in_place = 0           # 이름 바꾸기가 아니라 제자리에서 덮어쓴 횟수
+        self.last_error = None
+        self._stopped = threading.Event()
+        self._signature = _file_signature(path)
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def check(self):
+        signature = _file_signature(self.path)
+        if signature is None or signature == self._signature:
+            return False
+        if self._signature is not None and signature[2] == self._signature[2]:
+            # 내용은 바뀌었는데 inode 가 같다 = 제자리 덮어쓰기 (model_artifact.load_artifact 위의 설명).
+            # 이름 바꾸기였다면 옛 inode 는 지금 스냅샷의 mmap 이 잡고 있어 새 파일이 같은 번호를 받을 수 없다.
+            self.in_place += 1
+            self.last_error = f"제자리에서 덮어쓴 모델 파일 ({self.path}) — 배포는 이름 바꾸기로 해야 합니다"
+        try:
+            # 새 스냅샷은 요청 경로 밖(이 스레드)에서 변형까지 전부 만든 뒤에 한 번에 교체
+            snapshot = Snapshot(load_artifact(self.path), prebuild=True)
+        except Exception as exc:      # 잘못된 파일이면 기존 모델을 계속 쓴다
+            self.errors += 1
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            self._signature = signature
+            return False
+        # 예측 테이블도 교체 전에 — 새 모델의 첫 요청이 테이블 만드는 시간을 떠안지 않게
+        snapshot.build_tables(_snapshot)
+        _publish(snapshot)
+        self._signature = signature
+        self.reloads += 1
+        return True
+
+    def stop(self):
+        self._stopped.set()
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+_watcher = None
+
+
+def start_watcher(path=MODEL_PATH, interval=2.0):
+    # 프로세스에 하나만 띄운다 — 페이지가 여러 번 불러도 같은 감시 스레드
+    global _watcher
+    with _snapshot_lock:
+        if _watcher is None or not _watcher.is_alive():
+            _watcher = ModelWatcher(path, interval)
+            _watcher.start()
+    return _watcher
+
+
+# ------------------------
+# 실측 보정 (nowcast)
+# ------------------------
+# 잔차 / 오차 통계는 계수 세트마다 따로, 역 목록은 그때의 모델 파일을 따른다.
+# 모델이 바뀌면 (역이 늘거나 줄 수 있다) 처음 부를 때 새 역 목록으로 다시 만든다.
+_nowcasters = {}        # 계수 세트 -> (만들 때의 artifact, Nowcaster)
+
+
+def _for_current_model(registry, key, make):
+    # make(artifact, 이전 (artifact, 객체) 또는 None) — 지금 모델 파일이 만들 때와 같으면 그대로 돌려준다
+    artifact = get_artifact()
+    entry = registry.get(key)
+    if entry is None or entry[0] is not artifact:
+        with _snapshot_lock:
+            entry = registry.get(key)
+            if entry is None or entry[0] is not artifact:
+                entry = registry[key] = (artifact, make(artifact, entry))
+    return entry[1]
+
+
+def model_lineage(artifact):
+    # online_rls.publish 가 계수만 갱신해 쓴 모델은 처음 모델 (base_version) 과 같은 계보
+    return artifact.meta.get("online", {}).get("base_version", artifact.model_version), tuple(artifact.stations)
+
+
+def get_nowcaster(coefficient_set="standard"):
+    # 두 모델에 다 있는 역의 최근 잔차는 넘겨받는다 (어차피 horizon 안의 것만 쓰인다)
+    def make(artifact, previous):
+        from nowcast import Nowcaster
+        nowcaster = Nowcaster(artifact.stations)
+        if previous is not None:
+            nowcaster.carry_over(previous[1])
+        return nowcaster
+    return _for_current_model(_nowcasters, coefficient_set, make)
+
+
+_drift_monitors = {}    # 계수 세트 -> (만들 때의 artifact, DriftMonitor)
+
+
+def get_drift_monitor(coefficient_set="standard"):
+    # 새 모델 (재학습, 역 목록 변경) 은 오차 분포도 새로. 온라인 학습 (online_rls) 이 계수만 조금씩 바꿔 다시 쓴 모델은
+    # 기준 통계를 그대로 이어 간다 — 1분마다 새로 시작하면 어떤 칸도 min_baseline 에 닿지 못해 드리프트를 볼 수 없다
+    def make(artifact, previous):
+        from drift import DriftMonitor
+        if previous is not None and model_lineage(previous[0]) == model_lineage(artifact):
+            return previous[1]
+        return DriftMonitor(artifact.stations)
+    return _for_current_model(_drift_monitors, coefficient_set, make)
+
+
+def drift_report():
+    # 지금 모델에서 오차 분포가 바뀐 칸 {계수 세트: [(역, 시간대, z, 기준 평균 오차, 기준 표준편차, 기준 개수), ...]}
+    # 실측 피드가 들어온 계수 세트만 (피드가 없으면 빈 사전)
+    artifact = get_artifact()
+    return {name: monitor.report() for name, (built, monitor) in list(_drift_monitors.items()) if built is artifact}
+
+
+def observe(station, when, count):
+    # 실측 하나를 모든 계수 세트의 보정 / 드리프트 감시에 반영
+    from crowd_engine import canonical_station, predict_array
+    artifact = get_artifact()
+    row = artifact.station_index.get(canonical_station(station))
+    if row is None:
+        return
+    t = when.hour + when.minute / 60
+    for name, coefficients in artifact.coefficient_sets.items():
+        pred = float(predict_array(row, t, when.weekday(), when.month, coefficients))
+        get_nowcaster(name).observe(artifact.stations[row], when, count, pred)
+        get_drift_monitor(name).update(artifact.stations[row], t, count - pred)
+
+
+# 실측 피드 위치 (online_rls.read_lines 의 source: 파일 / "-" / "tcp://호스트:포트"). 비어 있으면 피드 없이 모델값만.
+FEED_SOURCE = os.environ.get("CROWD_FEED_SOURCE", "")
+
+_feed = None
+
+
+def start_nowcast_feed(source=FEED_SOURCE, follow=True):
+    # online_rls 와 같은 "역,시각,인원" 줄 형식의 실측을 백그라운드에서 읽는다 (프로세스에 하나)
+    global _feed
+    from online_rls import parse_observation, read_lines
+
+    def run():
+        for line in read_lines(source, follow):
+            try:
+                observe(*parse_observation(line))
+            except ValueError:
+                continue
+
+    with _snapshot_lock:
+        if _feed is None or not _feed.is_alive():
+            _feed = threading.Thread(target=run, name="nowcast-feed", daemon=True)
+            _feed.start()
+    return _feed
+
+
+# ------------------------
+# 값 하나씩 계산하는 함수 (화면 / API 공용)
+# ------------------------
+# model 을 넘기지 않으면 호출할 때의 최신 모델을 쓴다
+# when (datetime) 을 주면 최근 실측으로 보정한 예측
+def calculate_prediction(station, input_time, weekday, month, model=None, when=None):
+    model = model or get_model()
+    return int(round(model.predict(station, input_time, weekday, month, when)))
+
+
+def calculate_cdi(station, pred, weekday=None, month=None, model=None):
+    model = model or get_model()
+    return round(model.cdi(station, pred, weekday, month), 2)
+
+
+def get_congestion_level(cdi, model=None):
+    model = model or get_model()
+    return model.level(cdi)
+
+
+def get_recommendations(station, date, time, k=3, window_minutes=30, step_minutes=5, model=None):
+    # date 의 time 기준 ±window 안에서 예상 인원이 적은 k개: [(datetime, 인원, CDI, 등급), ...]
+    # 자정을 넘는 후보는 다음 (이전) 날의 요일 / 월로 계산하고, CDI 기준값도 그날 것을 쓴다 (recommender.recommend)
+    from recommender import recommend
+
+    model = model or get_model()
+    # 23:59:30 이후는 분으로 반올림하면 24:00 — 다음 날 00:00 으로 넘긴다
+    days, minute_of_day = divmod(int(round(time * 60)), 24 * 60)
+    date += datetime.timedelta(days=days)
+    hour, minute = divmod(minute_of_day, 60)
+    recs = recommend(station, date, hour, minute, k, window_minutes, step_minutes,
+                     coefficients=model.coefficients, index=model.artifact.station_index, table=model.table())
+    result = []
+    for rec in recs:
+        p = int(round(rec.prediction))
+        cdi = round(model.cdi(station, p, rec.when.weekday(), rec.when.month), 2)
+        result.append((rec.when, p, cdi, model.level(cdi)))
+    return result
@@ -0,0 +1,235 @@
+import functools
+import time as _time
+
+import numpy as np
+
+from grading import GRADE_TABLES
+
+# ------------------------
+# 역 / 회귀 계수 정의
+# ------------------------
+# 계수 행렬의 행 순서
+STATIONS = ["강남", "서울역", "사당", "홍대입구"]
+STATION_INDEX = {name: i for i, name in enumerate(STATIONS)}
+
+# 앱마다 역 이름 표기가 달라서 ("강남" / "강남역") 한 이름으로 통일
+# 끝의 "역"은 canonical_station 이 떼므로 여기에는 그 밖의 별칭만 적는다
+STATION_ALIASES = {
+    "서울": "서울역",
+}
+
+# [절편, 시간, 시간^2, 요일, 월]
+COEFFICIENTS = np.array([
+    [-7548.7568, 1692.1847, -50.0100, -323.5538, -9.2502],   # 강남
+    [-3513.2458, 819.5735, -26.8271, -80.6853, 8.9737],      # 서울역
+    [-117.5344, 337.1758, -12.3019, -61.4697, 9.5399],       # 사당
+    [-5115.8516, 1080.5163, -30.0831, 85.3852, 19.9417],     # 홍대입구
+], dtype=np.float64)
+
+# 새벽 시간 보정: 5시 이전은 모두 5시로 처리
+SERVICE_START = 5.0
+SERVICE_END = 24.0
+
+# 등급 라벨 (코드 0 = 여유 ~ 4 = 매우혼잡) 과 하한값 — grading.py 의 "standard" 등급표 (streamlit_app7 기준)
+GRADE_LABELS = GRADE_TABLES["standard"].labels
+DEFAULT_CUTOFFS = GRADE_TABLES["standard"].cutoffs
+
+
+# 이름 자체가 "역"으로 끝나서 떼면 안 되는 역
+KEEP_SUFFIX = {"서울역"}
+
+
+def canonical_station(name):
+    # "강남" / "강남역" → "강남", "서울" / "서울역" → "서울역"
+    name = name.strip()
+    name = STATION_ALIASES.get(name, name)
+    if name.endswith("역") and name not in KEEP_SUFFIX:
+        name = name[:-1]
+    return name
+
+
+def station_indices(stations, index=None):
+    # 역 이름(문자열) 또는 행 번호(정수)를 계수 행렬의 행 번호 배열로 변환
+    if index is None:
+        index = STATION_INDEX
+    arr = np.asarray(stations)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.intp, copy=False)
+    # 고유값만 사전에서 찾고 나머지는 역인덱스로 펼친다
+    uniques, inverse = np.unique(arr, return_inverse=True)
+    try:
+        rows = np.array([index[canonical_station(str(u))] for u in uniques], dtype=np.intp)
+    except KeyError as exc:
+        raise KeyError(f"알 수 없는 역: {exc.args[0]}") from None
+    return rows[inverse].reshape(arr.shape)
+
+
+def max_value_array(max_values, index=None):
+    # {역: 최대값} 사전을 계수 행렬과 같은 순서의 배열로 변환
+    if index is None:
+        index = STATION_INDEX
+    if not isinstance(max_values, dict):
+        return np.asarray(max_values, dtype=np.float64)
+    out = np.full(len(index), np.nan)
+    for name, value in max_values.items():
+        out[index[canonical_station(name)]] = value
+    return out
+
+
+# ------------------------
+# 배치 예측
+# ------------------------
+def predict_array(stations, times, weekdays, months, coefficients=COEFFICIENTS, clamp=True, clip=True):
+    # 모든 입력은 서로 broadcast 가능한 배열 (스칼라 포함)
+    rows = station_indices(stations)
+    t = np.asarray(times, dtype=np.float64)
+    if clamp:
+        t = np.maximum(t, SERVICE_START)
+    # 계수 5열을 (5, 역) 전치 행렬에서 take 한 번으로 — 열마다 따로 take 하면 행 번호 배열을 5번 다시 읽는다
+    a, b, c, d, e = np.ascontiguousarray(coefficients.T).take(rows, axis=1)
+    # a + b*t + c*t^2 를 Horner 방식으로: a + t*(b + c*t), 결과 버퍼 y 와 임시 버퍼 하나만 쓴다
+    shape = np.broadcast_shapes(rows.shape, t.shape, np.shape(weekdays), np.shape(months))
+    y = np.empty(shape)
+    tmp = np.empty(shape)
+    np.multiply(c, t, out=y)
+    y += b
+    y *= t
+    y += a
+    np.multiply(d, weekdays, out=tmp)
+    y += tmp
+    np.multiply(e, months, out=tmp)
+    y += tmp
+    if clip:
+        np.maximum(y, 0.0, out=y)
+    return y
+
+
+def cdi_array(predictions, stations, max_values):
+    rows = station_indices(stations)
+    return np.asarray(predictions, dtype=np.float64) / max_value_array(max_values)[rows]
+
+
+def grade_array(cdi, cutoffs=DEFAULT_CUTOFFS):
+    # 하한값 이상이면 그 단계 = cdi 가 넘은 (>=) 하한값의 개수 (searchsorted(side="right") 와 같다).
+    # 하한값은 몇 개뿐이라 원소마다 이진 탐색하는 searchsorted 보다 하한값마다 비교 한 번씩 더하는 쪽이 훨씬 빠르다.
+    # "cdi < 하한값" 의 부정으로 세므로 NaN 은 searchsorted 와 같이 맨 위 단계
+    cdi = np.asarray(cdi, dtype=np.float64)
+    codes = np.zeros(cdi.shape, dtype=np.uint8)
+    below = np.empty(cdi.shape, dtype=bool)
+    for cutoff in cutoffs:
+        np.less(cdi, cutoff, out=below)
+        np.logical_not(below, out=below)
+        codes += below
+    return codes
+
+
+def grade_labels(codes, labels=GRADE_LABELS):
+    return np.asarray(labels, dtype=object)[codes]
+
+
+def predict_batch(stations, times, weekdays, months, max_values, cutoffs=DEFAULT_CUTOFFS,
+                  coefficients=COEFFICIENTS, clamp=True, clip=True):
+    # 예측 인원, CDI, 등급 코드를 한 번에 계산
+    rows = station_indices(stations)
+    pred = predict_array(rows, times, weekdays, months, coefficients, clamp=clamp, clip=clip)
+    cdi = pred / max_value_array(max_values)[rows]
+    return pred, cdi, grade_array(cdi, cutoffs)
+
+
+# ------------------------
+# 하루 최대값 (CDI 정규화 기준)
+# ------------------------
+# 시간에 대해 2차식이므로 최대값은 꼭짓점(-b/2c)이나 운행 시간의 양 끝에 있다
+def peak_array(coefficients, weekdays, months, start=SERVICE_START, end=SERVICE_END):
+    b, c = coefficients[..., 1], coefficients[..., 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vertex = np.clip(-b / (2 * c), start, end)
+    # 위로 볼록(c >= 0)하면 양 끝 중 큰 쪽
+    endpoint = np.where(b + c * (start + end) >= 0, end, start)
+    peak_time = np.where(c < 0, vertex, endpoint)
+    a, d, e = coefficients[..., 0], coefficients[..., 3], coefficients[..., 4]
+    peak_value = a + peak_time * (b + c * peak_time) + d * weekdays + e * months
+    return peak_time, peak_value
+
+
+@functools.lru_cache(maxsize=4096)
+def daily_peak(coefficient_row, weekday, month):
+    # coefficient_row: (절편, 시간, 시간^2, 요일, 월) 튜플 — 캐시 키로 쓰기 위해 튜플로 받는다
+    peak_time, peak_value = peak_array(np.asarray(coefficient_row), weekday, month)
+    return float(peak_time), float(peak_value)
+
+
+def daily_max(station, weekday, month, coefficients=COEFFICIENTS):
+    row = coefficients[STATION_INDEX[canonical_station(station)]]
+    return daily_peak(tuple(row.tolist()), weekday, month)[1]
+
+
+# ------------------------
+# 스칼라 경로와 속도 비교
+# ------------------------
+# streamlit_app7 의 predict_passenger / get_congestion_level 과 같은 형태
+_SCALAR_COEFFICIENTS = {name: COEFFICIENTS[i].tolist() for i, name in enumerate(STATIONS)}
+_SCALAR_MAX_VALUES = {"강남": 14353.4, "서울역": 10099.0, "사당": 5620.2, "홍대입구": 9476.4}
+
+
+def _scalar_predict(station, t, weekday, month):
+    if t < SERVICE_START:
+        t = SERVICE_START
+    a, b, c, d, e = _SCALAR_COEFFICIENTS[station]
+    return max(a + b*t + c*(t**2) + d*weekday + e*month, 0)
+
+
+def _scalar_grade(cdi):
+    if cdi >= 0.9:
+        return 4
+    elif cdi >= 0.7:
+        return 3
+    elif cdi >= 0.5:
+        return 2
+    elif cdi >= 0.3:
+        return 1
+    else:
+        return 0
+
+
+def _scalar_batch(names, times, weekdays, months):
+    out = []
+    for s, t, w, m in zip(names, times, weekdays, months):
+        pred = _scalar_predict(s, t, w, m)
+        cdi = pred / _SCALAR_MAX_VALUES[s]
+        out.append((pred, cdi, _scalar_grade(cdi)))
+    return out
+
+
+def benchmark(n=100_000, repeat=3, seed=0):
+    rng = np.random.default_rng(seed)
+    stations = rng.integers(0, len(STATIONS), n)
+    times = rng.uniform(0, 24, n)
+    weekdays = rng.integers(0, 7, n)
+    months = rng.integers(1, 13, n)
+    args = ([STATIONS[i] for i in stations], times.tolist(), weekdays.tolist(), months.tolist())
+
+    def best_of(fn, repeat):
+        # 첫 호출 결과만 남기고 잰 호출의 결과는 바로 버린다 — 결과를 들고 다음 호출을 재면
+        # 매번 새 메모리 페이지를 받아 첫 접근 비용 (page fault) 까지 재게 된다
+        result = fn()
+        best = float("inf")
+        for _ in range(repeat):
+            start = _time.perf_counter()
+            fn()
+            best = min(best, _time.perf_counter() - start)
+        return best, result
+
+    scalar_sec, scalar = best_of(lambda: _scalar_batch(*args), repeat)
+    # 벡터 경로는 1 ms 남짓이라 한두 번 재면 스케줄러 잡음이 그대로 섞인다 — 여러 번 재서 최솟값
+    vector_sec, vector = best_of(lambda: predict_batch(stations, times, weekdays, months, _SCALAR_MAX_VALUES),
+                                 repeat * 50)
+
+    assert np.allclose([p for p, _, _ in scalar], vector[0])
+    assert np.array_equal([g for _, _, g in scalar], vector[2])
+    return scalar_sec, vector_sec
+
+
+if __name__ == "__main__":
+    scalar_sec, vector_sec = benchmark()
+    print(f"scalar: {scalar_sec * 1000:.1f} ms, vector: {vector_sec * 1000:.2f} ms, x{scalar_sec / vector_sec:.0f}")
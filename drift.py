@@ -0,0 +1,165 @@
+import argparse
+import bisect
+import datetime
+import math
+import threading
+
+import numpy as np
+
+# ------------------------
+# 시간대 구분
+# ------------------------
+BAND_EDGES = np.array([0, 7, 10, 17, 20])        # 각 구간의 시작 시각
+BAND_LABELS = ["새벽", "출근", "낮", "퇴근", "저녁"]
+_BAND_STARTS = BAND_EDGES.tolist()
+
+
+def time_band(hours):
+    return np.searchsorted(BAND_EDGES, hours, side="right") - 1
+
+
+# ------------------------
+# 예측 오차 드리프트 감시
+# ------------------------
+# (역, 시간대) 칸마다 기준 통계 (지금까지 전체) 와 현재 창 통계를 Welford 방식 (개수, 평균, 편차제곱합) 으로 누적한다.
+# 창이 window 개 차면 기준과 비교해 플래그를 정하고 창을 기준에 합친다 — 칸마다 숫자 몇 개라 메모리는 고정이다.
+#   평균 이동: |창 평균 - 기준 평균| / (기준 표준편차 / sqrt(창 개수)) > z
+#   분산 변화: 창 분산 / 기준 분산 > var_ratio
+class DriftMonitor:
+    def __init__(self, stations, window=200, z=4.0, var_ratio=3.0, min_baseline=400):
+        self.stations = list(stations)
+        self.index = {name: i for i, name in enumerate(self.stations)}
+        self.window = window
+        self.z = z
+        self.var_ratio = var_ratio
+        self.min_baseline = min_baseline
+        shape = (len(self.stations), len(BAND_LABELS))
+        self.base_n = np.zeros(shape)
+        self.base_mean = np.zeros(shape)
+        self.base_m2 = np.zeros(shape)
+        self.win_n = np.zeros(shape)
+        self.win_mean = np.zeros(shape)
+        self.win_m2 = np.zeros(shape)
+        self.flagged = np.zeros(shape, dtype=bool)
+        self.last_z = np.zeros(shape)
+        self._lock = threading.Lock()
+
+    def update(self, station, hour, error):
+        # 관측 하나 (실시간 피드용) — 스칼라 Welford 갱신
+        row = self.index.get(station)
+        if row is None:
+            return
+        band = bisect.bisect_right(_BAND_STARTS, hour) - 1
+        cell = row, band
+        with self._lock:
+            n = self.win_n[cell] + 1
+            mean = self.win_mean[cell]
+            delta = error - mean
+            mean += delta / n
+            self.win_m2[cell] += delta * (error - mean)
+            self.win_mean[cell] = mean
+            self.win_n[cell] = n
+            if n >= self.window:
+                self._close(np.array([row]), np.array([band]))
+
+    def update_many(self, rows, hours, errors):
+        # 관측 여러 개 (백테스트 / 배치 피드용) — 칸별로 묶어 평균과 편차제곱합을 구한 뒤 창에 병합 (Chan 의 병합식)
+        rows = np.asarray(rows, dtype=np.intp)
+        errors = np.asarray(errors, dtype=np.float64)
+        n_bands = len(BAND_LABELS)
+        cell = rows * n_bands + time_band(hours)
+        size = self.win_n.size
+        n = np.bincount(cell, minlength=size).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.bincount(cell, weights=errors, minlength=size) / n
+        mean = np.nan_to_num(mean)
+        m2 = np.bincount(cell, weights=(errors - mean[cell]) ** 2, minlength=size)
+        with self._lock:
+            _merge(self.win_n.reshape(-1), self.win_mean.reshape(-1), self.win_m2.reshape(-1), n, mean, m2)
+            full = np.flatnonzero(self.win_n.reshape(-1) >= self.window)
+            if full.size:
+                self._close(*np.divmod(full, n_bands))
+
+    def _close(self, rows, bands):
+        # 창이 찬 칸: 기준과 비교 → 플래그 → 창을 기준에 합치고 비운다
+        base_n, win_n = self.base_n[rows, bands], self.win_n[rows, bands]
+        base_var = self.base_m2[rows, bands] / np.maximum(base_n - 1, 1)
+        win_var = self.win_m2[rows, bands] / np.maximum(win_n - 1, 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = (self.win_mean[rows, bands] - self.base_mean[rows, bands]) / np.sqrt(base_var / win_n)
+            ratio = win_var / base_var
+        ready = base_n >= self.min_baseline
+        self.last_z[rows, bands] = np.where(ready, np.nan_to_num(z), 0.0)
+        self.flagged[rows, bands] = ready & ((np.abs(np.nan_to_num(z)) > self.z) | (np.nan_to_num(ratio) > self.var_ratio))
+
+        bn, bm, b2 = self.base_n[rows, bands], self.base_mean[rows, bands], self.base_m2[rows, bands]
+        _merge(bn, bm, b2, win_n, self.win_mean[rows, bands], self.win_m2[rows, bands])
+        self.base_n[rows, bands], self.base_mean[rows, bands], self.base_m2[rows, bands] = bn, bm, b2
+        self.win_n[rows, bands] = self.win_mean[rows, bands] = self.win_m2[rows, bands] = 0.0
+
+    def report(self):
+        # 플래그가 선 칸 [(역, 시간대, z, 기준 평균 오차, 기준 표준편차, 기준 개수)]
+        out = []
+        for row, band in zip(*np.nonzero(self.flagged)):
+            n = self.base_n[row, band]
+            std = math.sqrt(self.base_m2[row, band] / max(n - 1, 1))
+            out.append((self.stations[row], BAND_LABELS[band], round(float(self.last_z[row, band]), 1),
+                        round(float(self.base_mean[row, band]), 1), round(std, 1), int(n)))
+        return out
+
+    def drifting_stations(self):
+        return sorted({self.stations[row] for row in np.nonzero(self.flagged)[0]})
+
+
+def _merge(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    # (n_a, mean_a, m2_a) 에 (n_b, mean_b, m2_b) 를 제자리에서 합친다
+    n = n_a + n_b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = mean_b - mean_a
+        mean = np.where(n > 0, mean_a + delta * n_b / n, 0.0)
+        m2 = np.where(n > 0, m2_a + m2_b + delta * delta * n_a * n_b / n, 0.0)
+    n_a[...], mean_a[...], m2_a[...] = n, mean, m2
+
+
+# ------------------------
+# 이력으로 확인
+# ------------------------
+def backtest(store, model, start=None, end=None, value="boardings", **options):
+    # 이력 저장소의 실측과 모델 예측의 오차를 날짜 순으로 흘려 넣는다
+    from crowd_engine import predict_array
+    monitor = DriftMonitor(model.artifact.stations, **options)
+    rows = store.query([s for s in store.stations() if s in monitor.index], start, end, values=[value], daily_only=True)
+    if not len(rows["date"]):
+        return monitor
+    order = np.argsort(rows["date"], kind="stable")
+    date = rows["date"][order]
+    hour = rows["hour"][order].astype(np.float64)
+    station_rows = np.array([monitor.index[s] for s in rows["station"][order]])
+    days = date.astype("datetime64[D]")
+    weekday = (days.astype(np.int64) - 4) % 7         # 1970-01-01 은 목요일
+    month = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    pred = predict_array(station_rows, hour, weekday, month, model.coefficients)
+    error = rows[value][order] - pred
+    # 하루치씩 넣어야 창이 날짜 순으로 닫힌다
+    bounds = np.flatnonzero(np.diff(days.astype(np.int64))) + 1
+    for idx in np.split(np.arange(len(date)), bounds):
+        monitor.update_many(station_rows[idx], hour[idx], error[idx])
+    return monitor
+
+
+if __name__ == "__main__":
+    from congestion_model import DEFAULT_VARIANT, get_model
+    from history_store import DEFAULT_ROOT, HistoryStore
+
+    parser = argparse.ArgumentParser(description="이력과 모델 예측을 비교해 오차 분포가 바뀐 역 / 시간대 찾기")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    parser.add_argument("--variant", default=DEFAULT_VARIANT)
+    parser.add_argument("--start", type=datetime.date.fromisoformat)
+    parser.add_argument("--end", type=datetime.date.fromisoformat)
+    parser.add_argument("--window", type=int, default=200)
+    args = parser.parse_args()
+
+    monitor = backtest(HistoryStore(args.root), get_model(args.variant), args.start, args.end, window=args.window)
+    for station, band, z, mean, std, n in monitor.report():
+        print(f"{station}\t{band}\tz={z}\t기준 오차 {mean} ± {std} (n={n})")
+    print(f"{len(monitor.drifting_stations())} / {len(monitor.stations)} stations drifting")
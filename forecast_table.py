@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import mmap
+import os
+import threading
+
+import numpy as np
+
+from crowd_engine import (COEFFICIENTS, DEFAULT_CUTOFFS, STATIONS, STATION_INDEX, canonical_station,
+                          grade_array, max_value_array, peak_array, predict_array)
+
+# ------------------------
+# 파일 형식
+# ------------------------
+# [헤더 64바이트][인원 uint16 (역, 요일, 월, 슬롯)][등급 uint8 (역, 요일, 월, 슬롯)]
+# params 는 만들 때 쓴 값 (역 / 계수 / 기준값 / 등급표 / 슬롯 / scale) 의 해시 — 값이 바뀌면 load_or_build 가 다시 만든다
+MAGIC = b"CRWDTBL2"
+HEADER_SIZE = 64
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("n_stations", "<u2"),
+    ("n_weekdays", "<u2"),
+    ("n_months", "<u2"),
+    ("n_slots", "<u2"),
+    ("slot_minutes", "<u2"),
+    ("scale", "<f4"),       # 실제 인원 = 저장값 * scale
+    ("params", "S16"),
+])
+
+SLOT_MINUTES = 5
+DEFAULT_PATH = "forecast_table.bin"
+
+# streamlit_app7 의 CDI 최대값 (상위 5개 평균 기반)
+DEFAULT_MAX_VALUES = {"강남": 14353.4, "서울역": 10099.0, "사당": 5620.2, "홍대입구": 9476.4}
+
+
+# ------------------------
+# 빌드
+# ------------------------
+def build_table(max_values=DEFAULT_MAX_VALUES, cutoffs=DEFAULT_CUTOFFS, slot_minutes=SLOT_MINUTES,
+                coefficients=COEFFICIENTS, scale=1.0):
+    # 역 x 요일 x 월 x 슬롯 전체를 한 번의 broadcast 로 계산
+    n_slots = 24 * 60 // slot_minutes
+    rows = np.arange(len(coefficients))[:, None, None, None]
+    weekdays = np.arange(7)[None, :, None, None]
+    months = np.arange(1, 13)[None, None, :, None]
+    times = (np.arange(n_slots) * slot_minutes / 60)[None, None, None, :]
+
+    pred = predict_array(rows, times, weekdays, months, coefficients)
+    counts = np.clip(np.rint(pred / scale), 0, np.iinfo(np.uint16).max).astype("<u2")
+    # 등급은 양자화 전 값을 앱 화면과 같이 반올림 (인원 → 정수, CDI → 소수 둘째 자리) 해서 — StationModel.score_array 와 같다
+    # 기준값이 NaN 인 역은 그날 (요일 / 월) 의 하루 최대값
+    max_values = np.broadcast_to(max_value_array(max_values)[rows], pred.shape[:3] + (1,)).copy()
+    daily = np.isnan(max_values)
+    if daily.any():
+        peaks = peak_array(coefficients[:, None, None, :], weekdays[..., 0], months[..., 0])[1]
+        max_values[daily] = peaks[..., None][daily]
+    cdi = (np.rint(pred) / max_values).round(2)
+    grades = grade_array(cdi, cutoffs)
+    return counts, grades
+
+
+def params_digest(max_values=DEFAULT_MAX_VALUES, cutoffs=DEFAULT_CUTOFFS, slot_minutes=SLOT_MINUTES,
+                  coefficients=COEFFICIENTS, scale=1.0, stations=STATIONS):
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\0".join(stations).encode())
+    for values in (coefficients, max_value_array(max_values), cutoffs, (slot_minutes, scale)):
+        h.update(np.ascontiguousarray(values, dtype="<f8").tobytes())
+    return h.digest()
+
+
+def write_table(path, counts, grades, slot_minutes=SLOT_MINUTES, scale=1.0, params=b""):
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = MAGIC
+    header["n_stations"], header["n_weekdays"], header["n_months"], header["n_slots"] = counts.shape
+    header["slot_minutes"] = slot_minutes
+    header["scale"] = scale
+    header["params"] = params
+
+    # 임시 파일에 쓴 뒤 교체해서 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 한다
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"     # 같은 파일을 여러 스레드가 만들 수 있다
+    with open(tmp_path, "wb") as f:
+        f.write(header.tobytes().ljust(HEADER_SIZE, b"\0"))
+        f.write(np.ascontiguousarray(counts, dtype="<u2").tobytes())
+        f.write(np.ascontiguousarray(grades, dtype="u1").tobytes())
+    os.replace(tmp_path, path)
+
+
+# ------------------------
+# 조회
+# ------------------------
+class ForecastTable:
+    def __init__(self, path, index=STATION_INDEX):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER_SIZE or self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"예측 테이블 파일이 아닙니다: {path}")
+        header = np.frombuffer(self._mmap, dtype=HEADER_DTYPE, count=1)[0]
+        shape = (int(header["n_stations"]), int(header["n_weekdays"]),
+                 int(header["n_months"]), int(header["n_slots"]))
+        size = shape[0] * shape[1] * shape[2] * shape[3]
+        self.path = path
+        self.index = index          # 역 이름 → 행 번호 (만들 때의 역 순서)
+        self.slot_minutes = int(header["slot_minutes"])
+        self.scale = float(header["scale"])
+        self.params = bytes(header["params"])
+        # mmap 위의 읽기 전용 view — 파일 내용을 메모리로 복사하지 않는다
+        self.counts = np.frombuffer(self._mmap, dtype="<u2", count=size, offset=HEADER_SIZE).reshape(shape)
+        self.grades = np.frombuffer(self._mmap, dtype="u1", count=size,
+                                    offset=HEADER_SIZE + self.counts.nbytes).reshape(shape)
+
+    @property
+    def n_slots(self):
+        return self.counts.shape[3]
+
+    def slot(self, hour, minute):
+        return (hour * 60 + minute) // self.slot_minutes
+
+    def slot_time(self, slot):
+        return divmod(slot * self.slot_minutes, 60)
+
+    def day(self, station, weekday, month):
+        # 하루치 (슬롯,) 인원 / 등급 — mmap 의 view 라 복사하지 않는다
+        row = self.index[canonical_station(station)]
+        return self.counts[row, weekday, month - 1], self.grades[row, weekday, month - 1]
+
+    def lookup(self, station, weekday, month, slot):
+        row = self.index[canonical_station(station)]
+        return self.counts[row, weekday, month - 1, slot] * self.scale, self.grades[row, weekday, month - 1, slot]
+
+
+def load_or_build(path=DEFAULT_PATH, max_values=DEFAULT_MAX_VALUES, cutoffs=DEFAULT_CUTOFFS, slot_minutes=SLOT_MINUTES,
+                  coefficients=COEFFICIENTS, stations=STATIONS):
+    # 파일이 없거나, 다른 값으로 (또는 예전 형식으로) 만든 파일이면 다시 만든다
+    # stations: coefficients 의 행 순서 (모델 파일이면 artifact.stations)
+    index = {name: i for i, name in enumerate(stations)}
+    params = params_digest(max_values, cutoffs, slot_minutes, coefficients, stations=stations)
+    try:
+        table = ForecastTable(path, index)
+        if table.params == params:
+            return table
+    except (FileNotFoundError, ValueError):
+        pass
+    write_table(path, *build_table(max_values, cutoffs, slot_minutes, coefficients), slot_minutes=slot_minutes,
+                params=params)
+    return ForecastTable(path, index)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="역 x 요일 x 월 x 시간대 예측 테이블 생성")
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--slot-minutes", type=int, default=SLOT_MINUTES)
+    args = parser.parse_args()
+
+    counts, grades = build_table(slot_minutes=args.slot_minutes)
+    write_table(args.path, counts, grades, slot_minutes=args.slot_minutes,
+                params=params_digest(slot_minutes=args.slot_minutes))
+    print(f"{args.path}: {len(STATIONS)} x 7 x 12 x {counts.shape[3]} = {counts.size:,} cells, "
+          f"{os.path.getsize(args.path):,} bytes")
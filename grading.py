@@ -0,0 +1,93 @@
+from collections import namedtuple
+
+# ------------------------
+# 등급표
+# ------------------------
+# 등급 코드 0 = 여유 ~ 4 = 매우혼잡. cutoffs 는 보통 / 약간혼잡 / 혼잡 / 매우혼잡 의 하한값 (이상이면 그 등급).
+# 앱마다 if/elif 로 따로 적던 기준을 이름 붙은 표로 모았다.
+GradeTable = namedtuple("GradeTable", ["cutoffs", "labels", "colors", "icons"])
+
+LABELS = ["여유", "보통", "약간혼잡", "혼잡", "매우혼잡"]
+SPACED_LABELS = ["여유", "보통", "약간 혼잡", "혼잡", "매우 혼잡"]
+COLORS = ["blue", "green", "yellow", "orange", "red"]
+ICONS = ["🔵", "🟢", "🟡", "🟠", "🔴"]
+
+GRADE_TABLES = {
+    # streamlit_app2, 5, 7, 8, 9, 10
+    "standard": GradeTable((0.3, 0.5, 0.7, 0.9), LABELS, COLORS, ICONS),
+    # streamlit_app3, 4, 6
+    "even": GradeTable((0.2, 0.4, 0.6, 0.8), LABELS, COLORS, ICONS),
+    # streamlit_app11 ~ 14
+    "narrow": GradeTable((0.3, 0.45, 0.6, 0.75), LABELS, COLORS, ICONS),
+    # streamlit_app (하루 최대값 대비라 기준이 높다)
+    "peak": GradeTable((0.5, 0.7, 0.85, 0.95), LABELS, COLORS, ICONS),
+}
+
+
+def get_table(table):
+    # 이름, 또는 cutoffs / labels 속성이 있는 객체 (GradeTable, congestion_model.StationModel 등)
+    return GRADE_TABLES[table] if isinstance(table, str) else table
+
+
+# ------------------------
+# 등급 계산
+# ------------------------
+# 넘은 (>=) 하한값의 개수가 ">= 하한값" 사다리 전체와 같다 (crowd_engine.grade_array) — CDI 배열 모양 그대로 (역 x 요일 x 시각 등) 코드가 나온다
+def grade_codes(cdi, table="standard"):
+    from crowd_engine import grade_array
+    return grade_array(cdi, get_table(table).cutoffs)
+
+
+def grade_labels(codes, table="standard", labels=None):
+    import numpy as np
+    return np.asarray(labels or get_table(table).labels, dtype=object)[codes]
+
+
+def grade_code(cdi, table="standard"):
+    # 값 하나 — 하한값 4개라 bisect 로 충분하다
+    import bisect
+    return bisect.bisect_right(get_table(table).cutoffs, cdi)
+
+
+def grade_label(cdi, table="standard", labels=None):
+    return (labels or get_table(table).labels)[grade_code(cdi, table)]
+
+
+def grade_color(cdi, table="standard"):
+    return get_table(table).colors[grade_code(cdi, table)]
+
+
+def grade_icon(cdi, table="standard"):
+    return get_table(table).icons[grade_code(cdi, table)]
+
+
+if __name__ == "__main__":
+    import time as _time
+
+    import numpy as np
+
+    # 역 600 x 요일 7 x 하루 1440분
+    rng = np.random.default_rng(0)
+    cube = rng.uniform(0, 1.2, (600, 7, 1440))
+    start = _time.perf_counter()
+    codes = grade_codes(cube, "narrow")
+    vectorized = _time.perf_counter() - start
+
+    def ladder(cdi):
+        if cdi >= 0.75:
+            return 4
+        elif cdi >= 0.6:
+            return 3
+        elif cdi >= 0.45:
+            return 2
+        elif cdi >= 0.3:
+            return 1
+        else:
+            return 0
+
+    sample = cube.ravel()[:1_000_000].tolist()
+    start = _time.perf_counter()
+    expected = [ladder(c) for c in sample]
+    scalar = (_time.perf_counter() - start) * cube.size / len(sample)
+    assert codes.ravel()[:len(sample)].tolist() == expected
+    print(f"{cube.size} values: grade_codes {vectorized * 1e3:.0f} ms, if/elif (추정) {scalar * 1e3:.0f} ms")
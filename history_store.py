@@ -0,0 +1,137 @@
+import datetime
+import os
+
+import numpy as np
+
+from crowd_engine import canonical_station
+
+# ------------------------
+# 승하차 이력 저장소 (ingest.py 가 만든 station=/month= 파티션 Parquet)
+# ------------------------
+# 역 / 월 조건은 디렉터리 단위로 걸러서 해당 파티션 파일만 열고 (partition pruning),
+# 날짜 / 시각 조건은 파일 안 row group 통계로 걸러서 필요한 부분만 읽는다 (predicate pushdown).
+# 파일은 mmap 으로 열어 읽기 버퍼 복사가 없다.
+DEFAULT_ROOT = os.environ.get("CROWD_HISTORY_PATH",
+                              os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "history"))
+VALUES = ["boardings", "alightings"]
+
+
+class HistoryStore:
+    def __init__(self, root=DEFAULT_ROOT):
+        import pyarrow.dataset as ds
+        import pyarrow.fs as fs
+
+        self.root = root
+        self.dataset = ds.dataset(root, format="parquet", partitioning="hive",
+                                  filesystem=fs.LocalFileSystem(use_mmap=True))
+
+    def stations(self):
+        import pyarrow.dataset as ds
+        names = set()
+        for fragment in self.dataset.get_fragments():
+            names.add(ds.get_partition_keys(fragment.partition_expression)["station"])
+        return sorted(names)
+
+    def _filter(self, stations=None, start=None, end=None, hours=None):
+        import pyarrow.dataset as ds
+
+        expr = None
+
+        def both(e):
+            return e if expr is None else expr & e
+
+        if stations is not None:
+            if isinstance(stations, str):
+                stations = [stations]
+            expr = both(ds.field("station").isin([canonical_station(s) for s in stations]))
+        # 날짜 범위는 월 파티션 조건도 같이 걸어야 디렉터리 단위로 걸러진다
+        if start is not None:
+            start = _as_date(start)
+            expr = both((ds.field("month") >= start.year * 100 + start.month) & (ds.field("date") >= start))
+        if end is not None:
+            end = _as_date(end)
+            expr = both((ds.field("month") <= end.year * 100 + end.month) & (ds.field("date") <= end))
+        if hours is not None:
+            lo, hi = hours
+            expr = both((ds.field("hour") >= lo) & (ds.field("hour") < hi))
+        return expr
+
+    def query(self, stations=None, start=None, end=None, hours=None, values=VALUES, by_line=False, daily_only=False):
+        # (역, 날짜 [start, end], 시각 [lo, hi)) 조건의 이력을 열별 numpy 배열 사전으로
+        # by_line=False 면 한 역의 여러 호선 행을 합친다
+        # daily_only=True 면 월 단위 원본에서 온 행 (하루 평균, 그 달 1일 — ingest.py 의 days 열) 은 뺀다
+        import pyarrow.dataset as ds
+
+        keys = ["station", "date", "hour"] + (["line"] if by_line else [])
+        expr = self._filter(stations, start, end, hours)
+        if daily_only and "days" in self.dataset.schema.names:
+            expr = ds.field("days") == 1 if expr is None else expr & (ds.field("days") == 1)
+        table = self.dataset.to_table(columns=keys + list(values), filter=expr)
+        if by_line:
+            table = table.set_column(table.schema.get_field_index("line"), "line", table["line"].cast("string"))
+        elif table.num_rows:
+            import pyarrow as pa
+            schema = table.schema
+            # 결과 열 순서 (키가 앞인지 뒤인지) 는 pyarrow 버전마다 달라서 이름으로 고른다: 키 그대로, 값은 "<열>_sum"
+            summed = table.group_by(keys).aggregate([(v, "sum") for v in values])
+            table = pa.table([summed[k] for k in keys] + [summed[f"{v}_sum"] for v in values],
+                             names=keys + list(values)).cast(schema)
+        order = table.sort_by([(k, "ascending") for k in keys]) if table.num_rows else table
+        out = {k: order[k].to_numpy(zero_copy_only=False) for k in keys}
+        for v in values:
+            out[v] = order[v].to_numpy(zero_copy_only=False)
+        return out
+
+    def footprint(self, stations=None, start=None, end=None, hours=None):
+        # 이 조건으로 열게 되는 파일 수와 크기 (바이트)
+        fragments = list(self.dataset.get_fragments(filter=self._filter(stations, start, end, hours)))
+        return len(fragments), sum(os.path.getsize(f.path) for f in fragments)
+
+    # ------------------------
+    # 분석용 요약
+    # ------------------------
+    def hourly_mean(self, station, start=None, end=None, value="boardings"):
+        # 시각별 평균 인원 (길이 24, 자료 없는 시각은 NaN) — 추이 차트용
+        rows = self.query(station, start, end, values=[value])
+        sums = np.bincount(rows["hour"].astype(np.intp), weights=rows[value], minlength=24)
+        counts = np.bincount(rows["hour"].astype(np.intp), minlength=24)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+
+    def reference_max(self, stations, start=None, end=None, q=0.99, value="boardings"):
+        # CDI 기준값: 기간 중 시간대 인원의 q 분위수 {역: 값}
+        rows = self.query(stations, start, end, values=[value])
+        out = {}
+        for name in np.unique(rows["station"]):
+            out[str(name)] = float(np.quantile(rows[value][rows["station"] == name], q))
+        return out
+
+
+def _as_date(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+if __name__ == "__main__":
+    import argparse
+    import time as _time
+
+    parser = argparse.ArgumentParser(description="이력 저장소 조회")
+    parser.add_argument("station")
+    parser.add_argument("start")
+    parser.add_argument("end")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    args = parser.parse_args()
+
+    store = HistoryStore(args.root)
+    files, size = store.footprint(args.station, args.start, args.end)
+    t0 = _time.perf_counter()
+    rows = store.query(args.station, args.start, args.end)
+    elapsed = _time.perf_counter() - t0
+    print(f"{len(rows['date'])} rows from {files} files ({size / 1024:.1f} KiB), {elapsed * 1e3:.1f} ms")
+    for hour, mean in enumerate(store.hourly_mean(args.station, args.start, args.end)):
+        if mean == mean:
+            print(f"{hour:02d}시 {mean:8.0f}")
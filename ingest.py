@@ -0,0 +1,146 @@
+import argparse
+import os
+import re
+import time as _time
+
+import numpy as np
+import pandas as pd
+
+from crowd_engine import canonical_station
+
+# ------------------------
+# 원본 형식 (서울 열린데이터광장, 역별 시간대별 승하차 인원)
+# ------------------------
+# EUC-KR(CP949) CSV, 한 행 = 한 역(호선별)의 하루 또는 한 달:
+#   사용일자(YYYYMMDD) 또는 사용월(YYYYMM) / 호선명 / 지하철역 / "05시-06시 승차인원" / "05시-06시 하차인원" / ...
+# 월 단위 파일이면 날짜는 그 달 1일이고 인원은 그 달 합계다 — 저장할 때 그 달 일수로 나눈 하루 평균으로 바꾸고
+# days 열에 나눈 일수를 남긴다 (일 단위 행은 1). 날짜가 1일로 고정이라 요일을 알 수 없으므로 학습 (train.py) 에는 쓰지 않는다.
+ENCODING = "cp949"
+CHUNKSIZE = 50_000
+HOUR_COLUMN = re.compile(r"^\s*(\d{1,2})시\s*-\s*(\d{1,2})시\s*(승차|하차)")
+DATE_COLUMNS = {"사용일자": "%Y%m%d", "사용월": "%Y%m"}
+LINE_COLUMNS = ["호선명", "노선명"]
+STATION_COLUMNS = ["지하철역", "역명"]
+
+# 출력: station=<역>/month=<YYYYMM>/part-*.parquet (hive 형식 파티션)
+PARTITIONS = ["station", "month"]
+
+
+def _pick(columns, candidates, what):
+    for name in candidates:
+        if name in columns:
+            return name
+    raise ValueError(f"{what} 열이 없습니다: {', '.join(candidates)}")
+
+
+def hour_columns(columns):
+    # {시각: (승차 열, 하차 열)}
+    hours = {}
+    for col in columns:
+        m = HOUR_COLUMN.match(col)
+        if m:
+            board = m.group(3) == "승차"
+            pair = hours.setdefault(int(m.group(1)), [None, None])
+            pair[0 if board else 1] = col
+    missing = [h for h, pair in hours.items() if None in pair]
+    if missing:
+        raise ValueError(f"승차/하차 열이 짝이 맞지 않는 시간대: {missing}")
+    if not hours:
+        raise ValueError("시간대별 승하차 열이 없습니다")
+    return dict(sorted(hours.items()))
+
+
+# ------------------------
+# wide → long
+# ------------------------
+def melt_chunk(df, hours, date_col, line_col, station_col):
+    # (역, 날짜) 한 행의 시간대 열들을 (역, 날짜, 시각) 여러 행으로 — 열 단위 numpy 배열로 한 번에 펼친다
+    n, h = len(df), len(hours)
+    board = _counts(df, [pair[0] for pair in hours.values()])
+    alight = _counts(df, [pair[1] for pair in hours.values()])
+
+    names = df[station_col].astype(str)
+    codes, uniques = pd.factorize(names)
+    stations = pd.Index(uniques).map(canonical_station).to_numpy()[codes]
+    date = pd.to_datetime(df[date_col].astype(str).str.strip(), format=DATE_COLUMNS[date_col])
+    if date_col == "사용월":
+        days = date.dt.days_in_month.to_numpy(np.int8)
+        board = np.rint(board / days[:, None]).astype(np.uint32)
+        alight = np.rint(alight / days[:, None]).astype(np.uint32)
+    else:
+        days = np.ones(n, dtype=np.int8)
+
+    out = pd.DataFrame({
+        "station": np.repeat(stations, h),
+        "line": np.repeat(df[line_col].astype(str).str.strip().to_numpy(), h),
+        "date": np.repeat(date.to_numpy(), h),
+        "hour": np.tile(np.array(list(hours), dtype=np.int8), n),
+        "boardings": board.ravel(),
+        "alightings": alight.ravel(),
+        "days": days.repeat(h),
+        "month": (date.dt.year * 100 + date.dt.month).to_numpy(np.int32).repeat(h),
+    })
+    out["line"] = out["line"].astype("category")
+    return out
+
+
+def _counts(df, cols):
+    # 인원 열에 천 단위 쉼표가 들어 있는 파일이 있다. 빈 칸은 0명
+    values = df[cols].apply(lambda s: pd.to_numeric(s.str.replace(",", "", regex=False), errors="coerce"))
+    return np.nan_to_num(values.to_numpy(np.float64)).astype(np.uint32)
+
+
+def read_source(path, chunksize=CHUNKSIZE, encoding=ENCODING):
+    reader = pd.read_csv(path, encoding=encoding, chunksize=chunksize, dtype=str)
+    hours = date_col = line_col = station_col = None
+    for chunk in reader:
+        if hours is None:
+            chunk.columns = [c.strip() for c in chunk.columns]
+            hours = hour_columns(chunk.columns)
+            date_col = _pick(chunk.columns, list(DATE_COLUMNS), "날짜")
+            line_col = _pick(chunk.columns, LINE_COLUMNS, "호선")
+            station_col = _pick(chunk.columns, STATION_COLUMNS, "역")
+            columns = list(chunk.columns)
+        else:
+            chunk.columns = columns
+        yield melt_chunk(chunk, hours, date_col, line_col, station_col)
+
+
+# ------------------------
+# 저장
+# ------------------------
+def write_partitions(df, root, tag):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # 날짜는 시각 없는 date32 로 (4바이트)
+    table = table.set_column(table.schema.get_field_index("date"), "date",
+                             table["date"].cast(pa.date32(), safe=False))
+    pq.write_to_dataset(table, root, partition_cols=PARTITIONS,
+                        basename_template=f"part-{tag}-{{i}}.parquet",
+                        existing_data_behavior="overwrite_or_ignore")
+
+
+def ingest(paths, root, chunksize=CHUNKSIZE, encoding=ENCODING):
+    # 청크 하나씩 읽고 바로 파티션 파일로 — 메모리는 청크 크기만큼만 쓴다
+    rows = 0
+    for n, path in enumerate(paths):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for i, df in enumerate(read_source(path, chunksize, encoding)):
+            write_partitions(df, root, f"{n:03d}-{stem}-{i:05d}")
+            rows += len(df)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="역별 시간대별 승하차 CSV → 파티션 Parquet")
+    parser.add_argument("root", help="출력 디렉터리 (예: data/history)")
+    parser.add_argument("inputs", nargs="+", help="원본 CSV 파일")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    parser.add_argument("--encoding", default=ENCODING)
+    args = parser.parse_args()
+
+    start = _time.perf_counter()
+    rows = ingest(args.inputs, args.root, args.chunksize, args.encoding)
+    print(f"{args.root}: {rows} rows, {_time.perf_counter() - start:.1f}s")
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+
+from crowd_engine import (COEFFICIENTS, DEFAULT_CUTOFFS, SERVICE_END, SERVICE_START, STATION_INDEX,
+                          canonical_station)
+
+
+# ------------------------
+# "X 미만" 시간 구간
+# ------------------------
+# 5시 이후 예측은 시간에 대한 2차식이라 기준선과 만나는 점은 근의 공식으로 바로 구한다.
+# 근 사이 구간마다 중간점 하나의 부호만 보면 되므로 시간을 촘촘히 훑을 필요가 없다.
+def below_intervals(coefficient_row, weekday, month, limit, start=SERVICE_START, end=SERVICE_END):
+    # 예측은 0 아래로 잘리므로 (clip) 기준이 0 이하면 기준 미만인 시간이 없다 — 2차식이 음수인 구간을 돌려주면 안 된다
+    if limit <= 0:
+        return []
+    a, b, c, d, e = coefficient_row
+    const = a + d * weekday + e * month - limit     # g(t) = c t^2 + b t + const < 0 인 구간
+
+    if c != 0:
+        disc = b * b - 4 * c * const
+        roots = [] if disc < 0 else [(-b - s * math.sqrt(disc)) / (2 * c) for s in (1, -1)]
+    elif b != 0:
+        roots = [-const / b]
+    else:
+        roots = []
+
+    cuts = [start] + sorted(r for r in roots if start < r < end) + [end]
+    result = []
+    for lo, hi in zip(cuts, cuts[1:]):
+        mid = (lo + hi) / 2
+        if c * mid * mid + b * mid + const < 0:
+            if result and result[-1][1] == lo:
+                result[-1] = (result[-1][0], hi)
+            else:
+                result.append((lo, hi))
+
+    # 5시 이전은 5시 값으로 보정되므로 5시가 기준 미만이면 자정부터 이어진다
+    if result and result[0][0] == start and start > 0:
+        result[0] = (0.0, result[0][1])
+    return result
+
+
+def comfort_intervals(station, date, level, max_value, cutoffs=DEFAULT_CUTOFFS, coefficients=COEFFICIENTS):
+    # level 등급 코드 미만 (예: 약간혼잡=2 → 여유/보통) 인 시간 구간 [(시작, 끝), ...] (시간 단위 실수)
+    if level <= 0:
+        return []
+    if level > len(cutoffs):
+        return [(0.0, SERVICE_END)]
+    row = coefficients[STATION_INDEX[canonical_station(station)]]
+    return below_intervals(tuple(np.asarray(row).tolist()), date.weekday(), date.month,
+                           cutoffs[level - 1] * max_value)
+
+
+def format_interval(interval):
+    # 구간 안쪽으로 분 단위 반올림: 시작은 올림, 끝은 내림
+    lo, hi = interval
+    lo_min = min(math.ceil(lo * 60 - 1e-9), 24 * 60 - 1)
+    hi_min = min(math.floor(hi * 60 + 1e-9), 24 * 60 - 1)
+    return f"{lo_min // 60:02d}:{lo_min % 60:02d} ~ {hi_min // 60:02d}:{hi_min % 60:02d}"
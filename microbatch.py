@@ -0,0 +1,102 @@
+import asyncio
+import bisect
+import threading
+
+# ------------------------
+# 히스토그램 (고정 구간)
+# ------------------------
+# bounds 는 각 구간의 상한 (이하), 마지막 칸은 상한을 넘는 값. Prometheus 의 le 버킷과 같은 모양으로 내보낸다.
+BATCH_SIZE_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+DELAY_MS_BOUNDS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100)
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    def snapshot(self):
+        # 누적 개수 버킷 + 분위수 (구간 상한으로 근사 — 조정용으로는 충분하다)
+        with self._lock:
+            counts, count, total = list(self.counts), self.count, self.sum
+        bounds = self.bounds + (float("inf"),)
+        cumulative, buckets = 0, {}
+        for bound, n in zip(bounds, counts):
+            cumulative += n
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        out = {"count": count, "sum": total, "mean": total / count if count else 0.0, "buckets": buckets}
+        for q in (0.5, 0.9, 0.99):
+            seen = 0
+            for bound, n in zip(bounds, counts):
+                seen += n
+                if seen and seen >= q * count:
+                    break
+            # 마지막 상한을 넘는 칸이면 None
+            out[f"p{round(q * 100)}"] = (None if bound == float("inf") else bound) if count else 0.0
+        return out
+
+
+# ------------------------
+# 마이크로 배치
+# ------------------------
+# 동시에 들어온 요청을 최대 max_delay 초 또는 max_size 개까지 모아 fn(items) 한 번으로 계산하고 결과를 각 요청에 돌려준다.
+# fn 은 items 와 같은 길이의 결과 리스트를 돌려주는 동기 함수 — 벡터 계산 한 번이라 이벤트 루프 안에서 바로 부른다.
+# 첫 요청이 기다리기 시작한 시점부터 시계를 재므로 한 요청이 기다리는 시간은 max_delay 를 넘지 않는다.
+class MicroBatcher:
+    def __init__(self, fn, max_size=256, max_delay=0.002):
+        self.fn = fn
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.batch_sizes = Histogram(BATCH_SIZE_BOUNDS)
+        self.queue_delay_ms = Histogram(DELAY_MS_BOUNDS)
+        self._pending = []          # [(item, future, 들어온 시각)]
+        self._timer = None
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future, loop.time()))
+        if len(self._pending) >= self.max_size or self.max_delay <= 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        now = asyncio.get_running_loop().time()
+        for _, _, queued in batch:
+            self.queue_delay_ms.observe((now - queued) * 1e3)
+        self.batch_sizes.observe(len(batch))
+        try:
+            results = self.fn([item for item, _, _ in batch])
+            # 개수가 다르면 zip 에서 빠진 요청이 영영 기다리므로 배치 전체를 실패로
+            if len(results) != len(batch):
+                raise ValueError(f"배치 결과 개수가 요청 수와 다릅니다: {len(results)} / {len(batch)}")
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():       # 기다리던 쪽이 취소된 경우
+                future.set_result(result)
+
+    def stats(self):
+        return {"max_size": self.max_size, "max_delay_ms": self.max_delay * 1e3,
+                "batch_size": self.batch_sizes.snapshot(), "queue_delay_ms": self.queue_delay_ms.snapshot()}
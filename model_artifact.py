@@ -0,0 +1,229 @@
+import argparse
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+
+import numpy as np
+
+from crowd_engine import canonical_station
+
+# ------------------------
+# 파일 형식 (버전 1)
+# ------------------------
+# [고정 헤더 32바이트][메타데이터 JSON (UTF-8)][배열 영역 (64바이트 정렬, little-endian float64)]
+#
+# 고정 헤더: magic(8) / 형식 버전 u32 / JSON 길이 u32 / 배열 영역 시작 u64 / 배열 영역 길이 u64
+# 배열 영역:
+#   coefficients  (계수 세트, 역, 5)  [절편, 시간, 시간^2, 요일, 월]
+#   max_values    (변형, 역)          CDI 기준값, NaN 이면 그날의 하루 최대값
+#   cutoffs       (변형, 4)           등급 하한값 (보통, 약간혼잡, 혼잡, 매우혼잡)
+MAGIC = b"CRWDMDL\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+ALIGN = 64
+FEATURES = ["const", "time", "time2", "weekday", "month"]
+
+
+class ModelArtifact:
+    def __init__(self, meta, arrays, source=None):
+        self.meta = meta
+        self.source = source
+        self.model_version = meta["model_version"]
+        self.stations = meta["stations"]
+        self.station_index = {name: i for i, name in enumerate(self.stations)}
+        self.coefficient_sets = {name: arrays["coefficients"][i] for i, name in enumerate(meta["coefficient_sets"])}
+        self.variants = {}
+        for i, (name, spec) in enumerate(meta["variants"].items()):
+            self.variants[name] = {
+                "stations": spec["stations"],
+                "coefficients": spec["coefficients"],
+                "labels": spec["labels"],
+                "max_values": arrays["max_values"][i],
+                "cutoffs": tuple(arrays["cutoffs"][i].tolist()),
+            }
+
+    def row(self, station):
+        return self.station_index[canonical_station(station)]
+
+
+# ------------------------
+# 쓰기
+# ------------------------
+def pack_tables(stations, coefficient_sets, variants):
+    # coefficient_sets: {이름: (역, 5)}, variants: {이름: {"stations", "coefficients", "labels", "max_values", "cutoffs"}}
+    # variants 의 max_values 는 {역: 값} 사전이거나 "daily_peak"
+    index = {name: i for i, name in enumerate(stations)}
+    coefficients = np.stack([np.asarray(c, dtype="<f8").reshape(len(stations), 5)
+                             for c in coefficient_sets.values()])
+    max_values = np.full((len(variants), len(stations)), np.nan, dtype="<f8")
+    cutoffs = np.zeros((len(variants), 4), dtype="<f8")
+    variant_meta = {}
+    for i, (name, spec) in enumerate(variants.items()):
+        if spec["max_values"] != "daily_peak":
+            for station, value in spec["max_values"].items():
+                max_values[i, index[canonical_station(station)]] = value
+        cutoffs[i] = spec["cutoffs"]
+        variant_meta[name] = {
+            "stations": list(spec["stations"]),
+            "coefficients": spec["coefficients"],
+            "labels": list(spec["labels"]),
+        }
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "features": FEATURES,
+        "stations": list(stations),
+        "coefficient_sets": list(coefficient_sets),
+        "variants": variant_meta,
+    }
+    return meta, {"coefficients": coefficients, "max_values": max_values, "cutoffs": cutoffs}
+
+
+def write_artifact(path, stations, coefficient_sets, variants, model_version=None, extra_meta=None):
+    meta, arrays = pack_tables(stations, coefficient_sets, variants)
+    layout, offset = {}, 0
+    for name, arr in arrays.items():
+        layout[name] = {"offset": offset, "shape": list(arr.shape), "dtype": "<f8"}
+        offset += _aligned(arr.nbytes)
+
+    now = datetime.datetime.now()
+    meta["model_version"] = model_version or now.strftime("%Y%m%d%H%M%S")
+    meta["created"] = now.isoformat(timespec="seconds")
+    meta["arrays"] = layout
+    if extra_meta:
+        meta.update(extra_meta)
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    data_offset = _aligned(HEADER.size + len(meta_bytes))
+
+    # 임시 파일에 다 쓴 뒤 교체 — 읽는 쪽은 항상 완성된 파일만 본다
+    # 임시 파일 이름에 pid 를 넣어 여러 프로세스 (train / online_rls) 가 같은 경로에 써도 서로의 임시 파일을 덮지 않는다
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(meta_bytes), data_offset, offset))
+        f.write(meta_bytes)
+        f.write(b"\0" * (data_offset - HEADER.size - len(meta_bytes)))
+        for arr in arrays.values():
+            f.write(arr.tobytes())
+            f.write(b"\0" * (_aligned(arr.nbytes) - arr.nbytes))
+    os.replace(tmp_path, path)
+    return meta["model_version"]
+
+
+def _aligned(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+# ------------------------
+# 읽기
+# ------------------------
+# 읽은 모델은 파일을 mmap 한 그대로 쓰므로, 쓰고 있는 파일을 제자리에서 덮어쓰면 (cp, 에디터 저장 등)
+# 실행 중인 프로세스가 바뀌는 중의 값을 읽거나 파일이 줄어든 경우 SIGBUS 로 죽는다.
+# 배포는 항상 같은 디렉터리의 임시 파일에 쓴 뒤 이름 바꾸기 (write_artifact / install_artifact / mv) 로 한다 —
+# 그러면 기존 mmap 은 옛 파일 (inode) 을 계속 보고, 감시 스레드가 새 파일로 갈아탄다.
+def load_artifact(path):
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buf) < HEADER.size:
+        raise ValueError(f"모델 파일이 아닙니다: {path}")
+    magic, version, meta_len, data_offset, data_len = HEADER.unpack_from(buf)
+    if magic != MAGIC:
+        raise ValueError(f"모델 파일이 아닙니다: {path}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 모델 파일 버전: {version} ({path})")
+    if data_offset + data_len > len(buf):
+        raise ValueError(f"모델 파일이 잘렸습니다: {path}")
+
+    meta = json.loads(bytes(buf[HEADER.size:HEADER.size + meta_len]).decode("utf-8"))
+    arrays = {}
+    for name, spec in meta["arrays"].items():
+        # mmap 위의 읽기 전용 view — 역이 수백 개여도 복사 없이 바로 쓴다
+        count = int(np.prod(spec["shape"]))
+        arrays[name] = np.frombuffer(buf, dtype=spec["dtype"], count=count,
+                                     offset=data_offset + spec["offset"]).reshape(spec["shape"])
+    return ModelArtifact(meta, arrays, source=path)
+
+
+def install_artifact(src, dest):
+    # 다른 곳에서 만든 모델 파일을 dest 로 배포: 먼저 읽어서 확인하고, dest 옆에 복사한 뒤 이름 바꾸기로 교체
+    version = load_artifact(src).model_version
+    tmp_path = f"{dest}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    with open(src, "rb") as fsrc, open(tmp_path, "wb") as fdst:
+        shutil.copyfileobj(fsrc, fdst, 1 << 20)
+        fdst.flush()
+        os.fsync(fdst.fileno())
+    os.replace(tmp_path, dest)
+    return version
+
+
+def artifact_tables(artifact):
+    # 읽은 모델을 write_artifact 에 다시 넣을 수 있는 형태로 — 계수만 바꿔서 다시 쓸 때
+    coefficient_sets = {name: np.array(c) for name, c in artifact.coefficient_sets.items()}
+    variants = {}
+    for name, spec in artifact.variants.items():
+        max_values = {s: float(v) for s, v in zip(artifact.stations, spec["max_values"]) if v == v}
+        variants[name] = {
+            "stations": spec["stations"],
+            "coefficients": spec["coefficients"],
+            "labels": spec["labels"],
+            "max_values": max_values,
+            "cutoffs": spec["cutoffs"],
+        }
+    return list(artifact.stations), coefficient_sets, variants
+
+
+def builtin_tables():
+    # 파일이 없을 때 쓰는 기본 모델: congestion_model 에 적힌 변형과 crowd_engine 계수
+    import crowd_engine
+    from congestion_model import COEFFICIENT_SETS, VARIANTS
+
+    coefficient_sets = {"standard": crowd_engine.COEFFICIENTS.tolist(), **COEFFICIENT_SETS}
+    return list(crowd_engine.STATIONS), coefficient_sets, VARIANTS
+
+
+def builtin_artifact():
+    meta, arrays = pack_tables(*builtin_tables())
+    # 버전은 내용의 해시 — 코드에 든 기본 모델이 바뀌면 버전 (API 의 ETag, 앱의 캐시 키) 도 바뀐다
+    meta["model_version"] = f"builtin-{_tables_digest(meta, arrays)}"
+    return ModelArtifact(meta, arrays)
+
+
+def _tables_digest(meta, arrays):
+    h = hashlib.blake2b(digest_size=8)
+    h.update(json.dumps(meta, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for name, arr in arrays.items():
+        h.update(name.encode())
+        h.update(np.ascontiguousarray(arr, dtype="<f8").tobytes())
+    return h.hexdigest()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="혼잡도 모델 파일 만들기 / 확인")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="코드에 들어 있는 기본 모델을 파일로 내보낸다")
+    export.add_argument("path")
+    export.add_argument("--version")
+    info = sub.add_parser("info", help="모델 파일 내용 요약")
+    info.add_argument("path")
+    install = sub.add_parser("install", help="모델 파일을 확인한 뒤 실행 중인 앱이 읽는 경로에 이름 바꾸기로 배포")
+    install.add_argument("src")
+    install.add_argument("dest")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        stations, coefficient_sets, variants = builtin_tables()
+        version = write_artifact(args.path, stations, coefficient_sets, variants, model_version=args.version)
+        print(f"{args.path}: version {version}, {len(stations)} stations, {len(variants)} variants")
+    elif args.command == "install":
+        print(f"{args.dest}: version {install_artifact(args.src, args.dest)}")
+    else:
+        artifact = load_artifact(args.path)
+        print(f"version {artifact.model_version} (format {artifact.meta['format_version']}, "
+              f"created {artifact.meta.get('created')})")
+        print(f"stations: {len(artifact.stations)}, coefficient sets: {', '.join(artifact.coefficient_sets)}")
+        print(f"variants: {', '.join(artifact.variants)}")
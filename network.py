@@ -0,0 +1,98 @@
+import time as _time
+
+import numpy as np
+
+from crowd_engine import DEFAULT_CUTOFFS, GRADE_LABELS, SERVICE_START, grade_array, peak_array
+from recommender import select_top_k
+
+
+# ------------------------
+# 전체 역 모델
+# ------------------------
+# 계수는 (역, 5) 행렬 하나, 특징은 [1, t, t^2, 요일, 월] 벡터 하나 — 한 시각의 전체 역 예측이 행렬곱 한 번이다.
+class Network:
+    def __init__(self, stations, coefficients, max_values=None, cutoffs=DEFAULT_CUTOFFS, labels=GRADE_LABELS,
+                 model_version=None):
+        self.stations = list(stations)
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        if max_values is None:
+            max_values = np.full(len(self.stations), np.nan)
+        self.max_values = np.asarray(max_values, dtype=np.float64)    # NaN 이면 그날의 하루 최대값
+        self.cutoffs = tuple(cutoffs)
+        self.labels = list(labels)
+        self.model_version = model_version
+        # ((요일, 월), 기준값 배열) — 세션 스레드가 같이 쓰므로 키와 값을 한 번의 대입으로 바꾼다
+        self._peak_cache = (None, None)
+
+    @classmethod
+    def from_model(cls, model):
+        # congestion_model.StationModel 의 계수 세트 / 기준값 / 등급표를 그대로 쓴다
+        artifact = model.artifact
+        return cls(artifact.stations, model.coefficients, model.max_values, model.cutoffs, model.labels,
+                   model.model_version)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def features(self, time, weekday, month):
+        t = max(float(time), SERVICE_START)
+        return np.array([1.0, t, t * t, weekday, month])
+
+    def predict_all(self, time, weekday, month):
+        pred = self.coefficients @ self.features(time, weekday, month)
+        np.maximum(pred, 0.0, out=pred)
+        return pred
+
+    def max_values_for(self, weekday, month):
+        # 기준값이 없는 역은 그날의 하루 최대값 — 요일/월이 같으면 다시 계산하지 않는다
+        key, out = self._peak_cache
+        if key != (weekday, month):
+            missing = np.isnan(self.max_values)
+            out = self.max_values.copy()
+            if missing.any():
+                out[missing] = peak_array(self.coefficients[missing], weekday, month)[1]
+            self._peak_cache = ((weekday, month), out)
+        return out
+
+    def status(self, time, weekday, month):
+        # 전체 역의 (예측 인원, CDI, 등급 코드)
+        pred = self.predict_all(time, weekday, month)
+        cdi = pred / self.max_values_for(weekday, month)
+        return pred, cdi, grade_array(cdi, self.cutoffs)
+
+    def least_crowded(self, time, weekday, month, k=10, by="cdi"):
+        # 가장 여유로운 역 k개 [(역, 예측 인원, CDI, 등급 라벨), ...]
+        # by="cdi" 는 역 규모 대비, by="prediction" 은 예상 인원 그대로 비교
+        pred, cdi, grades = self.status(time, weekday, month)
+        values = cdi if by == "cdi" else pred
+        top = select_top_k(values, np.arange(len(values)), k)
+        return [(self.stations[i], float(pred[i]), float(cdi[i]), self.labels[grades[i]]) for i in top]
+
+
+def load_network(variant=None):
+    from congestion_model import DEFAULT_VARIANT, get_model
+    return Network.from_model(get_model(variant or DEFAULT_VARIANT))
+
+
+# ------------------------
+# 속도 확인 (가상의 역 수백 개)
+# ------------------------
+def synthetic_network(n_stations=800, seed=0):
+    from crowd_engine import COEFFICIENTS
+    rng = np.random.default_rng(seed)
+    base = COEFFICIENTS[rng.integers(0, len(COEFFICIENTS), n_stations)]
+    coefficients = base * rng.uniform(0.3, 1.5, (n_stations, 1))
+    return Network([f"역{i:03d}" for i in range(n_stations)], coefficients)
+
+
+if __name__ == "__main__":
+    network = synthetic_network()
+    network.least_crowded(17.5, 6, 9)
+    n = 2000
+    start = _time.perf_counter()
+    for i in range(n):
+        result = network.least_crowded(17.5, i % 7, 9)
+    elapsed = (_time.perf_counter() - start) / n
+    for name, pred, cdi, label in result[:5]:
+        print(name, f"{pred:.0f}", f"{cdi:.2f}", label)
+    print(f"{len(network)} stations: {elapsed * 1e6:.0f} us / query")
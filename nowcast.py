@@ -0,0 +1,75 @@
+import threading
+
+import numpy as np
+
+# ------------------------
+# 실측 보정 (nowcast)
+# ------------------------
+# 역마다 최근 N 개의 잔차 (실측 - 예측) 와 관측 시각을 고정 크기 링 버퍼에 두고, 조회 시각에 가까운 잔차일수록
+# 큰 가중치 exp(-|Δt|/τ) 로 평균한 값을 예측에 더한다 (시간 방향 지수 평활).
+# 가장 가까운 관측이 멀수록 보정도 같은 비율로 줄고, horizon 밖의 관측은 쓰지 않는다 (모두 밖이면 보정 0).
+# 관측 하나는 O(1), 조회 하나는 버퍼 크기 N 에 비례하는 고정 비용이고, 메모리는 역 수 x N 으로 고정이다.
+class Nowcaster:
+    def __init__(self, stations, size=64, tau_minutes=60.0, horizon_minutes=180.0):
+        self.stations = list(stations)
+        self.index = {name: i for i, name in enumerate(self.stations)}
+        self.size = size
+        self.tau = tau_minutes * 60
+        self.horizon = horizon_minutes * 60
+        n = len(self.stations)
+        self.residuals = np.zeros((n, size), dtype=np.float32)
+        self.times = np.full((n, size), np.nan)         # 관측 시각 (epoch 초), 빈 칸은 NaN
+        self.head = np.zeros(n, dtype=np.int64)       # 다음에 쓸 칸
+        self.count = np.zeros(n, dtype=np.int64)      # 지금까지 받은 관측 수 (버퍼에는 최근 size 개만)
+        self._lock = threading.Lock()
+
+    def observe(self, station, when, observed, predicted):
+        row = self.index.get(station)
+        if row is None:
+            return None
+        residual = observed - predicted
+        with self._lock:
+            slot = self.head[row]
+            self.residuals[row, slot] = residual
+            self.times[row, slot] = when.timestamp()
+            self.head[row] = (slot + 1) % self.size
+            self.count[row] += 1
+        return residual
+
+    def correction(self, station, when):
+        row = self.index.get(station)
+        if row is None or self.count[row] == 0:
+            return 0.0
+        with self._lock:
+            dt = np.abs(self.times[row] - when.timestamp())
+            residuals = self.residuals[row].astype(np.float64)
+        with np.errstate(invalid="ignore"):
+            near = dt <= self.horizon           # 빈 칸 (NaN) 은 False
+        if not near.any():
+            return 0.0
+        # 가장 가까운 관측 기준의 상대 가중치로 평균 (멀리 떨어진 관측만 있어도 0 으로 언더플로하지 않게)
+        nearest = dt[near].min()
+        weights = np.exp(-(dt[near] - nearest) / self.tau)
+        return float(weights @ residuals[near] / weights.sum() * np.exp(-nearest / self.tau))
+
+    def carry_over(self, other):
+        # 다른 역 목록으로 만든 Nowcaster (이전 모델) 에서 두 쪽에 다 있는 역의 버퍼를 그대로 가져온다
+        pairs = [(row, other.index[name]) for name, row in self.index.items() if name in other.index]
+        if not pairs or other.size != self.size:
+            return
+        rows, src = (np.array(a) for a in zip(*pairs))
+        with other._lock:
+            residuals, times = other.residuals[src], other.times[src]
+            head, count = other.head[src], other.count[src]
+        with self._lock:
+            self.residuals[rows], self.times[rows], self.head[rows], self.count[rows] = residuals, times, head, count
+
+    def correct(self, station, when, predicted):
+        return max(predicted + self.correction(station, when), 0.0)
+
+    def recent(self, station):
+        # 버퍼의 잔차를 오래된 것부터 (확인 / 화면 표시용)
+        row = self.index[station]
+        n = min(int(self.count[row]), self.size)
+        order = (self.head[row] - n + np.arange(n)) % self.size
+        return self.residuals[row, order].astype(np.float64)
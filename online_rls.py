@@ -0,0 +1,181 @@
+import argparse
+import datetime
+import socket
+import sys
+import time as _time
+
+import numpy as np
+
+from crowd_engine import SERVICE_START, canonical_station
+
+N_FEATURES = 5      # [1, t, t^2, 요일, 월]
+
+
+# ------------------------
+# 재귀 최소제곱 (RLS)
+# ------------------------
+# 역마다 계수 θ (5) 와 역공분산 P (5x5) 만 들고 관측 하나에 O(p^2) 로 갱신한다.
+# 망각 계수 lam < 1 이면 오래된 관측의 비중이 지수적으로 줄어든다 (lam=0.999 → 약 1000 개 관측의 기억).
+# P 는 특징을 0~1 근처로 나눈 좌표 (FEATURE_SCALE) 에서 다룬다 — t^2 (최대 576) 와 월이 섞인 그대로는
+# 조건수가 나빠 반올림 오차가 쌓인다. θ 는 원래 좌표 (모델 파일의 계수) 그대로 둔다.
+FEATURE_SCALE = np.array([1.0, 1 / 24, 1 / 24 ** 2, 1 / 6, 1 / 12])
+
+
+class OnlineRLS:
+    def __init__(self, stations, coefficients, lam=0.999, delta=1.0, max_trace=1e6):
+        self.stations = list(stations)
+        self.index = {name: i for i, name in enumerate(self.stations)}
+        self.theta = np.array(coefficients, dtype=np.float64)
+        # P 가 작을수록 처음 계수를 더 믿는다
+        self.delta = delta
+        self.P = np.repeat(np.eye(N_FEATURES)[None] * delta, len(self.stations), axis=0)
+        self.lam = lam
+        self.max_trace = max_trace
+        self.updates = 0
+        self.skipped = 0
+        self.resets = 0
+
+    def update(self, station, when, count):
+        # 반환값: 갱신 전 계수로 낸 예측 오차 (건너뛴 관측이면 None)
+        row = self.index.get(canonical_station(station))
+        t = when.hour + when.minute / 60
+        if row is None or t < SERVICE_START:
+            # 모델에 없는 역 / 5시 이전 (모델이 5시 값으로 보정하는 구간) 은 학습하지 않는다
+            self.skipped += 1
+            return None
+        x = np.array([1.0, t, t * t, when.weekday(), when.month])
+        z = x * FEATURE_SCALE
+        P = self.P[row]
+
+        Pz = P @ z
+        gain = Pz / (self.lam + z @ Pz)
+        error = count - self.theta[row] @ x
+        self.theta[row] += FEATURE_SCALE * gain * error      # 나눈 좌표의 계수 변화 → 원래 좌표
+        # Joseph 형태: (I - g zᵀ) P (I - g zᵀ)ᵀ + lam g gᵀ — 뺄셈 형태 (P - g zᵀP) 와 값은 같지만
+        # 반올림 오차가 있어도 대칭 / 양의 준정부호가 유지된다
+        A = np.eye(N_FEATURES) - np.outer(gain, z)
+        P = (A @ P @ A.T + self.lam * np.outer(gain, gain)) / self.lam
+        P = (P + P.T) / 2
+        # 관측이 한쪽 방향 (요일, 월) 으로만 들어오면 그 방향의 P 가 1/lam 배씩 한없이 커진다 (windup) —
+        # 상한을 넘으면 처음 P 로 되돌린다 (계수는 그대로)
+        if P.trace() > self.max_trace:
+            P = np.eye(N_FEATURES) * self.delta
+            self.resets += 1
+        self.P[row] = P
+        self.updates += 1
+        return float(error)
+
+    def save_state(self, path):
+        np.savez(path, stations=np.array(self.stations), theta=self.theta, P=self.P,
+                 lam=self.lam, updates=self.updates, feature_scale=FEATURE_SCALE)
+
+    def load_state(self, path):
+        state = np.load(path)
+        rows = [self.index[s] for s in state["stations"].tolist() if s in self.index]
+        keep = [i for i, s in enumerate(state["stations"].tolist()) if s in self.index]
+        self.theta[rows] = state["theta"][keep]
+        # 예전 상태 파일의 P 는 나누지 않은 좌표라 쓰지 않는다 (처음 P 로 다시 시작)
+        if "feature_scale" in state and np.array_equal(state["feature_scale"], FEATURE_SCALE):
+            self.P[rows] = state["P"][keep]
+        self.updates = int(state["updates"])
+
+
+# ------------------------
+# 관측 스트림
+# ------------------------
+# 한 줄 = "역,시각,인원" (시각은 ISO 형식, 예: 강남,2025-09-21T17:30,5120)
+# source: 파일 경로 / "-" (표준 입력) / "tcp://호스트:포트" (그 포트에서 접속을 받아 줄 단위로 읽음)
+def read_lines(source, follow=False):
+    if source == "-":
+        yield from sys.stdin
+    elif source.startswith("tcp://"):
+        host, port = source[len("tcp://"):].rsplit(":", 1)
+        with socket.create_server((host, int(port))) as server:
+            while True:
+                conn, _ = server.accept()
+                with conn, conn.makefile("r", encoding="utf-8") as f:
+                    yield from f
+    else:
+        with open(source, encoding="utf-8") as f:
+            while True:
+                line = f.readline()
+                if line:
+                    yield line
+                elif follow:
+                    _time.sleep(0.5)
+                else:
+                    return
+
+
+def parse_observation(line):
+    station, when, count = line.strip().split(",")
+    return station, datetime.datetime.fromisoformat(when), float(count)
+
+
+# ------------------------
+# 모델 파일로 내보내기
+# ------------------------
+def publish(rls, base, path, coefficient_set="standard"):
+    # 기준 모델의 변형 / 기준값은 그대로, 계수 세트 하나만 RLS 계수로 바꿔 쓴다.
+    # 앱은 congestion_model 의 감시 스레드가 파일 교체를 보고 새 모델로 넘어간다.
+    import model_artifact
+    stations, coefficient_sets, variants = model_artifact.artifact_tables(base)
+    table = np.array(coefficient_sets[coefficient_set])
+    for i, name in enumerate(stations):
+        table[i] = rls.theta[rls.index[name]]
+    coefficient_sets[coefficient_set] = table
+    # base_version 은 처음 (온라인 학습 전) 모델 — 이미 온라인으로 갱신한 파일에서 다시 시작해도 이어진다
+    base_version = base.meta.get("online", {}).get("base_version", base.model_version)
+    extra = {"online": {"base_version": base_version, "observations": rls.updates, "lambda": rls.lam}}
+    return model_artifact.write_artifact(path, stations, coefficient_sets, variants, extra_meta=extra)
+
+
+def run(source, path, follow=False, lam=0.999, delta=1.0, publish_every=60.0, state=None,
+        coefficient_set="standard"):
+    from congestion_model import load_artifact
+    base = load_artifact(path)
+    rls = OnlineRLS(base.stations, base.coefficient_sets[coefficient_set], lam=lam, delta=delta)
+    if state:
+        try:
+            rls.load_state(state)
+        except FileNotFoundError:
+            pass
+
+    last = _time.monotonic()
+    published = rls.updates
+    for line in read_lines(source, follow):
+        if not line.strip():
+            continue
+        try:
+            rls.update(*parse_observation(line))
+        except ValueError:
+            rls.skipped += 1
+            continue
+        if _time.monotonic() - last >= publish_every and rls.updates > published:
+            version = publish(rls, base, path, coefficient_set)
+            if state:
+                rls.save_state(state)
+            print(f"published {version}: {rls.updates} updates, {rls.skipped} skipped", flush=True)
+            last, published = _time.monotonic(), rls.updates
+    if rls.updates > published:
+        publish(rls, base, path, coefficient_set)
+        if state:
+            rls.save_state(state)
+    return rls
+
+
+if __name__ == "__main__":
+    from congestion_model import MODEL_PATH
+
+    parser = argparse.ArgumentParser(description="실시간 승차 인원으로 계수를 온라인 갱신 (RLS)")
+    parser.add_argument("source", help="관측 파일 / - (표준 입력) / tcp://호스트:포트")
+    parser.add_argument("--model", default=MODEL_PATH, help="읽고 다시 쓸 모델 파일")
+    parser.add_argument("--follow", action="store_true", help="파일 끝에서 기다리며 계속 읽기")
+    parser.add_argument("--lam", type=float, default=0.999, help="망각 계수")
+    parser.add_argument("--delta", type=float, default=1.0, help="처음 P 의 크기 (작을수록 기존 계수를 믿음)")
+    parser.add_argument("--publish-every", type=float, default=60.0, help="모델 파일 갱신 간격 (초)")
+    parser.add_argument("--state", help="RLS 상태 파일 (.npz) — 재시작해도 이어서 학습")
+    args = parser.parse_args()
+
+    rls = run(args.source, args.model, args.follow, args.lam, args.delta, args.publish_every, args.state)
+    print(f"{rls.updates} updates, {rls.skipped} skipped")
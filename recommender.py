@@ -0,0 +1,98 @@
+import datetime
+import time as _time
+from collections import namedtuple
+
+import numpy as np
+
+from crowd_engine import COEFFICIENTS, DEFAULT_CUTOFFS, STATION_INDEX, canonical_station, grade_array, predict_array
+
+MINUTES_PER_DAY = 24 * 60
+
+# when: 추천 시각 (datetime), cdi / grade 는 max_value 를 준 경우에만 채운다
+Recommendation = namedtuple("Recommendation", ["when", "prediction", "cdi", "grade"])
+
+
+# ------------------------
+# 후보 시간대
+# ------------------------
+def candidate_grid(date, hour, minute, window_minutes=30, step_minutes=5):
+    # 기준 시각 ±window 를 step 간격으로 — 자정을 넘는 후보는 요일/월도 다음(이전) 날로 넘긴다
+    if window_minutes < 0 or step_minutes < 1:
+        raise ValueError(f"window_minutes 는 0 이상, step_minutes 는 1 이상이어야 합니다: {window_minutes}, {step_minutes}")
+    offsets = np.arange(-window_minutes, window_minutes + 1, step_minutes)
+    day_offset, minute_of_day = np.divmod(hour * 60 + minute + offsets, MINUTES_PER_DAY)
+
+    first = int(day_offset[0])
+    days = [date + datetime.timedelta(days=d) for d in range(first, int(day_offset[-1]) + 1)]
+    weekdays = np.array([d.weekday() for d in days])[day_offset - first]
+    months = np.array([d.month for d in days])[day_offset - first]
+    return offsets, minute_of_day, weekdays, months
+
+
+# ------------------------
+# 추천
+# ------------------------
+def select_top_k(values, order, k):
+    # 값이 작은 k개의 위치 (작은 순, 같으면 order 가 작은 것 먼저)
+    # 전체 정렬 대신 k개만 골라낸 뒤 그 안에서만 정렬
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = values[np.argpartition(values, k - 1)[k - 1]]
+    below = np.flatnonzero(values < kth)
+    # 같은 값이 여럿이면 (새벽 0명 구간 등) 앞쪽부터 채운다
+    tied = np.flatnonzero(values == kth)[:k - len(below)]
+    top = np.concatenate([below, tied])
+    return top[np.lexsort((order[top], values[top]))]
+
+
+def recommend(station, date, hour, minute, k=3, window_minutes=30, step_minutes=5, max_value=None,
+              cutoffs=DEFAULT_CUTOFFS, coefficients=COEFFICIENTS, include_current=True, index=STATION_INDEX,
+              table=None):
+    # 예상 인원이 가장 적은 k개 시간대 (적은 순, 같으면 이른 시간 먼저)
+    # index: 역 이름 → coefficients 의 행 번호 (모델 파일의 역 목록이면 model.artifact.station_index)
+    # table: 같은 계수로 만든 forecast_table.ForecastTable — 후보가 모두 슬롯 위에 있으면 계산 대신 읽는다 (정수 인원)
+    offsets, minute_of_day, weekdays, months = candidate_grid(date, hour, minute, window_minutes, step_minutes)
+    if not include_current:
+        keep = offsets != 0
+        offsets, minute_of_day, weekdays, months = offsets[keep], minute_of_day[keep], weekdays[keep], months[keep]
+
+    row = index[canonical_station(station)]
+    pred = None
+    if table is not None:
+        slots, off_slot = np.divmod(minute_of_day, table.slot_minutes)
+        if not off_slot.any():
+            pred = table.counts[row, weekdays, months - 1, slots] * table.scale
+    if pred is None:
+        pred = predict_array(row, minute_of_day / 60, weekdays, months, coefficients)
+
+    top = select_top_k(pred, offsets, k)
+    cdi = grades = None
+    if max_value is not None:
+        cdi = pred[top] / max_value
+        grades = grade_array(cdi, cutoffs)
+
+    base = datetime.datetime.combine(date, datetime.time(hour, minute))
+    return [
+        Recommendation(
+            base + datetime.timedelta(minutes=int(offsets[i])),
+            float(pred[i]),
+            None if cdi is None else float(cdi[n]),
+            None if grades is None else int(grades[n]),
+        )
+        for n, i in enumerate(top)
+    ]
+
+
+if __name__ == "__main__":
+    # ±3시간, 1분 간격에서 상위 3개
+    date = datetime.date(2025, 9, 21)
+    recommend("강남", date, 23, 30, window_minutes=180, step_minutes=1)
+    n = 2000
+    start = _time.perf_counter()
+    for _ in range(n):
+        result = recommend("강남", date, 23, 30, window_minutes=180, step_minutes=1)
+    elapsed = (_time.perf_counter() - start) / n
+    for r in result:
+        print(r.when.strftime("%a %H:%M"), f"{r.prediction:.0f}")
+    print(f"{elapsed * 1e6:.0f} us / query")
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+# ------------------------
+# 같은 계산 합치기 (single-flight)
+# ------------------------
+# 같은 키의 계산이 이미 진행 중이면 새로 계산하지 않고 그 결과 (또는 예외) 를 같이 받는다.
+# 결과를 보관하지는 않는다 — 계산이 끝나면 키가 빠지고, 그 뒤의 재사용은 캐시 (cache.TTLCache / ETag) 몫이다.
+#   computed: 실제로 계산한 횟수, saved: 진행 중인 계산을 기다려 받은 횟수 (아낀 계산 수)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    # 스레드용 (streamlit 세션은 스레드 하나씩)
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.saved = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.computed += 1
+            else:
+                self.saved += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def stats(self):
+        with self._lock:
+            return {"computed": self.computed, "saved": self.saved, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    # asyncio 용 — 이벤트 루프 하나 안에서만 쓰므로 lock 이 필요 없다
+    def __init__(self):
+        self._calls = {}
+        self.computed = 0
+        self.saved = 0
+
+    async def do(self, key, fn):
+        # fn: 인자 없는 코루틴 함수. 계산은 별도 task 라서 처음 부른 쪽이 취소돼도 기다리는 쪽은 결과를 받는다.
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self.computed += 1
+        else:
+            self.saved += 1
+        return await asyncio.shield(task)
+
+    def stats(self):
+        return {"computed": self.computed, "saved": self.saved, "in_flight": len(self._calls)}
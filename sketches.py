@@ -0,0 +1,244 @@
+import argparse
+import calendar
+import datetime
+import heapq
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# ------------------------
+# KLL 분위수 스케치
+# ------------------------
+# 층(level)마다 버퍼가 있고, 버퍼가 차면 정렬해서 하나 건너 하나만 위층으로 올린다 (위층 원소는 가중치 2배).
+# 원소를 몇 개 넣든 크기는 k 에 비례하고, 같은 k 의 스케치끼리는 층별로 이어 붙이면 합쳐진다.
+class KLLSketch:
+    def __init__(self, k=200, c=2 / 3, seed=None):
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * self.c ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size:
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self.n += values.size
+            self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            buf = self.levels[level]
+            if len(buf) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                buf = np.sort(buf)
+                # 홀수 개면 하나는 이 층에 남긴다
+                keep = buf[len(buf) - len(buf) % 2:]
+                promoted = buf[self._rng.integers(2):len(buf) - len(buf) % 2:2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError(f"k 가 다른 스케치는 합칠 수 없습니다: {self.k} / {other.k}")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, buf in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], buf])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        if self.n == 0:
+            return float("nan")
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(buf), 2.0 ** level) for level, buf in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        cum = np.cumsum(weights[order])
+        i = np.searchsorted(cum, q * cum[-1], side="left")
+        return float(values[order][min(i, len(values) - 1)])
+
+    def to_dict(self):
+        return {"k": self.k, "c": self.c, "n": self.n, "levels": [buf.tolist() for buf in self.levels]}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state["k"], state["c"])
+        sketch.n = state["n"]
+        sketch.levels = [np.asarray(buf, dtype=np.float64) for buf in state["levels"]]
+        return sketch
+
+
+# ------------------------
+# 상위 N 개 (최소 힙)
+# ------------------------
+class TopN:
+    def __init__(self, n=5):
+        self.n = n
+        self.heap = []      # 가장 작은 값이 맨 앞 — 새 값이 그보다 크면 바꿔 넣는다
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) > self.n:
+            # 배치에서 상위 n 개만 먼저 골라 힙 연산을 n 번 이하로
+            values = np.partition(values, len(values) - self.n)[-self.n:]
+        for v in values.tolist():
+            if len(self.heap) < self.n:
+                heapq.heappush(self.heap, v)
+            elif v > self.heap[0]:
+                heapq.heapreplace(self.heap, v)
+        return self
+
+    def merge(self, other):
+        return self.update(other.heap)
+
+    def mean(self):
+        return float(np.mean(self.heap)) if self.heap else float("nan")
+
+    def to_dict(self):
+        return {"n": self.n, "heap": sorted(self.heap)}
+
+    @classmethod
+    def from_dict(cls, state):
+        top = cls(state["n"])
+        top.update(state["heap"])
+        return top
+
+
+# ------------------------
+# 역별 CDI 기준값
+# ------------------------
+# 앱마다 다른 기준 ("상위 10%" = 0.9 분위수, "상위 5개 평균") 을 이력 한 번 훑어서 같이 구한다.
+# 이미 읽은 (역, 월) 파티션은 기록해 두고 새 달이 들어오면 그 달만 더 읽는다.
+class StationReferences:
+    def __init__(self, k=200, top_n=5):
+        self.k = k
+        self.top_n = top_n
+        self.quantiles = {}
+        self.tops = {}
+        self.seen = set()       # {(역, YYYYMM)}
+
+    def update(self, station, values):
+        if station not in self.quantiles:
+            self.quantiles[station] = KLLSketch(self.k)
+            self.tops[station] = TopN(self.top_n)
+        self.quantiles[station].update(values)
+        self.tops[station].update(values)
+        return self
+
+    def merge(self, other):
+        for station, sketch in other.quantiles.items():
+            if station in self.quantiles:
+                self.quantiles[station].merge(sketch)
+                self.tops[station].merge(other.tops[station])
+            else:
+                self.quantiles[station] = sketch
+                self.tops[station] = other.tops[station]
+        self.seen |= other.seen
+        return self
+
+    def quantile(self, q=0.9):
+        return {s: round(sketch.quantile(q), 1) for s, sketch in sorted(self.quantiles.items())}
+
+    def top_mean(self):
+        return {s: round(top.mean(), 1) for s, top in sorted(self.tops.items())}
+
+    def save(self, path):
+        state = {
+            "k": self.k,
+            "top_n": self.top_n,
+            "seen": sorted([s, m] for s, m in self.seen),
+            "stations": {s: {"quantile": self.quantiles[s].to_dict(), "top": self.tops[s].to_dict()}
+                         for s in self.quantiles},
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        refs = cls(state["k"], state["top_n"])
+        refs.seen = {(s, m) for s, m in state["seen"]}
+        for station, item in state["stations"].items():
+            refs.quantiles[station] = KLLSketch.from_dict(item["quantile"])
+            refs.tops[station] = TopN.from_dict(item["top"])
+        return refs
+
+
+# ------------------------
+# 이력 저장소에서 계산
+# ------------------------
+def history_partitions(store):
+    import pyarrow.dataset as ds
+    keys = set()
+    for fragment in store.dataset.get_fragments():
+        p = ds.get_partition_keys(fragment.partition_expression)
+        keys.add((p["station"], int(p["month"])))
+    return sorted(keys)
+
+
+def _scan(root, partitions, k, top_n, value):
+    from history_store import HistoryStore
+    store = HistoryStore(root)
+    refs = StationReferences(k, top_n)
+    for station, month in partitions:
+        year, mon = divmod(month, 100)
+        first = datetime.date(year, mon, 1)
+        last = datetime.date(year, mon, calendar.monthrange(year, mon)[1])
+        rows = store.query(station, first, last, values=[value])
+        refs.update(station, rows[value])
+        refs.seen.add((station, month))
+    return refs
+
+
+def build_references(root, refs=None, workers=None, value="boardings", k=200, top_n=5):
+    # refs 를 주면 아직 안 읽은 파티션만 더한다 (지난 달이 바뀐 경우에는 상태 파일을 지우고 다시 만든다)
+    from history_store import HistoryStore
+    refs = refs or StationReferences(k, top_n)
+    todo = [p for p in history_partitions(HistoryStore(root)) if p not in refs.seen]
+    if not todo:
+        return refs
+    workers = workers or os.cpu_count() or 1
+    groups = [todo[i::workers] for i in range(min(workers, len(todo)))]
+    if len(groups) == 1:
+        return refs.merge(_scan(root, groups[0], refs.k, refs.top_n, value))
+    with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+        n = len(groups)
+        for part in pool.map(_scan, [root] * n, groups, [refs.k] * n, [refs.top_n] * n, [value] * n):
+            refs.merge(part)
+    return refs
+
+
+if __name__ == "__main__":
+    from history_store import DEFAULT_ROOT
+
+    parser = argparse.ArgumentParser(description="이력에서 역별 CDI 기준값 계산 (상위 q 분위수 / 상위 N 개 평균)")
+    parser.add_argument("state", help="스케치 상태 파일 (없으면 새로 만든다)")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--q", type=float, default=0.9)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    refs = StationReferences.load(args.state) if os.path.exists(args.state) else StationReferences(top_n=args.top)
+    before = len(refs.seen)
+    refs = build_references(args.root, refs, args.workers)
+    refs.save(args.state)
+    print(f"{len(refs.seen) - before} new partitions, {len(refs.seen)} total")
+    quantile, top_mean = refs.quantile(args.q), refs.top_mean()
+    for station in quantile:
+        print(f"{station}\t상위 {1 - args.q:.0%} 기준 {quantile[station]}\t상위 {refs.top_n}개 평균 {top_mean[station]}")
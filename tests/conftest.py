@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# 저장소 최상위 모듈을 그대로 import 한다 (패키지가 아니다)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# 작업 디렉터리의 models/ 와 상관없이 내장 모델 / 임시 디렉터리로 — congestion_model 을 import 하기 전에 정해야 한다
+_scratch = tempfile.mkdtemp(prefix="crowd-tests-")
+os.environ["CROWD_MODEL_PATH"] = os.path.join(_scratch, "missing.bin")
+os.environ["CROWD_HISTORY_PATH"] = os.path.join(_scratch, "history")
+os.environ["CROWD_TABLE_DIR"] = os.path.join(_scratch, "tables")
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+import api_server
+from admission import Overloaded, RateLimiter, WorkQueue
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_refills():
+    clock = Clock()
+    limiter = RateLimiter(rate=10, burst=2, clock=clock)
+    limiter.acquire("a")
+    limiter.acquire("a")
+    with pytest.raises(Overloaded) as exc:
+        limiter.acquire("a")
+    assert exc.value.status == 429 and exc.value.retry_after == 1
+    limiter.acquire("b")                # 클라이언트마다 따로
+    clock.now = 0.1
+    limiter.acquire("a")
+    assert limiter.stats()["limited"] == 1
+
+
+def test_client_id_header_only_from_trusted_proxy():
+    app = api_server.App(rate=1, burst=1, trusted_proxies=["10.0.0.1"])
+    client = api_server.TestClient(app)
+    target = "/predict?station=강남&date=2025-09-22&time=8"
+    try:
+        # 직접 붙은 클라이언트는 헤더를 바꿔도 같은 버킷
+        assert client.request("GET", target, {"X-Client-Id": "a"}, client="1.2.3.4").status == 200
+        assert client.request("GET", target, {"X-Client-Id": "b"}, client="1.2.3.4").status == 429
+        # 프록시 뒤의 클라이언트는 헤더로 구분
+        assert client.request("GET", target, {"X-Client-Id": "a"}, client="10.0.0.1").status == 200
+        assert client.request("GET", target, {"X-Client-Id": "b"}, client="10.0.0.1").status == 200
+        assert client.request("GET", target, {"X-Client-Id": "a"}, client="10.0.0.1").status == 429
+    finally:
+        client.close()
+
+
+def test_timed_out_waiters_leave_the_queue():
+    async def run():
+        queue = WorkQueue(concurrency=1, max_queue=2, max_wait=0.01)
+        await queue.acquire()
+        for _ in range(3):
+            with pytest.raises(Overloaded) as exc:
+                await queue.acquire()
+            assert exc.value.status == 503
+        stats = queue.stats()
+        # 포기한 요청이 줄에 남아 있으면 세 번째는 "가득 참" 으로 거절됐을 것이다
+        assert stats["waiting"] == 0 and stats["shed_timeout"] == 3 and stats["shed_queue_full"] == 0
+        queue.release()
+        assert queue.active == 0
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    async def run():
+        queue = WorkQueue(concurrency=1, max_queue=4, max_wait=1.0)
+        await queue.acquire()
+        waiter = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+        assert queue.stats()["waiting"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert queue.stats()["waiting"] == 0
+
+        # 슬롯을 넘겨받는 순간 취소된 경우에도 슬롯은 돌려준다
+        waiter = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+        queue.release()                 # 슬롯을 waiter 에게 넘긴다
+        waiter.cancel()
+        try:
+            await waiter
+            queue.release()             # 파이썬 버전에 따라 취소 대신 슬롯을 받는다 — 그러면 쓴 쪽이 돌려준다
+        except asyncio.CancelledError:
+            pass
+        assert queue.active == 0 and queue.stats()["waiting"] == 0
+
+    asyncio.run(run())
@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+
+import api_server
+from api_server import HTTPError, parse_time
+
+
+@pytest.fixture
+def client():
+    c = api_server.TestClient()
+    yield c
+    c.close()
+
+
+def query(station="강남", date="2025-09-22", time="17:30"):
+    return {"station": station, "date": date, "time": time}
+
+
+def test_predict_and_etag(client):
+    r = client.get("/predict?station=강남&date=2025-09-22&time=17:30")
+    assert r.status == 200 and r.json()["time"] == 17.5 and r.json()["grade"] >= 0
+    again = client.get("/predict?station=강남&date=2025-09-22&time=17:30", {"If-None-Match": r.headers["ETag"]})
+    assert again.status == 304 and again.body == b""
+
+
+def test_predict_errors(client):
+    assert client.get("/predict?station=없는역&date=2025-09-22&time=8").status == 404
+    assert client.get("/predict?station=강남&time=8").status == 400
+    assert client.get("/predict?station=강남&date=2025-09-22&time=8&variant=x").status == 404
+    assert client.post("/predict").status == 405
+
+
+@pytest.mark.parametrize("value", ["17:99", "-0:30", "24:00", "25", "-1", "8:5", "1730:", "ab", "", "nan"])
+def test_parse_time_rejects(value):
+    with pytest.raises(HTTPError) as exc:
+        parse_time(value)
+    assert exc.value.status == 400
+
+
+@pytest.mark.parametrize("value, hours", [("17:30", 17.5), ("00:00", 0.0), ("23:59", 23 + 59 / 60), ("8.25", 8.25)])
+def test_parse_time_accepts(value, hours):
+    assert parse_time(value) == hours
+
+
+def test_bulk_matches_predict(client):
+    r = client.post("/predict/bulk", {"queries": [query(), query(station="없는역")]})
+    assert r.status == 200
+    first, unknown = r.json()["results"]
+    single = client.get("/predict?station=강남&date=2025-09-22&time=17:30").json()
+    assert (first["pred"], first["cdi"], first["grade"]) == (single["pred"], single["cdi"], single["grade"])
+    assert unknown["pred"] is None and unknown["grade"] == -1
+
+
+@pytest.mark.parametrize("body", [
+    {"queries": 5}, {"queries": {"a": 1}}, {"queries": [1]}, {"nothing": []},
+    {"queries": [query(time="1730:")]}, {"queries": [query(time="25:00")]},
+    {"queries": [query(date="2025-02-30")]}, {"queries": [{"station": "강남"}]},
+])
+def test_bulk_client_errors_are_400(client, body):
+    assert client.post("/predict/bulk", body).status == 400
+
+
+def test_recommend(client):
+    r = client.get("/recommend?station=강남&date=2025-09-22&time=08:00&k=3")
+    assert r.status == 200 and len(r.json()["recommendations"]) == 3
+    assert client.get("/recommend?station=강남&date=2025-09-22&time=08:00&step=0").status == 400
+    # 분으로 반올림하면 24:00 인 시각 → 다음 날 00:00 기준
+    r = client.get("/recommend?station=강남&date=2025-09-22&time=23.995&window=0&k=1")
+    assert r.status == 200 and r.json()["recommendations"][0]["date"] == "2025-09-23"
+
+
+@pytest.mark.parametrize("extra", [
+    "window=-5", "window=1441", "window=100000000", "step=0", "step=-1", "step=1441",
+    "k=0", "k=-3", "k=101", "k=x", "window=1.5",
+])
+def test_recommend_rejects_out_of_range_options(client, extra):
+    r = client.get(f"/recommend?station=강남&date=2025-09-22&time=08:00&{extra}")
+    assert r.status == 400 and "error" in r.json()
+
+
+@pytest.mark.parametrize("date", ["0001-01-01", "1999-12-31", "2100-01-01", "9999-12-31"])
+def test_dates_outside_the_range_are_400(client, date):
+    assert client.get(f"/recommend?station=강남&date={date}&time=23:59&window=1440").status == 400
+    assert client.get(f"/predict?station=강남&date={date}&time=23:59&live=1").status == 400
+
+
+def test_recommend_widest_sweep(client):
+    r = client.get("/recommend?station=강남&date=2099-12-31&time=23:59&window=1440&step=1&k=100")
+    assert r.status == 200
+    recs = r.json()["recommendations"]
+    assert len(recs) == 100 and {rec["date"] for rec in recs} <= {"2099-12-30", "2099-12-31", "2100-01-01"}
+
+
+def test_recommend_runs_off_the_event_loop(client, monkeypatch):
+    threads = []
+
+    def fake(station, date, time, model=None, **options):
+        threads.append(threading.current_thread())
+        return []
+
+    monkeypatch.setattr(api_server, "get_recommendations", fake)
+    assert client.get("/recommend?station=강남&date=2025-09-22&time=08:00").status == 200
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_conditional_get_skips_work(client):
+    app = client.app
+    first = client.get("/recommend?station=강남&date=2025-09-22&time=08:00")
+    etag = first.headers["ETag"]
+    admitted, batches, computed = app.queue.admitted, app.batcher.batch_sizes.count, app.flight.computed
+    for path in ("/predict?station=강남&date=2025-09-22&time=08:00", "/recommend?station=강남&date=2025-09-22&time=08:00"):
+        r = client.get(path, {"If-None-Match": etag})
+        assert r.status == 304 and r.headers["ETag"] == etag
+    assert (app.queue.admitted, app.batcher.batch_sizes.count, app.flight.computed) == (admitted, batches, computed)
+    assert app.not_modified == 2
+    # 다른 버전의 ETag 나 live 는 계산한다
+    assert client.get("/predict?station=강남&date=2025-09-22&time=08:00", {"If-None-Match": '"old"'}).status == 200
+    assert client.get("/predict?station=강남&date=2025-09-22&time=08:00&live=1", {"If-None-Match": etag}).status == 200
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch_predict import (parse_dates, parse_times, predict_chunks, predict_frame, query_schema, read_queries,
+                           write_chunks)
+from congestion_model import get_model
+
+
+@pytest.fixture
+def model():
+    return get_model("streamlit_app6")
+
+
+def expected(model, station, date, hour, minute):
+    date = pd.Timestamp(date)
+    pred = int(round(model.predict(station, hour + minute / 60, date.weekday(), date.month)))
+    cdi = round(model.cdi(station, pred, date.weekday(), date.month), 2)
+    return pred, cdi, model.grade(cdi)
+
+
+def test_matches_single_query_path(model):
+    df = pd.DataFrame({"station": ["강남", "서울", "사당역", "홍대입구"],
+                       "date": ["2025-09-21", "2025-01-02", "2025-06-30", "2025-12-31"],
+                       "time": ["17:30", "08:05", "23:59", "00:00"]})
+    out = predict_frame(df, model)
+    for row in out.itertuples():
+        h, m = map(int, row.time.split(":"))
+        assert (row.pred, row.cdi, row.grade) == expected(model, row.station, row.date, h, m)
+        assert row.level == model.labels[row.grade]
+
+
+def test_missing_date_is_null(model):
+    out = predict_frame(pd.DataFrame({"station": ["강남", "강남"], "date": [None, "2025-09-22"],
+                                      "time": ["08:00", "08:00"]}), model)
+    assert np.isnan(out["pred"][0]) and np.isnan(out["cdi"][0])
+    assert out["grade"][0] == -1 and out["level"][0] == ""
+    assert out["grade"][1] >= 0
+
+
+def test_missing_time_is_null(model):
+    out = predict_frame(pd.DataFrame({"station": ["강남", "강남"], "date": ["2025-09-22", "2025-09-22"],
+                                      "time": ["08:00", None]}), model)
+    assert np.isnan(out["pred"][1]) and out["grade"][1] == -1 and out["level"][1] == ""
+    assert out["grade"][0] >= 0
+
+
+def test_mixed_time_formats(model):
+    out = predict_frame(pd.DataFrame({"station": ["강남"] * 3, "date": ["2025-09-22"] * 3,
+                                      "time": ["17:30", "17.5", "17:30:00"]}), model)
+    assert out["pred"].nunique() == 1 and not out["pred"].isna().any()
+    assert (out["grade"] >= 0).all()
+
+
+def test_invalid_values_are_null(model):
+    times = ["17:99", "25:00", "-0:30", "ab", "24", "-1"]
+    out = predict_frame(pd.DataFrame({"station": ["강남"] * len(times), "date": ["2025-09-22"] * len(times),
+                                      "time": times}), model)
+    assert out["pred"].isna().all()
+    assert (out["grade"] == -1).all() and (out["level"] == "").all()
+    bad_date = predict_frame(pd.DataFrame({"station": ["강남"], "date": ["2025-13-01"], "time": ["08:00"]}), model)
+    assert bad_date["grade"][0] == -1
+
+
+def test_unknown_station(model):
+    out = predict_frame(pd.DataFrame({"station": ["없는역", "강남"], "date": ["2025-09-22"] * 2,
+                                      "time": ["08:00"] * 2}), model)
+    assert out["grade"].tolist()[0] == -1 and out["grade"].tolist()[1] >= 0
+
+
+def test_missing_column(model):
+    with pytest.raises(ValueError):
+        predict_frame(pd.DataFrame({"station": ["강남"]}), model)
+
+
+def test_parse_helpers():
+    hours = parse_times(pd.Series(["08:30", None, "8.5", "08:60"]))
+    assert hours[0] == hours[2] == 8.5 and np.isnan(hours[1]) and np.isnan(hours[3])
+    assert parse_times(pd.Series([8.5, np.nan, 30.0]))[0] == 8.5
+    weekday, month, valid = parse_dates(pd.Series(["2025-09-22", None]))
+    assert weekday[0] == 0 and month[0] == 9 and valid.tolist() == [True, False]
+
+
+def test_csv_round_trip_keeps_order(tmp_path):
+    n = 1000
+    df = pd.DataFrame({"shift": np.arange(n), "station": ["강남", "사당"] * (n // 2),
+                       "date": "2025-09-22", "time": [f"{h % 24:02d}:{h % 60:02d}" for h in range(n)]})
+    src = tmp_path / "q.csv"
+    df.to_csv(src, index=False)
+    out = tmp_path / "out.csv"
+    variant = "streamlit_app6"
+    rows = write_chunks(predict_chunks(read_queries(str(src), chunksize=128), "missing.bin", variant, workers=1),
+                        str(out))
+    result = pd.read_csv(out)
+    assert rows == n and result["shift"].tolist() == list(range(n))
+    assert (result["grade"] >= 0).all()
+
+
+def run_to_parquet(src, out, chunksize):
+    return write_chunks(predict_chunks(read_queries(str(src), chunksize=chunksize), "missing.bin", "streamlit_app6",
+                                       workers=1), str(out), query_schema(str(src)))
+
+
+def test_csv_chunks_with_shifting_dtypes_to_parquet(tmp_path):
+    import pyarrow.parquet as pq
+    # 첫 청크: note 가 비고 time 이 숫자 / 둘째 청크: note 에 값, time 이 HH:MM
+    src = tmp_path / "q.csv"
+    src.write_text("station,date,time,note\n강남,2025-09-22,8,\n사당,2025-09-22,9.5,\n"
+                   "강남,2025-09-22,17:30,급행\n사당,2025-09-22,07:05,x\n", encoding="utf-8")
+    out = tmp_path / "out.parquet"
+    assert run_to_parquet(src, out, chunksize=2) == 4
+    table = pq.read_table(out)
+    assert pq.ParquetFile(out).num_row_groups == 2
+    assert str(table.schema.field("note").type) == "string" and str(table.schema.field("time").type) == "string"
+    assert str(table.schema.field("grade").type) == "int8"
+    assert table.column("note").to_pylist() == [None, None, "급행", "x"]
+    assert table.column("time").to_pylist() == ["8", "9.5", "17:30", "07:05"]
+    assert min(table.column("grade").to_pylist()) >= 0
+
+
+def test_parquet_chunks_keep_the_input_types(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    src = tmp_path / "q.parquet"
+    pq.write_table(pa.table({
+        "station": ["강남", "사당", "강남", "없는역"],
+        "date": ["2025-09-22"] * 4,
+        "time": [8.0, 9.5, 17.5, 7.0],
+        "shift": pa.array([None, None, 3, 4], pa.int64()),      # 첫 배치는 전부 null
+        "note": pa.array([None, None, "a", "b"], pa.string()),
+    }), src)
+    out = tmp_path / "out.parquet"
+    assert run_to_parquet(src, out, chunksize=2) == 4
+    table = pq.read_table(out)
+    assert table.schema.field("shift").type == pa.int64() and table.schema.field("time").type == pa.float64()
+    assert table.column("shift").to_pylist() == [None, None, 3, 4]
+    assert table.column("grade").to_pylist()[3] == -1 and table.column("pred").to_pylist()[3] is None
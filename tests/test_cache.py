@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+import cache
+from cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_and_lru():
+    clock = Clock()
+    c = TTLCache(maxsize=2, ttl=10, clock=clock)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1
+    c.set("c", 3)                   # b 가 가장 오래 안 쓴 항목
+    assert c.get("b") is None and c.stats()["evictions"] == 1
+    clock.now = 11
+    assert c.get("a") is None and c.stats()["expirations"] == 1
+
+
+def test_get_or_compute_coalesces():
+    c = TTLCache()
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return 42
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(c.get_or_compute("k", compute))) for _ in range(8)]
+    threads[0].start()
+    started.wait()
+    for t in threads[1:]:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [42] * 8 and len(calls) == 1
+    assert c.stats()["coalesced"] + c.stats()["hits"] == 7
+
+
+@pytest.mark.skipif(cache.st is not None, reason="streamlit 밖의 대체 캐시")
+def test_resource_max_entries():
+    made = []
+
+    @cache.resource(max_entries=2)
+    def build(version):
+        made.append(version)
+        return object()
+
+    first = build("v1")
+    assert build("v1") is first
+    build("v2")
+    build("v3")                     # v1 이 밀려난다
+    build("v1")
+    assert made == ["v1", "v2", "v3", "v1"]
+
+    @cache.resource
+    def unbounded(x):
+        made.append(x)
+        return x
+
+    assert unbounded(1) == unbounded(1) == 1 and made.count(1) == 1
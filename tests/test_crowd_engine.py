@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+import crowd_engine
+from crowd_engine import COEFFICIENTS, STATIONS
+
+
+@pytest.fixture
+def queries():
+    rng = np.random.default_rng(0)
+    n = 5000
+    return (rng.integers(0, len(STATIONS), n), rng.uniform(0, 24, n),
+            rng.integers(0, 7, n), rng.integers(1, 13, n))
+
+
+def test_batch_matches_scalar_path(queries):
+    stations, times, weekdays, months = queries
+    pred, cdi, grade = crowd_engine.predict_batch(stations, times, weekdays, months,
+                                                  crowd_engine._SCALAR_MAX_VALUES)
+    scalar = crowd_engine._scalar_batch([STATIONS[i] for i in stations], times.tolist(),
+                                        weekdays.tolist(), months.tolist())
+    assert np.allclose(pred, [p for p, _, _ in scalar], rtol=0, atol=1e-9)
+    assert np.allclose(cdi, [c for _, c, _ in scalar], rtol=0, atol=1e-12)
+    assert grade.tolist() == [g for _, _, g in scalar]
+
+
+def test_times_before_five_are_clamped():
+    early = crowd_engine.predict_array(["강남"] * 3, [0.0, 3.0, 4.99], 0, 9)
+    assert np.all(early == crowd_engine.predict_array("강남", 5.0, 0, 9))
+    # clamp=False 면 그대로 2차식
+    a, b, c, d, e = COEFFICIENTS[0]
+    raw = crowd_engine.predict_array("강남", 3.0, 0, 9, clamp=False, clip=False)
+    assert raw == pytest.approx(a + b * 3 + c * 9 + e * 9)
+
+
+def test_negative_predictions_are_clipped_to_zero():
+    # 강남 5시 (일요일, 1월) 는 2차식 값이 음수
+    a, b, c, d, e = COEFFICIENTS[0]
+    assert a + b * 5 + c * 25 + d * 6 + e < 0
+    assert crowd_engine.predict_array("강남", 5.0, 6, 1) == 0.0
+    assert crowd_engine.predict_array("강남", 5.0, 6, 1, clip=False) < 0
+
+
+def test_string_and_row_inputs_agree(queries):
+    stations, times, weekdays, months = queries
+    names = np.array([["강남역", "서울", "사당", "홍대입구역"][i] for i in stations])
+    assert np.array_equal(crowd_engine.predict_array(names, times, weekdays, months),
+                          crowd_engine.predict_array(stations, times, weekdays, months))
+    with pytest.raises(KeyError):
+        crowd_engine.predict_array(["없는역"], [8.0], [0], [1])
+
+
+def test_grade_array_matches_searchsorted():
+    cutoffs = crowd_engine.DEFAULT_CUTOFFS
+    cdi = np.concatenate([np.linspace(-0.5, 1.5, 2001), cutoffs, np.nextafter(cutoffs, -np.inf), [np.nan]])
+    expected = np.searchsorted(cutoffs, cdi, side="right")
+    assert np.array_equal(crowd_engine.grade_array(cdi), expected)
+    assert crowd_engine.grade_array(np.asarray(cutoffs)).tolist() == [1, 2, 3, 4]
+
+
+def _brute_peak(row, weekday, month, start=5.0, end=24.0):
+    grid = np.linspace(start, end, 190_001)
+    a, b, c, d, e = row
+    values = a + b * grid + c * grid ** 2 + d * weekday + e * month
+    return grid[values.argmax()], values.max()
+
+
+@pytest.mark.parametrize("row", [
+    *COEFFICIENTS,
+    [100.0, -10.0, 1.0, 0.0, 0.0],      # 아래로 볼록 (c > 0) → 오른쪽 끝
+    [0.0, -40.0, 1.0, 0.0, 0.0],        # 아래로 볼록, 꼭짓점 (20시) 이 안쪽 → 왼쪽 끝
+    [10.0, 5.0, 0.0, 1.0, 1.0],         # 1차식 (c = 0)
+    [0.0, 100.0, -1.0, 0.0, 0.0],       # 꼭짓점 (50시) 이 운행 시간 밖
+])
+def test_peak_array_matches_brute_force(row):
+    row = np.asarray(row)
+    peak_time, peak_value = crowd_engine.peak_array(row, 2, 7)
+    grid_time, grid_value = _brute_peak(row, 2, 7)
+    assert peak_value == pytest.approx(grid_value, abs=1e-3)
+    assert peak_value >= grid_value - 1e-9
+    assert peak_time == pytest.approx(grid_time, abs=1e-3)
+
+
+def test_peak_array_broadcasts_over_stations():
+    weekdays = np.arange(7)[:, None]
+    peak_time, peak_value = crowd_engine.peak_array(COEFFICIENTS, weekdays, 9)
+    assert peak_value.shape == (7, len(STATIONS))
+    for w in range(7):
+        for i, row in enumerate(COEFFICIENTS):
+            assert peak_value[w, i] == pytest.approx(_brute_peak(row, w, 9)[1], abs=1e-3)
+
+
+def test_daily_peak_is_cached():
+    crowd_engine.daily_peak.cache_clear()
+    row = tuple(COEFFICIENTS[0].tolist())
+    first = crowd_engine.daily_peak(row, 0, 9)
+    assert crowd_engine.daily_peak(row, 0, 9) == first
+    assert crowd_engine.daily_peak.cache_info().hits == 1
+    assert crowd_engine.daily_max("강남역", 0, 9) == first[1]
+    assert first[1] == pytest.approx(_brute_peak(COEFFICIENTS[0], 0, 9)[1], abs=1e-3)
+
+
+# ------------------------
+# 하루 최대값 정규화 ("daily_peak" 모델)
+# ------------------------
+@pytest.mark.parametrize("variant", ["streamlit_app", "streamlit_app3"])
+def test_daily_peak_normalisation_replaces_the_scan(variant):
+    import congestion_model
+    model = congestion_model.get_model(variant)
+    for station in model.stations:
+        row = model.coefficients[model.row(station)]
+        for weekday in range(7):
+            for month in (1, 6, 12):
+                peak = model.max_value(station, weekday, month)
+                # 예전 앱의 0.1시간 간격 190점 훑기 — 닫힌 식은 그 최대값 이상이고 격자 오차 안에서 같다
+                scan = max(float(crowd_engine.predict_array(0, t, weekday, month, row[None], clip=False))
+                           for t in np.arange(5, 24, 0.1))
+                assert scan - 1e-6 <= peak <= scan + abs(row[2]) * 0.05 ** 2 + 1e-6
+        # 최대 시각의 CDI 는 정확히 1
+        peak_time = crowd_engine.daily_peak(tuple(row.tolist()), 0, 9)[0]
+        assert model.cdi(station, model.predict(station, peak_time, 0, 9), 0, 9) == pytest.approx(1.0)
+
+
+def test_daily_peak_vector_path_matches_scalar():
+    import congestion_model
+    model = congestion_model.get_model("streamlit_app")
+    rng = np.random.default_rng(4)
+    n = 500
+    rows, times = rng.integers(0, 4, n), rng.uniform(5, 24, n)
+    weekdays, months = rng.integers(0, 7, n), rng.integers(1, 13, n)
+    _, cdi, _ = model.score_array(rows, times, weekdays, months)
+    for i in range(n):
+        station = model.artifact.stations[rows[i]]     # score_array 는 모델 파일의 행 번호
+        pred = round(model.predict(station, times[i], weekdays[i], months[i]))
+        assert cdi[i] == round(pred / model.max_value(station, int(weekdays[i]), int(months[i])), 2)
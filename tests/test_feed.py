@@ -0,0 +1,85 @@
+import datetime
+
+import pytest
+
+import api_server
+import congestion_model
+import model_artifact
+
+
+@pytest.fixture
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(congestion_model, "_snapshot", congestion_model.Snapshot(model_artifact.builtin_artifact()))
+    monkeypatch.setattr(congestion_model, "_nowcasters", {})
+    monkeypatch.setattr(congestion_model, "_drift_monitors", {})
+    monkeypatch.setattr(congestion_model, "_feed", None)
+
+
+def test_feed_corrects_live_predictions(fresh_state, tmp_path):
+    model = congestion_model.get_model()
+    base = model.predict("강남", 17.5, 0, 9)
+    feed = tmp_path / "feed.txt"
+    feed.write_text(f"강남,2025-09-22T17:30,{base + 1000}\n잘못된 줄\n없는역,2025-09-22T17:30,1\n", encoding="utf-8")
+    thread = congestion_model.start_nowcast_feed(str(feed), follow=False)
+    thread.join(5)
+    assert not thread.is_alive()
+
+    when = datetime.datetime(2025, 9, 22, 17, 30)
+    assert model.predict("강남", 17.5, 0, 9, when) == pytest.approx(base + 1000)
+    assert model.predict("사당", 17.5, 0, 9, when) == model.predict("사당", 17.5, 0, 9)
+
+    client = api_server.TestClient()
+    live = client.get("/predict?station=강남&date=2025-09-22&time=17:30&live=1").json()
+    plain = client.get("/predict?station=강남&date=2025-09-22&time=17:30").json()
+    client.close()
+    assert live["pred"] - plain["pred"] in (999, 1000, 1001)
+
+
+def test_drift_reported_on_metrics(fresh_state):
+    import numpy as np
+
+    monitor = congestion_model.get_drift_monitor("standard")
+    rng = np.random.default_rng(0)
+    rows = np.zeros(600, dtype=int)
+    hours = np.full(600, 8.0)
+    monitor.update_many(rows[:400], hours[:400], rng.normal(0, 10, 400))
+    monitor.update_many(rows[400:], hours[400:], rng.normal(0, 10, 200))
+    assert congestion_model.drift_report() == {"standard": []}
+    monitor.update_many(rows[400:], hours[400:], rng.normal(200, 10, 200))
+    assert [cell[:2] for cell in congestion_model.drift_report()["standard"]] == [("강남", "출근")]
+
+    client = api_server.TestClient()
+    drift = client.get("/metrics").json()["drift"]
+    client.close()
+    assert drift["standard"][0]["station"] == "강남" and drift["standard"][0]["z"] > 4
+
+    # 재학습한 (계보가 다른) 모델로 바뀌면 새 모니터로 다시 시작하고, 이전 모델의 경고는 보이지 않는다
+    retrained = model_artifact.builtin_artifact()
+    retrained.model_version = retrained.meta["model_version"] = "retrained"
+    congestion_model._publish(congestion_model.Snapshot(retrained))
+    assert congestion_model.drift_report() == {}
+    assert congestion_model.get_drift_monitor("standard") is not monitor
+
+
+def test_drift_baseline_survives_online_publishes(fresh_state, tmp_path):
+    # online_rls 가 1분마다 계수만 바꿔 다시 쓰는 동안에도 기준 통계가 쌓여 드리프트를 잡는다
+    import numpy as np
+
+    import online_rls
+    base = congestion_model.get_artifact()
+    rls = online_rls.OnlineRLS(base.stations, base.coefficient_sets["standard"])
+    path = str(tmp_path / "crowd_model.bin")
+    rng = np.random.default_rng(0)
+    first = congestion_model.get_drift_monitor("standard")
+    for minute in range(6):
+        # 발행 사이에 관측 100개 — min_baseline (400) 보다 적다
+        congestion_model.get_drift_monitor("standard").update_many(np.zeros(100, int), np.full(100, 8.0),
+                                                                   rng.normal(0, 10, 100))
+        rls.update("강남", datetime.datetime(2025, 9, 22, 8, minute), 5000)
+        online_rls.publish(rls, congestion_model.get_artifact(), path)
+        congestion_model._publish(congestion_model.Snapshot(congestion_model.load_artifact(path)))
+        assert congestion_model.get_artifact().meta["online"]["base_version"] == base.model_version
+    monitor = congestion_model.get_drift_monitor("standard")
+    assert monitor is first and monitor.base_n[0, 1] >= 400
+    monitor.update_many(np.zeros(200, int), np.full(200, 8.0), rng.normal(200, 10, 200))
+    assert [cell[:2] for cell in congestion_model.drift_report()["standard"]] == [("강남", "출근")]
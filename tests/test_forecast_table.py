@@ -0,0 +1,101 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import congestion_model
+import forecast_table
+import model_artifact
+from congestion_model import ModelWatcher, StationModel, get_artifact, get_recommendations
+from crowd_engine import predict_array
+
+
+def test_lookup_matches_model(tmp_path):
+    table = forecast_table.load_or_build(str(tmp_path / "t.bin"))
+    assert table.counts.shape == (4, 7, 12, 24 * 60 // forecast_table.SLOT_MINUTES)
+    pred, grade = table.lookup("강남역", 0, 9, table.slot(17, 30))
+    assert pred == round(float(predict_array(0, 17.5, 0, 9)))
+
+
+def test_rebuilds_when_parameters_change(tmp_path):
+    path = str(tmp_path / "t.bin")
+    first = forecast_table.load_or_build(path)
+    assert forecast_table.load_or_build(path).params == first.params
+    halved = {k: v / 2 for k, v in forecast_table.DEFAULT_MAX_VALUES.items()}
+    rebuilt = forecast_table.load_or_build(path, max_values=halved)
+    assert rebuilt.params != first.params
+    assert (rebuilt.grades >= first.grades).all() and (rebuilt.grades > first.grades).any()
+    coarse = forecast_table.load_or_build(path, max_values=halved, slot_minutes=15)
+    assert coarse.slot_minutes == 15 and coarse.n_slots == 96
+
+
+def test_rebuilds_old_format(tmp_path):
+    path = tmp_path / "t.bin"
+    path.write_bytes(b"CRWDTBL1" + bytes(100))
+    assert forecast_table.load_or_build(str(path)).params == forecast_table.params_digest()
+
+
+@pytest.mark.parametrize("variant", ["streamlit_app6", "streamlit_app3"])
+def test_model_table_matches_score_array(variant):
+    # 고정 기준값 / 하루 최대값 기준 변형 모두 테이블의 인원 / 등급이 배열 계산과 같다
+    model = StationModel(variant, get_artifact())
+    table = model.build_table()
+    assert table is not None and table.slot_minutes == 1
+    rows, weekdays, months, minutes = (a.ravel() for a in np.meshgrid(
+        np.arange(4), np.arange(7), np.arange(1, 13), np.arange(0, 1440, 7), indexing="ij"))
+    pred, _, grade = model.score_array(rows, minutes / 60, weekdays, months)
+    assert np.array_equal(table.counts[rows, weekdays, months - 1, minutes], pred)
+    assert np.array_equal(table.grades[rows, weekdays, months - 1, minutes], grade)
+
+
+def test_score_with_and_without_table(monkeypatch):
+    with_table = StationModel("streamlit_app7", get_artifact())
+    assert with_table.build_table() is not None and with_table.table() is not None
+    monkeypatch.setattr(congestion_model, "TABLE_DIR", "")
+    computed = StationModel("streamlit_app7", get_artifact())
+    assert computed.build_table() is None and computed.table() is None
+    for station, hour, minute in [("강남", 17, 30), ("서울역", 8, 5), ("사당역", 0, 0), ("홍대입구", 23, 59)]:
+        assert with_table.score(station, 4, 11, hour, minute) == computed.score(station, 4, 11, hour, minute)
+    date = datetime.date(2025, 12, 31)
+    assert (get_recommendations("강남", date, 23.5, model=with_table, window_minutes=60)
+            == get_recommendations("강남", date, 23.5, model=computed, window_minutes=60))
+
+
+def test_table_is_built_off_the_request_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(congestion_model, "TABLE_DIR", str(tmp_path))
+    model = StationModel("streamlit_app6", get_artifact())
+    # 첫 호출은 기다리지 않고 None (계산으로 대신) — 만드는 건 백그라운드 스레드
+    assert model.table() is None and model.table_requested
+    model._table_thread.join()
+    assert model.table() is not None
+    assert model.score("강남", 4, 11, 17, 30) == StationModel("streamlit_app6", get_artifact()).score("강남", 4, 11, 17, 30)
+
+
+def test_watcher_builds_tables_before_the_swap(tmp_path, monkeypatch):
+    monkeypatch.setattr(congestion_model, "TABLE_DIR", str(tmp_path / "tables"))
+    monkeypatch.setattr(congestion_model, "_snapshot", None)
+    path = str(tmp_path / "crowd_model.bin")
+    stations, coefficient_sets, variants = model_artifact.builtin_tables()
+    model_artifact.write_artifact(path, stations, coefficient_sets, variants, model_version="v1")
+    watcher = ModelWatcher(path)
+    congestion_model._publish(congestion_model.Snapshot(congestion_model.load_artifact(path)))
+    used = congestion_model.get_model("streamlit_app6")
+    first = used.build_table()
+
+    # 계수가 같은 새 버전: 이전 테이블을 그대로 쓴다
+    model_artifact.write_artifact(path, stations, coefficient_sets, variants, model_version="v2")
+    assert watcher.check()
+    same = congestion_model.get_model("streamlit_app6")
+    assert same.model_version == "v2" and same._table is first
+    # 쓰지 않던 변형은 만들지 않는다
+    assert not congestion_model.get_model("streamlit_app3").table_requested
+
+    # 계수가 바뀌면 교체 전에 새로 만든다 — 교체 직후 첫 요청부터 테이블
+    coefficient_sets = dict(coefficient_sets, standard=np.array(coefficient_sets["standard"]) * 1.1)
+    model_artifact.write_artifact(path, stations, coefficient_sets, variants, model_version="v3")
+    assert watcher.check()
+    rebuilt = congestion_model.get_model("streamlit_app6")
+    table = rebuilt.table()
+    assert table is not None and table is not first and table.params != first.params
+    pred, _, grade = rebuilt.score_array(np.array([0]), np.array([17.5]), np.array([4]), np.array([11]))
+    assert table.counts[0, 4, 10, 17 * 60 + 30] == pred[0] and table.grades[0, 4, 10, 17 * 60 + 30] == grade[0]
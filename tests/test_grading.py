@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pytest
+
+import congestion_model
+import grading
+from grading import GRADE_TABLES
+
+
+def _ladder(cdi, cutoffs):
+    # 앱마다 적던 if/elif 사다리
+    for code in range(len(cutoffs), 0, -1):
+        if cdi >= cutoffs[code - 1]:
+            return code
+    return 0
+
+
+@pytest.mark.parametrize("name", sorted(GRADE_TABLES))
+def test_tables_are_well_formed(name):
+    table = GRADE_TABLES[name]
+    assert len(table.cutoffs) == 4 and list(table.cutoffs) == sorted(set(table.cutoffs))
+    assert len(table.labels) == len(table.colors) == len(table.icons) == len(table.cutoffs) + 1
+
+
+@pytest.mark.parametrize("name", sorted(GRADE_TABLES))
+def test_codes_match_the_if_elif_ladder(name):
+    cutoffs = GRADE_TABLES[name].cutoffs
+    rng = np.random.default_rng(0)
+    # 하한값 자체와 바로 아래 값도 넣는다 (">=" 경계)
+    cube = np.concatenate([rng.uniform(-0.1, 1.3, 600 * 7 * 4), cutoffs, np.nextafter(cutoffs, -np.inf)])
+    codes = grading.grade_codes(cube, name)
+    expected = [_ladder(c, cutoffs) for c in cube.tolist()]
+    assert codes.tolist() == expected
+    assert [grading.grade_code(c, name) for c in cube.tolist()] == expected
+    # 모양은 입력 그대로 (역 x 요일 x 시각)
+    assert grading.grade_codes(cube[:600 * 7 * 4].reshape(600, 7, 4), name).shape == (600, 7, 4)
+
+
+def test_labels_colors_and_icons():
+    assert grading.grade_label(0.95) == "매우혼잡" and grading.grade_label(0.1) == "여유"
+    assert grading.grade_label(0.8, labels=grading.SPACED_LABELS) == "혼잡"
+    assert grading.grade_label(0.8, "peak") == "약간혼잡"
+    assert grading.grade_color(0.3) == "green" and grading.grade_icon(0.9) == "🔴"
+    codes = grading.grade_codes(np.array([[0.0, 0.5], [0.7, 1.0]]))
+    assert grading.grade_labels(codes).tolist() == [["여유", "약간혼잡"], ["혼잡", "매우혼잡"]]
+    assert grading.grade_labels(codes, labels=grading.SPACED_LABELS)[1, 1] == "매우 혼잡"
+    # NaN 은 배열 / 값 하나 모두 같은 (맨 위) 코드
+    assert grading.grade_codes(np.array([math.nan]))[0] == grading.grade_code(math.nan) == 4
+
+
+def test_models_grade_with_their_table():
+    # get_table 은 cutoffs / labels 를 가진 모델도 받는다
+    model = congestion_model.get_model("streamlit_app")
+    assert model.cutoffs == GRADE_TABLES["peak"].cutoffs
+    assert grading.grade_code(0.9, model) == model.grade(0.9) == 3
+    assert grading.grade_label(0.9, model) == model.labels[3]
+    names = {table.cutoffs: name for name, table in GRADE_TABLES.items()}
+    for variant, spec in congestion_model.VARIANTS.items():
+        assert tuple(spec["cutoffs"]) in names, variant
@@ -0,0 +1,51 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import ingest
+from history_store import HistoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    # 강남 2호선 / 신분당선 두 호선, 이틀, 두 시각
+    rows = []
+    for line, scale in (("2호선", 1), ("신분당선", 10)):
+        for day in (1, 2):
+            for hour in (8, 9):
+                rows.append({"station": "강남", "line": line, "date": pd.Timestamp(2025, 3, day), "hour": hour,
+                             "boardings": scale * (100 * day + hour), "alightings": scale * hour, "days": 1,
+                             "month": 202503})
+    df = pd.DataFrame(rows).astype({"hour": np.int8, "boardings": np.uint32, "alightings": np.uint32,
+                                    "days": np.int8, "month": np.int32})
+    df["line"] = df["line"].astype("category")
+    root = str(tmp_path / "history")
+    ingest.write_partitions(df, root, "t")
+    return HistoryStore(root)
+
+
+def test_query_sums_lines_by_name(store):
+    rows = store.query("강남역", "2025-03-01", "2025-03-02")
+    assert rows["station"].tolist() == ["강남"] * 4
+    assert rows["hour"].tolist() == [8, 9, 8, 9]
+    assert rows["boardings"].tolist() == [11 * (100 * d + h) for d in (1, 2) for h in (8, 9)]
+    assert rows["alightings"].tolist() == [11 * h for _ in (1, 2) for h in (8, 9)]
+    # 값 열 순서를 바꿔도 각 열이 제 이름의 합을 받는다
+    swapped = store.query("강남", values=["alightings", "boardings"])
+    assert swapped["boardings"].tolist() == rows["boardings"].tolist()
+    assert swapped["alightings"].tolist() == rows["alightings"].tolist()
+
+
+def test_query_filters(store):
+    assert len(store.query("강남", "2025-03-02", "2025-03-02", hours=(9, 10))["date"]) == 1
+    assert len(store.query("강남", by_line=True)["line"]) == 8
+    assert store.query(start=datetime.date(2025, 4, 1))["date"].size == 0
+    assert store.stations() == ["강남"]
+
+
+def test_hourly_mean_and_reference(store):
+    mean = store.hourly_mean("강남")
+    assert mean[8] == 11 * (150 + 8) and np.isnan(mean[0])
+    assert store.reference_max(["강남"], q=1.0) == {"강남": float(11 * 209)}
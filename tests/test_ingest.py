@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+import ingest
+from history_store import HistoryStore
+from train import accumulate, input_units, read_partition
+
+HOURS = [5, 6, 7]
+
+
+def source(path, date_col, dates, scale):
+    rows = []
+    for i, date in enumerate(dates):
+        row = {date_col: date, "호선명": "2호선", "지하철역": "강남"}
+        for h in HOURS:
+            row[f"{h:02d}시-{h + 1:02d}시 승차인원"] = f"{scale * (h + i):,}"
+            row[f"{h:02d}시-{h + 1:02d}시 하차인원"] = str(scale * h // 2)
+        rows.append(row)
+    pd.DataFrame(rows).to_csv(path, index=False, encoding=ingest.ENCODING)
+    return str(path)
+
+
+@pytest.fixture
+def history(tmp_path):
+    daily = source(tmp_path / "daily.csv", "사용일자", ["20250301", "20250302"], 100)
+    monthly = source(tmp_path / "monthly.csv", "사용월", ["202502", "202503"], 2800)
+    root = str(tmp_path / "history")
+    assert ingest.ingest([daily, monthly], root) == 4 * len(HOURS)
+    return root
+
+
+def test_melt_daily():
+    df = pd.DataFrame({"사용일자": ["20250301"], "호선명": ["2호선"], "지하철역": ["강남역"],
+                       "05시-06시 승차인원": ["1,234"], "05시-06시 하차인원": [""]})
+    hours = ingest.hour_columns(df.columns)
+    out = ingest.melt_chunk(df, hours, "사용일자", "호선명", "지하철역")
+    assert out[["station", "hour", "boardings", "alightings", "days", "month"]].values.tolist() == \
+        [["강남", 5, 1234, 0, 1, 202503]]
+
+
+def test_monthly_rows_are_daily_averages(history):
+    store = HistoryStore(history)
+    rows = store.query("강남", "2025-02-01", "2025-02-01")
+    # 2월 합계 2800 * h 를 28일로 나눈 값
+    assert rows["boardings"].tolist() == [100 * h for h in HOURS]
+    march = store.query("강남", "2025-03-01", "2025-03-01", by_line=True)
+    # 3월 1일: 일 단위 행 (100 * h) 과 월 평균 행 (2800 * (h + 1) / 31) 이 따로 남는다
+    assert sorted(march["boardings"].tolist()) == sorted([100 * h for h in HOURS]
+                                                         + [round(2800 * (h + 1) / 31) for h in HOURS])
+    daily = store.query("강남", "2025-02-01", "2025-03-31", daily_only=True)
+    assert set(daily["date"].astype(str)) == {"2025-03-01", "2025-03-02"}
+
+
+def test_training_skips_monthly_rows(history):
+    feb, march = input_units([history])
+    columns = ["station", "date", "hour", "boardings"]
+    assert feb.endswith("month=202502") and read_partition(feb, columns).empty
+    assert len(read_partition(march, columns)) == 2 * len(HOURS)
+    assert accumulate(feb).n.sum() == 0
@@ -0,0 +1,97 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import crowd_engine
+from crowd_engine import COEFFICIENTS, STATIONS
+from intervals import below_intervals, comfort_intervals, format_interval
+
+GRID = np.arange(0, 24 * 600) / 600      # 6초 간격
+
+
+def _inside(intervals, t):
+    return np.any([(lo <= t) & (t <= hi) for lo, hi in intervals], axis=0) if intervals else np.zeros(t.shape, bool)
+
+
+def _near_edge(intervals, t, tol=1e-6):
+    edges = np.array([x for interval in intervals for x in interval] or [np.inf])
+    return np.abs(t[:, None] - edges).min(axis=1) < tol
+
+
+@pytest.mark.parametrize("station", range(len(STATIONS)))
+@pytest.mark.parametrize("fraction", [0.001, 0.3, 0.5, 0.7, 0.9, 1.1])
+def test_intervals_match_a_dense_scan(station, fraction):
+    # 5시 이전 보정 / 0 아래 자르기까지 포함한 실제 예측값과 6초 간격으로 비교
+    row = tuple(COEFFICIENTS[station].tolist())
+    for weekday, month in [(0, 1), (4, 9), (6, 12)]:
+        limit = fraction * crowd_engine.daily_peak(row, weekday, month)[1]
+        found = below_intervals(row, weekday, month, limit)
+        below = crowd_engine.predict_array(station, GRID, weekday, month) < limit
+        check = ~_near_edge(found, GRID)
+        assert np.array_equal(_inside(found, GRID)[check], below[check])
+        # 구간 폭의 합 = 기준 미만인 시간의 길이
+        width = sum(hi - lo for lo, hi in found)
+        assert width == pytest.approx(below.mean() * 24, abs=2 / 600)
+
+
+def test_interval_edges_are_where_the_prediction_crosses():
+    row = tuple(COEFFICIENTS[0].tolist())
+    limit = 0.7 * crowd_engine.daily_peak(row, 0, 9)[1]
+    found = below_intervals(row, 0, 9, limit)
+    edges = [x for interval in found for x in interval if 5 < x < 24]
+    assert edges
+    for t in edges:
+        assert crowd_engine.predict_array(0, t, 0, 9) == pytest.approx(limit, rel=1e-9)
+
+
+def test_before_five_follows_the_five_oclock_value():
+    # 사당은 5시 예측이 양수
+    row = tuple(COEFFICIENTS[2].tolist())
+    at_five = float(crowd_engine.predict_array(2, 5.0, 0, 9))
+    assert at_five > 0
+    # 5시가 기준 미만이면 자정부터 이어진다
+    found = below_intervals(row, 0, 9, at_five + 1)
+    assert found[0][0] == 0.0 and found[0][1] > 5
+    # 5시가 기준 이상이면 5시 이전도 기준 이상
+    found = below_intervals(row, 0, 9, at_five - 1)
+    assert all(lo > 5 for lo, _ in found)
+
+
+def test_clipped_predictions_near_zero():
+    # 강남 5시는 2차식이 음수라 예측이 0 으로 잘린다
+    row = tuple(COEFFICIENTS[0].tolist())
+    assert crowd_engine.predict_array(0, 5.0, 0, 9, clip=False) < 0
+    assert crowd_engine.predict_array(0, 5.0, 0, 9) == 0.0
+    # 0 은 어떤 양수 기준보다도 작다 — 자정부터 이어진다
+    assert below_intervals(row, 0, 9, 1.0)[0][0] == 0.0
+    # 0 이하 기준 밑으로는 내려가지 않는다
+    assert below_intervals(row, 0, 9, 0.0) == []
+    assert below_intervals(row, 0, 9, -1.0) == []
+
+
+def test_degenerate_rows():
+    # 2차항 / 1차항이 0 인 행
+    assert below_intervals((100.0, 0.0, 0.0, 0.0, 0.0), 0, 1, 200) == [(0.0, 24.0)]
+    assert below_intervals((100.0, 0.0, 0.0, 0.0, 0.0), 0, 1, 50) == []
+    assert below_intervals((0.0, 10.0, 0.0, 0.0, 0.0), 0, 1, 120) == [(0.0, 12.0)]
+    # 근이 없고 위로 볼록 — 하루 종일 기준 미만
+    assert below_intervals((10.0, 0.0, -1.0, 0.0, 0.0), 0, 1, 20) == [(0.0, 24.0)]
+
+
+def test_comfort_levels():
+    date = datetime.date(2025, 9, 22)
+    max_value = crowd_engine.daily_max("강남", date.weekday(), date.month)
+    assert comfort_intervals("강남", date, 0, max_value) == []
+    assert comfort_intervals("강남", date, 5, max_value) == [(0.0, 24.0)]
+    relaxed = comfort_intervals("강남", date, 4, max_value)
+    strict = comfort_intervals("강남역", date, 1, max_value)
+    assert sum(hi - lo for lo, hi in strict) < sum(hi - lo for lo, hi in relaxed)
+
+
+def test_format_rounds_inward():
+    assert format_interval((0.0, 24.0)) == "00:00 ~ 23:59"
+    assert format_interval((7.5, 9.5)) == "07:30 ~ 09:30"
+    assert format_interval((7.501, 9.499)) == "07:31 ~ 09:29"
+    # 부동소수 오차로 분 경계를 살짝 넘은 값은 그 분으로
+    assert format_interval((7.5 + 1e-12, 9.5 - 1e-12)) == "07:30 ~ 09:30"
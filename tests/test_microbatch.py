@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import pytest
+
+from microbatch import DELAY_MS_BOUNDS, Histogram, MicroBatcher
+
+
+class Recorder:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        if self.fail:
+            raise RuntimeError("계산 실패")
+        return [item * 10 for item in items]
+
+
+def test_flushes_when_the_batch_is_full():
+    async def run():
+        fn = Recorder()
+        # 지연 한도가 길어도 max_size 개가 차면 바로 계산한다
+        batcher = MicroBatcher(fn, max_size=4, max_delay=10)
+        start = time.perf_counter()
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(4))), 1)
+        assert time.perf_counter() - start < 1
+        assert results == [0, 10, 20, 30] and fn.batches == [[0, 1, 2, 3]]
+        assert batcher.stats()["batch_size"]["count"] == 1
+    asyncio.run(run())
+
+
+def test_flushes_after_the_delay():
+    async def run():
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_size=100, max_delay=0.05)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+        elapsed = time.perf_counter() - start
+        assert results == [0, 10, 20] and fn.batches == [[0, 1, 2]]
+        assert 0.04 <= elapsed < 1
+        delay = batcher.stats()["queue_delay_ms"]
+        assert delay["count"] == 3 and delay["mean"] >= 40
+        # 타이머는 한 번 쓰고 비운다 — 다음 요청은 새 배치
+        assert await batcher.submit(7) == 70 and fn.batches[-1] == [7]
+    asyncio.run(run())
+
+
+def test_results_keep_submission_order_across_batches():
+    async def run():
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_size=4, max_delay=0.01)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        assert results == [i * 10 for i in range(10)]
+        assert fn.batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    asyncio.run(run())
+
+
+def test_zero_delay_computes_each_request_alone():
+    async def run():
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_size=100, max_delay=0)
+        assert await asyncio.gather(*(batcher.submit(i) for i in range(3))) == [0, 10, 20]
+        assert fn.batches == [[0], [1], [2]]
+    asyncio.run(run())
+
+
+def test_failure_reaches_every_waiter():
+    async def run():
+        fn = Recorder(fail=True)
+        batcher = MicroBatcher(fn, max_size=100, max_delay=0.01)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)), return_exceptions=True)
+        assert len(fn.batches) == 1
+        assert all(isinstance(r, RuntimeError) and str(r) == "계산 실패" for r in results)
+        # 실패한 뒤에도 다음 배치는 정상으로 계산한다
+        fn.fail = False
+        assert await batcher.submit(3) == 30
+    asyncio.run(run())
+
+
+def test_wrong_result_count_fails_the_batch():
+    async def run():
+        batcher = MicroBatcher(lambda items: items[:-1], max_size=3, max_delay=10)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True), 1)
+        assert all(isinstance(r, ValueError) for r in results)
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_does_not_block_the_rest():
+    async def run():
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_size=100, max_delay=0.02)
+        tasks = [asyncio.ensure_future(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert results[0] == 0 and results[2] == 20
+        assert isinstance(results[1], asyncio.CancelledError)
+    asyncio.run(run())
+
+
+def test_histogram_buckets_and_quantiles():
+    hist = Histogram(DELAY_MS_BOUNDS)
+    assert hist.snapshot()["p50"] == 0.0
+    for value in [0.05] * 50 + [3] * 40 + [1000] * 10:
+        hist.observe(value)
+    snap = hist.snapshot()
+    assert snap["count"] == 100 and snap["buckets"]["0.1"] == 50 and snap["buckets"]["+Inf"] == 100
+    assert snap["p50"] == 0.1 and snap["p90"] == 5 and snap["p99"] is None
+    assert snap["sum"] == pytest.approx(0.05 * 50 + 3 * 40 + 1000 * 10)
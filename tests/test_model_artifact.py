@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pytest
+
+import congestion_model
+import model_artifact
+from congestion_model import ModelWatcher
+
+
+@pytest.fixture
+def exported(tmp_path):
+    path = str(tmp_path / "src.bin")
+    model_artifact.write_artifact(path, *model_artifact.builtin_tables(), model_version="v1")
+    return path
+
+
+def test_round_trip(exported):
+    artifact = model_artifact.load_artifact(exported)
+    builtin = model_artifact.builtin_artifact()
+    assert artifact.model_version == "v1" and artifact.stations == builtin.stations
+    for name, coefficients in builtin.coefficient_sets.items():
+        assert np.array_equal(artifact.coefficient_sets[name], coefficients)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "x.bin"
+    path.write_bytes(b"not a model" * 10)
+    with pytest.raises(ValueError):
+        model_artifact.load_artifact(str(path))
+
+
+def test_install_replaces_by_rename(exported, tmp_path):
+    dest = str(tmp_path / "models" / "crowd_model.bin")
+    assert model_artifact.install_artifact(exported, dest) == "v1"
+    first = model_artifact.load_artifact(dest)
+    inode = os.stat(dest).st_ino
+    assert model_artifact.install_artifact(exported, dest) == "v1"
+    assert os.stat(dest).st_ino != inode
+    # 이미 읽은 모델은 옛 파일을 계속 본다
+    assert first.model_version == "v1" and first.coefficient_sets["standard"].shape == (4, 5)
+    with pytest.raises(ValueError):
+        bad = tmp_path / "bad.bin"
+        bad.write_bytes(b"x" * 64)
+        model_artifact.install_artifact(str(bad), dest)
+    assert model_artifact.load_artifact(dest).model_version == "v1"
+
+
+def test_watcher_reloads_and_flags_in_place_writes(exported, tmp_path, monkeypatch):
+    monkeypatch.setattr(congestion_model, "_snapshot", None)
+    dest = str(tmp_path / "crowd_model.bin")
+    model_artifact.install_artifact(exported, dest)
+    watcher = ModelWatcher(dest)
+    assert not watcher.check()
+
+    model_artifact.write_artifact(dest, *model_artifact.builtin_tables(), model_version="v2")
+    assert watcher.check() and congestion_model.get_model().model_version == "v2"
+    assert watcher.in_place == 0 and watcher.last_error is None
+
+    with open(exported, "rb") as src, open(dest, "r+b") as f:
+        f.write(src.read())
+    os.utime(dest, ns=(0, 0))
+    assert watcher.check() and congestion_model.get_model().model_version == "v1"
+    assert watcher.in_place == 1 and "이름 바꾸기" in watcher.last_error
+
+
+def test_builtin_version_follows_the_tables(monkeypatch):
+    import crowd_engine
+    version = model_artifact.builtin_artifact().model_version
+    assert version.startswith("builtin-") and model_artifact.builtin_artifact().model_version == version
+    # 코드의 계수가 바뀐 배포에서는 버전 (= API 의 ETag) 도 바뀐다
+    monkeypatch.setattr(crowd_engine, "COEFFICIENTS", crowd_engine.COEFFICIENTS * 1.01)
+    assert model_artifact.builtin_artifact().model_version != version
+
+
+def _write_versions(path, worker, times):
+    for i in range(times):
+        model_artifact.write_artifact(path, *model_artifact.builtin_tables(), model_version=f"w{worker}-{i}")
+    return worker
+
+
+def test_concurrent_writers_do_not_share_a_temp_file(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+    path = str(tmp_path / "crowd_model.bin")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        assert sorted(pool.map(_write_versions, [path] * 4, range(4), [30] * 4)) == [0, 1, 2, 3]
+    # 마지막에 이름을 바꾼 쪽의 완성된 파일이 남고 임시 파일은 남지 않는다
+    assert model_artifact.load_artifact(path).model_version.endswith("-29")
+    assert os.listdir(tmp_path) == ["crowd_model.bin"]
@@ -0,0 +1,43 @@
+import threading
+
+import numpy as np
+
+from congestion_model import get_model
+from crowd_engine import peak_array, predict_array
+from network import Network, synthetic_network
+
+
+def test_matches_station_model():
+    model = get_model("streamlit_app6")
+    network = Network.from_model(model)
+    pred, cdi, _ = network.status(17.5, 0, 9)
+    assert np.allclose(pred, predict_array(np.arange(4), 17.5, 0, 9))
+    assert np.allclose(cdi, pred / np.asarray(model.max_values))
+
+
+def test_least_crowded_order():
+    network = synthetic_network(50)
+    result = network.least_crowded(8.0, 2, 3, k=5)
+    cdis = [cdi for _, _, cdi, _ in result]
+    assert len(result) == 5 and cdis == sorted(cdis)
+
+
+def test_max_values_for_concurrent_keys():
+    # 여러 스레드가 서로 다른 (요일, 월) 을 번갈아 물어도 항상 자기 날의 기준값을 받는다
+    network = synthetic_network(200)
+    expected = {(w, m): peak_array(network.coefficients, w, m)[1] for w in range(7) for m in (1, 7)}
+    wrong = []
+
+    def worker(keys):
+        for _ in range(200):
+            for w, m in keys:
+                if not np.array_equal(network.max_values_for(w, m), expected[w, m]):
+                    wrong.append((w, m))
+
+    keys = list(expected)
+    threads = [threading.Thread(target=worker, args=(keys[i::4],)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not wrong
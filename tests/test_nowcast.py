@@ -0,0 +1,91 @@
+import datetime
+import math
+
+import pytest
+
+from nowcast import Nowcaster
+
+T0 = datetime.datetime(2025, 9, 22, 8, 0)
+
+
+def at(minutes):
+    return T0 + datetime.timedelta(minutes=minutes)
+
+
+def test_no_observations():
+    nowcaster = Nowcaster(["강남"])
+    assert nowcaster.correction("강남", T0) == 0.0
+    assert nowcaster.correction("없는역", T0) == 0.0
+    assert nowcaster.correct("강남", T0, 100.0) == 100.0
+
+
+def test_single_observation_decays():
+    nowcaster = Nowcaster(["강남"], tau_minutes=60, horizon_minutes=180)
+    nowcaster.observe("강남", T0, 1200, 1000)
+    assert nowcaster.correction("강남", T0) == pytest.approx(200)
+    assert nowcaster.correction("강남", at(60)) == pytest.approx(200 * math.exp(-1))
+    assert nowcaster.correction("강남", at(-30)) == pytest.approx(200 * math.exp(-0.5))
+    assert nowcaster.correction("강남", at(181)) == 0.0
+
+
+def test_uses_every_residual_in_the_ring():
+    nowcaster = Nowcaster(["강남"], tau_minutes=60)
+    nowcaster.observe("강남", at(0), 100, 0)
+    nowcaster.observe("강남", at(60), 300, 0)
+    # 60분 시점: 가중치 e^-1 : 1 의 평균, 가장 가까운 관측이 지금이라 줄지 않는다
+    w = math.exp(-1)
+    assert nowcaster.correction("강남", at(60)) == pytest.approx((w * 100 + 300) / (w + 1))
+    # 두 관측 가운데: 같은 가중치의 평균에 30분 거리만큼 감쇠
+    assert nowcaster.correction("강남", at(30)) == pytest.approx(200 * math.exp(-0.5))
+
+
+def test_ring_keeps_only_recent():
+    nowcaster = Nowcaster(["강남"], size=4)
+    for i in range(10):
+        nowcaster.observe("강남", at(i), i, 0)
+    assert nowcaster.recent("강남").tolist() == [6, 7, 8, 9]
+    assert nowcaster.count[0] == 10
+    # 덮어쓴 관측 (0 ~ 5) 은 보정에 들어가지 않는다
+    assert 6 < nowcaster.correction("강남", at(9)) < 9
+
+
+def test_correct_never_negative():
+    nowcaster = Nowcaster(["강남"])
+    nowcaster.observe("강남", T0, 0, 500)
+    assert nowcaster.correct("강남", T0, 100.0) == 0.0
+
+
+def test_carry_over_by_station_name():
+    old = Nowcaster(["강남", "사당"])
+    old.observe("강남", T0, 1200, 1000)
+    old.observe("사당", T0, 10, 0)
+    new = Nowcaster(["신촌", "강남"])
+    new.carry_over(old)
+    assert new.correction("강남", T0) == pytest.approx(200)
+    assert new.correction("신촌", T0) == 0.0 and new.count.tolist() == [0, 1]
+
+
+def test_rebuilt_when_model_changes(monkeypatch):
+    import numpy as np
+
+    import congestion_model
+    import model_artifact
+    from crowd_engine import COEFFICIENTS
+    from train import trained_tables
+
+    monkeypatch.setattr(congestion_model, "_snapshot", congestion_model.Snapshot(model_artifact.builtin_artifact()))
+    monkeypatch.setattr(congestion_model, "_nowcasters", {})
+    first = congestion_model.get_nowcaster()
+    assert congestion_model.get_nowcaster() is first
+    congestion_model.observe("강남", T0, 9000)
+
+    stations = ["강남", "서울역", "신촌"]
+    meta, arrays = model_artifact.pack_tables(*trained_tables(stations, np.vstack([COEFFICIENTS[:2], COEFFICIENTS[3]])))
+    meta["model_version"] = "t1"
+    congestion_model._publish(congestion_model.Snapshot(model_artifact.ModelArtifact(meta, arrays)))
+    second = congestion_model.get_nowcaster()
+    assert second is not first and second.stations == stations
+    assert second.correction("강남", T0) == pytest.approx(first.correction("강남", T0))
+    # 새 역도 관측을 받는다
+    congestion_model.observe("신촌", T0, 500)
+    assert second.count[2] == 1
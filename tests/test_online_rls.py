@@ -0,0 +1,92 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from crowd_engine import COEFFICIENTS
+from online_rls import OnlineRLS
+
+
+def peaked(t, weekday):
+    # 출퇴근 봉우리 — 2차식으로는 맞지 않아 오차가 줄지 않는 (모델이 틀린) 상황
+    base = 3000 + 9000 * np.exp(-((t - 8.3) / 0.8) ** 2) + 11000 * np.exp(-((t - 18.2) / 1.0) ** 2)
+    return base * (0.6 if weekday >= 5 else 1.0)
+
+
+def replay(rls, count, n, minutes=10, seed=0):
+    rng = np.random.default_rng(seed)
+    when = datetime.datetime(2025, 1, 1, 5)
+    errors = []
+    while len(errors) < n:
+        when += datetime.timedelta(minutes=minutes)
+        t = when.hour + when.minute / 60
+        error = rls.update("강남", when, count(t, when, rng))
+        if error is None:
+            continue
+        errors.append(abs(error))
+        P = rls.P[0]
+        assert np.array_equal(P, P.T)
+        assert np.linalg.eigvalsh(P).min() > 0
+    return np.array(errors)
+
+
+def test_error_stays_bounded_at_default_lambda():
+    rls = OnlineRLS(["강남"], COEFFICIENTS[:1])
+    errors = replay(rls, lambda t, when, rng: rng.poisson(peaked(t, when.weekday())), 6000)
+    fifths = errors.reshape(5, -1).mean(axis=1)
+    assert fifths.max() < 1.2 * fifths[0]
+
+
+def test_learns_the_true_coefficients():
+    true = COEFFICIENTS[0]
+    rls = OnlineRLS(["강남"], [true * 0.8])
+
+    def count(t, when, rng):
+        return true @ [1, t, t * t, when.weekday(), when.month] + rng.normal(0, 40)
+
+    errors = replay(rls, count, 3000)
+    assert errors[-500:].mean() < 60                # 잡음 (표준편차 40) 수준
+    assert errors[:50].mean() > 4 * errors[-500:].mean()
+
+
+def test_windup_resets_covariance():
+    # 같은 시각만 계속 들어오면 다른 방향의 P 가 1/lam 배씩 커진다 — 상한에서 처음 P 로
+    rls = OnlineRLS(["강남"], COEFFICIENTS[:1], lam=0.9, max_trace=100)
+    when = datetime.datetime(2025, 9, 22, 8)
+    for _ in range(200):
+        rls.update("강남", when, 5000)
+        assert rls.P[0].trace() <= 100
+    assert rls.resets > 0
+
+
+def test_skips_unknown_stations_and_early_hours():
+    rls = OnlineRLS(["강남"], COEFFICIENTS[:1])
+    assert rls.update("없는역", datetime.datetime(2025, 9, 22, 8), 100) is None
+    assert rls.update("강남", datetime.datetime(2025, 9, 22, 4, 30), 100) is None
+    assert rls.skipped == 2 and rls.updates == 0
+    assert rls.update("강남역", datetime.datetime(2025, 9, 22, 8), 100) is not None
+
+
+def test_state_round_trip(tmp_path):
+    rls = OnlineRLS(["강남", "사당"], COEFFICIENTS[:2])
+    for hour in range(6, 23):
+        rls.update("사당", datetime.datetime(2025, 9, 22, hour), 3000)
+    path = tmp_path / "rls.npz"
+    rls.save_state(path)
+
+    restored = OnlineRLS(["사당", "강남"], COEFFICIENTS[1::-1])
+    restored.load_state(path)
+    assert restored.theta[0] == pytest.approx(rls.theta[1])
+    assert restored.P[0] == pytest.approx(rls.P[1])
+    assert restored.updates == rls.updates
+
+
+def test_old_state_keeps_initial_covariance(tmp_path):
+    # 특징을 나누기 전의 상태 파일: 계수는 이어 받고 P 는 처음 값으로
+    path = tmp_path / "old.npz"
+    np.savez(path, stations=np.array(["강남"]), theta=COEFFICIENTS[:1] + 1, P=np.eye(5)[None] * 123.0,
+             lam=0.999, updates=7)
+    rls = OnlineRLS(["강남"], COEFFICIENTS[:1], delta=2.0)
+    rls.load_state(path)
+    assert rls.theta[0] == pytest.approx(COEFFICIENTS[0] + 1)
+    assert rls.P[0] == pytest.approx(np.eye(5) * 2.0)
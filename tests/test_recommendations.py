@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+
+from congestion_model import get_model, get_recommendations
+from crowd_engine import predict_array
+from recommender import candidate_grid, recommend
+
+SUNDAY = datetime.date(2025, 9, 21)
+
+
+def test_candidate_grid_wraps_midnight():
+    offsets, minute_of_day, weekdays, months = candidate_grid(datetime.date(2025, 9, 30), 23, 50, 30, 10)
+    assert minute_of_day.tolist() == [1400, 1410, 1420, 1430, 0, 10, 20]
+    assert weekdays.tolist() == [1, 1, 1, 1, 2, 2, 2]
+    assert months.tolist() == [9, 9, 9, 9, 10, 10, 10]
+
+
+def test_recommendations_cross_midnight():
+    model = get_model("streamlit_app6")
+    recs = get_recommendations("강남", SUNDAY, 23 + 50 / 60, k=20, window_minutes=30, step_minutes=10, model=model)
+    whens = [when for when, _, _, _ in recs]
+    # 자정 뒤 후보도 빠지지 않는다 (예전에는 같은 날 안으로 잘렸다)
+    assert len(recs) == 7 and datetime.datetime(2025, 9, 22, 0, 10) in whens
+    for when, pred, cdi, level in recs:
+        expected = predict_array(0, when.hour + when.minute / 60, when.weekday(), when.month)
+        assert pred == int(round(float(expected)))
+        assert cdi == round(model.cdi("강남", pred, when.weekday(), when.month), 2)
+        assert level == model.level(cdi)
+    assert [p for _, p, _, _ in recs] == sorted(p for _, p, _, _ in recs)
+
+
+def test_daily_peak_variant_uses_each_days_max():
+    model = get_model("streamlit_app3")
+    recs = get_recommendations("강남", SUNDAY, 0.0, k=20, window_minutes=20, step_minutes=10, model=model)
+    for when, pred, cdi, _ in recs:
+        assert cdi == round(pred / model.max_value("강남", when.weekday(), when.month), 2)
+
+
+def test_recommend_uses_given_index():
+    coefficients = get_model().coefficients[::-1].copy()
+    index = {"홍대입구": 0, "사당": 1, "서울역": 2, "강남": 3}
+    a = recommend("강남", SUNDAY, 8, 0, index=index, coefficients=coefficients)
+    b = recommend("강남", SUNDAY, 8, 0)
+    assert [r.when for r in a] == [r.when for r in b]
+    assert [r.prediction for r in a] == [r.prediction for r in b]
+
+
+@pytest.mark.parametrize("window, step", [(-5, 5), (30, 0), (30, -1)])
+def test_candidate_grid_rejects_bad_ranges(window, step):
+    with pytest.raises(ValueError):
+        candidate_grid(SUNDAY, 8, 0, window, step)
+
+
+def test_time_rounding_to_midnight_rolls_into_the_next_day():
+    model = get_model("streamlit_app6")
+    recs = get_recommendations("강남", SUNDAY, 23.995, k=1, window_minutes=0, model=model)
+    assert [when for when, _, _, _ in recs] == [datetime.datetime(2025, 9, 22, 0, 0)]
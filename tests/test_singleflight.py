@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _run_followers(flight, key, fn, n):
+    # 첫 스레드가 계산을 시작한 뒤에 나머지를 띄우고, 모두 기다리기 시작하면 계산을 끝낸다
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    threads[0].start()
+    fn.started.wait(1)
+    for t in threads[1:]:
+        t.start()
+    deadline = time.monotonic() + 2
+    while flight.stats()["saved"] < n - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    fn.release.set()
+    for t in threads:
+        t.join(2)
+    return results, errors
+
+
+class Blocking:
+    def __init__(self, value=None, error=None):
+        self.calls = 0
+        self.value, self.error = value, error
+        self.started, self.release = threading.Event(), threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(2)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def test_threads_share_one_computation():
+    flight = SingleFlight()
+    fn = Blocking(value=("강남", 8.5))
+    results, errors = _run_followers(flight, ("강남", "2025-09-22", "08:30", "standard"), fn, 8)
+    assert not errors and results == [("강남", 8.5)] * 8 and fn.calls == 1
+    assert flight.stats() == {"computed": 1, "saved": 7, "in_flight": 0}
+    # 끝난 뒤에는 보관하지 않는다 — 다음 호출은 다시 계산
+    assert flight.do(("강남", "2025-09-22", "08:30", "standard"), lambda: 1) == 1
+    assert flight.stats()["computed"] == 2
+
+
+def test_threads_all_see_the_error():
+    flight = SingleFlight()
+    fn = Blocking(error=ValueError("실패"))
+    results, errors = _run_followers(flight, "k", fn, 5)
+    assert not results and len(errors) == 5 and all(e is fn.error for e in errors) and fn.calls == 1
+    assert flight.stats()["in_flight"] == 0 and flight.do("k", lambda: 2) == 2
+
+
+def test_different_keys_are_not_merged():
+    flight = SingleFlight()
+    assert [flight.do(k, lambda k=k: k * 2) for k in (1, 2, 1)] == [2, 4, 2]
+    assert flight.stats() == {"computed": 3, "saved": 0, "in_flight": 0}
+
+
+def test_async_callers_share_one_task():
+    async def run():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("k", compute) for _ in range(6)))
+        assert results == [42] * 6 and len(calls) == 1
+        assert flight.stats() == {"computed": 1, "saved": 5, "in_flight": 0}
+        assert await flight.do("k", compute) == 42 and len(calls) == 2
+    asyncio.run(run())
+
+
+def test_async_waiters_survive_a_cancelled_leader():
+    async def run():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return "ok"
+
+        leader = asyncio.ensure_future(flight.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        assert await follower == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+    asyncio.run(run())
+
+
+def test_async_error_reaches_every_caller():
+    async def run():
+        flight = AsyncSingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise KeyError("없는역")
+
+        results = await asyncio.gather(*(flight.do("k", compute) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, KeyError) for r in results) and flight.stats()["computed"] == 1
+        await asyncio.sleep(0)
+        assert flight.stats()["in_flight"] == 0
+    asyncio.run(run())
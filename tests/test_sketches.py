@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pytest
+
+from sketches import KLLSketch, StationReferences, TopN
+
+QS = np.linspace(0.01, 0.99, 99)
+
+
+def _rank_error(sketch, data):
+    # 스케치가 돌려준 값의 실제 순위 (비율) 와 요청한 q 의 차이 중 최대
+    data = np.sort(data)
+    ranks = [np.searchsorted(data, sketch.quantile(q), side="right") / len(data) for q in QS]
+    return float(np.max(np.abs(np.asarray(ranks) - QS)))
+
+
+def _total_weight(sketch):
+    return sum(len(buf) * 2 ** level for level, buf in enumerate(sketch.levels))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rank_error_is_bounded(seed):
+    rng = np.random.default_rng(seed)
+    data = rng.lognormal(8, 1, 100_000)
+    sketch = KLLSketch(200, seed=seed)
+    for chunk in np.array_split(data, 37):
+        sketch.update(chunk)
+    # k = 200 이면 순위 오차는 1% 안팎 — 2% 를 넘으면 압축이 틀린 것
+    assert _rank_error(sketch, data) < 0.02
+    # 원소 10만 개를 넣어도 남는 값은 k 의 몇 배 정도
+    assert sketch.n == len(data) and sum(len(buf) for buf in sketch.levels) < 3 * sketch.k
+    assert _total_weight(sketch) == len(data)
+
+
+def test_merge_matches_one_sketch_over_the_concatenation():
+    rng = np.random.default_rng(1)
+    parts = [rng.normal(1000, 200, 30_000), rng.uniform(0, 5000, 50_000), rng.exponential(800, 20_000)]
+    merged = KLLSketch(200, seed=0)
+    for i, part in enumerate(parts):
+        merged.merge(KLLSketch(200, seed=i).update(part))
+    whole = np.concatenate(parts)
+    single = KLLSketch(200, seed=0).update(whole)
+
+    assert merged.n == single.n == len(whole)
+    assert _total_weight(merged) == len(whole)
+    assert _rank_error(merged, whole) < 0.02
+    for q in (0.1, 0.5, 0.9):
+        assert abs(np.mean(whole <= merged.quantile(q)) - np.mean(whole <= single.quantile(q))) < 0.03
+
+
+def test_merge_rejects_other_k():
+    with pytest.raises(ValueError):
+        KLLSketch(200).merge(KLLSketch(100))
+
+
+def test_empty_and_single_item():
+    empty = KLLSketch()
+    assert empty.n == 0 and math.isnan(empty.quantile(0.5))
+    assert empty.update([]).n == 0 and math.isnan(empty.quantile(0.9))
+
+    one = KLLSketch().update([42.0])
+    assert [one.quantile(q) for q in (0.0, 0.5, 0.9, 1.0)] == [42.0] * 4
+    # 빈 스케치와 합쳐도 그대로
+    assert KLLSketch().merge(one).quantile(0.5) == 42.0
+    assert one.merge(KLLSketch()).n == 1 and one.quantile(0.5) == 42.0
+
+    assert math.isnan(TopN().mean())
+    assert TopN(3).update([5.0]).mean() == 5.0
+
+
+def test_top_n_keeps_the_largest():
+    rng = np.random.default_rng(2)
+    data = rng.normal(0, 1, 10_000)
+    top = TopN(5)
+    for chunk in np.array_split(data, 7):
+        top.update(chunk)
+    assert sorted(top.heap) == sorted(np.sort(data)[-5:].tolist())
+    other = TopN(5).update([100.0, 1.0])
+    assert top.merge(other).heap[0] == np.sort(data)[-4] and max(top.heap) == 100.0
+
+
+def test_references_round_trip(tmp_path):
+    rng = np.random.default_rng(3)
+    refs = StationReferences(k=100, top_n=3)
+    refs.update("강남", rng.normal(10_000, 1000, 5000)).update("사당", [1.0, 2.0, 3.0])
+    refs.seen.add(("강남", 202509))
+    path = str(tmp_path / "refs.json")
+    refs.save(path)
+    loaded = StationReferences.load(path)
+    assert loaded.seen == {("강남", 202509)}
+    assert loaded.quantile(0.9) == refs.quantile(0.9)
+    assert loaded.top_mean() == refs.top_mean() == {"강남": refs.top_mean()["강남"], "사당": 2.0}
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+import model_artifact
+from congestion_model import VARIANTS, StationModel
+from crowd_engine import COEFFICIENTS
+from train import trained_tables
+
+
+@pytest.fixture
+def trained(tmp_path):
+    # 사당이 빠지고 신촌이 새로 들어온 학습 결과
+    stations = ["강남", "서울역", "홍대입구", "신촌"]
+    coefficients = np.vstack([COEFFICIENTS[[0, 1, 3]], COEFFICIENTS[3] * 0.5])
+    path = str(tmp_path / "trained.bin")
+    model_artifact.write_artifact(path, *trained_tables(stations, coefficients), model_version="t1")
+    return model_artifact.load_artifact(path)
+
+
+@pytest.mark.parametrize("variant", list(VARIANTS))
+def test_every_listed_station_resolves(trained, variant):
+    model = StationModel(variant, trained)
+    assert len(model.stations) == 4
+    assert not any(s.startswith("사당") for s in model.stations)
+    rows = [model.row(s) for s in model.stations]
+    assert sorted(rows) == [0, 1, 2, 3]
+    pred, cdi, grade = model.score_array(rows, np.full(4, 18.0), np.zeros(4, int), np.full(4, 9))
+    # 기준값이 없는 새 역은 그날의 하루 최대값으로 나눈다
+    assert np.isfinite(cdi).all() and (grade >= 0).all()
+
+
+def test_keeps_variant_naming(trained):
+    assert StationModel("streamlit_app", trained).stations == ["서울역", "강남역", "홍대입구역", "신촌역"]
+    assert StationModel("streamlit_app6", trained).stations == ["강남", "서울역", "홍대입구", "신촌"]
+
+
+def test_builtin_lists_unchanged():
+    artifact = model_artifact.builtin_artifact()
+    for name, spec in VARIANTS.items():
+        assert StationModel(name, artifact).stations == spec["stations"]
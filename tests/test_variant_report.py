@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+import model_artifact
+from congestion_model import StationModel
+from variant_report import MINUTES, changed_fraction, disagreement_matrix, grade_cube, grade_cubes
+
+
+@pytest.fixture(scope="module")
+def artifact():
+    return model_artifact.builtin_artifact()
+
+
+@pytest.mark.parametrize("variant", ["streamlit_app6", "streamlit_app3", "streamlit_app11"])
+def test_cube_matches_score_array(artifact, variant):
+    cube = grade_cube(artifact, variant)
+    assert cube.shape == (4, 7, 12, len(MINUTES))
+    model = StationModel(variant, artifact)
+    rows, weekdays, months, minutes = (a.ravel() for a in np.meshgrid(
+        np.arange(4), np.arange(7), np.arange(1, 13), MINUTES, indexing="ij"))
+    _, _, grade = model.score_array(rows, minutes / 60, weekdays, months)
+    assert np.array_equal(cube.ravel(), grade)
+
+
+def test_disagreement(artifact):
+    variants, cubes = grade_cubes(artifact, ["streamlit_app7", "streamlit_app8", "streamlit_app2"])
+    matrix = disagreement_matrix(cubes)
+    assert np.allclose(np.diag(matrix), 0) and matrix[0, 1] == 0 and matrix[0, 2] > 0
+    assert np.allclose(matrix, matrix.T)
+    assert changed_fraction(artifact, artifact) == {v: 0.0 for v in artifact.variants}
@@ -0,0 +1,221 @@
+import argparse
+import os
+import time as _time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from crowd_engine import SERVICE_START, canonical_station
+
+# ------------------------
+# 입력 형식
+# ------------------------
+# 한 행 = 한 역의 한 시간대 인원: station(역 이름) / date(날짜) / hour(시각, 시간 단위) / 인원 열 (기본 boardings)
+# CSV 또는 Parquet, 디렉터리를 주면 그 아래 파일을 모두 읽는다 (ingest.py 의 station=/month= 파티션 포함).
+KEYS = ["station", "date", "hour"]
+TARGET = "boardings"
+N_FEATURES = 5      # [1, t, t^2, 요일, 월]
+CHUNKSIZE = 500_000
+
+
+def input_units(paths):
+    # 작업 단위: CSV 는 파일 하나, Parquet 은 파일이 들어 있는 디렉터리 하나 (= 파티션 하나)
+    units = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                units.update(os.path.join(root, n) for n in names if n.endswith(".csv"))
+                if any(n.endswith(".parquet") for n in names):
+                    units.add(root)
+        else:
+            units.add(path)
+    return sorted(units)
+
+
+def read_chunks(path, chunksize=CHUNKSIZE, target=TARGET):
+    # 결과 열 이름은 항상 station / date / hour / count
+    columns = KEYS + [target]
+    if os.path.isdir(path) or path.endswith(".parquet"):
+        # 파티션 하나 (역 하나, 한 달) 는 작으므로 한 번에 읽고, 같은 역의 여러 호선 행을 합친다
+        yield read_partition(path, columns).rename(columns={target: "count"})
+    else:
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+            yield chunk.rename(columns={target: "count"})
+
+
+def read_partition(path, columns):
+    import pyarrow.parquet as pq
+    directory = path if os.path.isdir(path) else os.path.dirname(path)
+    files = [os.path.join(path, n) for n in sorted(os.listdir(path)) if n.endswith(".parquet")] \
+        if os.path.isdir(path) else [path]
+    # 파티션 열 (station=강남/...) 은 파일 안에 없고 경로에만 있다
+    keys = {k: v for k, v in partition_keys(directory).items() if k in columns}
+    frames = []
+    for f in files:
+        names = pq.ParquetFile(f).schema_arrow.names
+        wanted = [c for c in columns if c in names and c not in keys]
+        frame = pq.read_table(f, columns=wanted + (["days"] if "days" in names else [])).to_pandas()
+        if "days" in frame:
+            # 월 단위 원본에서 온 행 (하루 평균, 날짜는 그 달 1일) 은 요일이 맞지 않아 학습에서 뺀다 (ingest.py)
+            frame = frame[frame.pop("days") == 1]
+        frames.append(frame)
+    df = pd.concat(frames, ignore_index=True).assign(**keys)
+    return df.groupby(KEYS, as_index=False, observed=True)[columns[len(KEYS):]].sum()
+
+
+def partition_keys(directory):
+    from urllib.parse import unquote
+    keys = {}
+    for part in os.path.normpath(directory).split(os.sep):
+        key, sep, value = part.partition("=")
+        if sep:
+            keys[key] = unquote(value)
+    return keys
+
+
+# ------------------------
+# 정규방정식 합 (XᵀX, Xᵀy) 누적
+# ------------------------
+# 역마다 5x5 / 5 / 스칼라 몇 개만 들고 있으므로 데이터가 몇 년치든 메모리는 역 수에만 비례한다.
+class NormalEquations:
+    def __init__(self):
+        self.stations = []
+        self.index = {}
+        self.xtx = np.zeros((0, N_FEATURES, N_FEATURES))
+        self.xty = np.zeros((0, N_FEATURES))
+        self.yty = np.zeros(0)
+        self.n = np.zeros(0, dtype=np.int64)
+
+    def _rows(self, names):
+        new = [name for name in names if name not in self.index]
+        for name in new:
+            self.index[name] = len(self.stations)
+            self.stations.append(name)
+        if new:
+            grow = len(new)
+            self.xtx = np.concatenate([self.xtx, np.zeros((grow, N_FEATURES, N_FEATURES))])
+            self.xty = np.concatenate([self.xty, np.zeros((grow, N_FEATURES))])
+            self.yty = np.concatenate([self.yty, np.zeros(grow)])
+            self.n = np.concatenate([self.n, np.zeros(grow, dtype=np.int64)])
+        return np.array([self.index[name] for name in names], dtype=np.intp)
+
+    def add_chunk(self, df, min_hour=SERVICE_START):
+        df = df[df["hour"] >= min_hour]     # 5시 이전은 모델이 5시 값으로 보정하므로 적합에서 뺀다
+        if df.empty:
+            return
+        codes, uniques = pd.factorize(df["station"].astype(str).map(canonical_station))
+        rows = self._rows(list(uniques))[codes]
+
+        date = pd.to_datetime(df["date"])
+        t = df["hour"].to_numpy(np.float64)
+        X = np.column_stack([np.ones_like(t), t, t * t,
+                             date.dt.weekday.to_numpy(np.float64), date.dt.month.to_numpy(np.float64)])
+        y = df["count"].to_numpy(np.float64)
+
+        # 역별 합을 bincount 로 — 행마다 외적을 만들지 않고 (i, j) 성분별로 한 번씩
+        size = len(self.stations)
+        for i in range(N_FEATURES):
+            for j in range(i, N_FEATURES):
+                s = np.bincount(rows, weights=X[:, i] * X[:, j], minlength=size)
+                self.xtx[:, i, j] += s
+                if i != j:
+                    self.xtx[:, j, i] += s
+            self.xty[:, i] += np.bincount(rows, weights=X[:, i] * y, minlength=size)
+        self.yty += np.bincount(rows, weights=y * y, minlength=size)
+        self.n += np.bincount(rows, minlength=size)
+
+    def merge(self, other):
+        rows = self._rows(other.stations)
+        self.xtx[rows] += other.xtx
+        self.xty[rows] += other.xty
+        self.yty[rows] += other.yty
+        self.n[rows] += other.n
+        return self
+
+    def solve(self, min_rows=N_FEATURES * 4):
+        # 역마다 (XᵀX) β = Xᵀy — 5x5 를 한꺼번에 푼다. 데이터가 모자라거나 특이행렬이면 그 역은 뺀다
+        keep = np.flatnonzero(self.n >= min_rows)
+        coefficients = np.full((len(keep), N_FEATURES), np.nan)
+        try:
+            coefficients[:] = np.linalg.solve(self.xtx[keep], self.xty[keep][..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            for n, i in enumerate(keep):
+                try:
+                    coefficients[n] = np.linalg.solve(self.xtx[i], self.xty[i])
+                except np.linalg.LinAlgError:
+                    pass
+        ok = ~np.isnan(coefficients).any(axis=1)
+        keep, coefficients = keep[ok], coefficients[ok]
+
+        # 잔차 제곱합도 누적한 합만으로: yᵀy - 2βᵀXᵀy + βᵀXᵀXβ
+        sse = (self.yty[keep] - 2 * np.einsum("si,si->s", coefficients, self.xty[keep])
+               + np.einsum("si,sij,sj->s", coefficients, self.xtx[keep], coefficients))
+        rmse = np.sqrt(np.maximum(sse, 0) / self.n[keep])
+        return [self.stations[i] for i in keep], coefficients, rmse, self.n[keep]
+
+
+def accumulate(path, chunksize=CHUNKSIZE, min_hour=SERVICE_START, target=TARGET):
+    sums = NormalEquations()
+    for chunk in read_chunks(path, chunksize, target):
+        sums.add_chunk(chunk, min_hour)
+    return sums
+
+
+# ------------------------
+# 학습
+# ------------------------
+def fit(paths, workers=None, chunksize=CHUNKSIZE, min_hour=SERVICE_START, target=TARGET):
+    # 파일 / 파티션 단위로 프로세스 풀에 나눠 누적한 뒤 합친다 (합은 순서와 무관)
+    files = input_units(paths)
+    if not files:
+        raise ValueError("학습 데이터 파일이 없습니다")
+    total = NormalEquations()
+    if workers == 1 or len(files) == 1:
+        for path in files:
+            total.merge(accumulate(path, chunksize, min_hour, target))
+    else:
+        n = len(files)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for sums in pool.map(accumulate, files, [chunksize] * n, [min_hour] * n, [target] * n):
+                total.merge(sums)
+    return total.solve()
+
+
+def trained_tables(stations, coefficients):
+    # 앱 변형은 그대로 두고 계수만 학습한 값으로 — 모든 변형이 새 "standard" 계수를 쓴다
+    from congestion_model import VARIANTS, display_stations
+    present = set(stations)
+    variants = {}
+    for name, spec in VARIANTS.items():
+        # 화면의 역 목록도 학습한 역으로 (변형의 표기 규칙은 유지)
+        spec = dict(spec, coefficients="standard", stations=display_stations(spec["stations"], stations))
+        if spec["max_values"] != "daily_peak":
+            spec["max_values"] = {s: v for s, v in spec["max_values"].items() if canonical_station(s) in present}
+        variants[name] = spec
+    return stations, {"standard": coefficients}, variants
+
+
+def write_trained(path, stations, coefficients, rmse, n_rows, model_version=None):
+    import model_artifact
+    extra = {"training": {s: {"rows": int(n), "rmse": round(float(e), 3)}
+                          for s, n, e in zip(stations, n_rows, rmse)}}
+    return model_artifact.write_artifact(path, *trained_tables(stations, coefficients),
+                                         model_version=model_version, extra_meta=extra)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="승하차 이력으로 역별 회귀 계수 학습")
+    parser.add_argument("output", help="모델 파일 경로 (예: models/crowd_model.bin)")
+    parser.add_argument("inputs", nargs="+", help="CSV / Parquet 파일 또는 디렉터리")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    parser.add_argument("--target", default=TARGET, help="학습할 인원 열 (boardings / alightings)")
+    parser.add_argument("--version")
+    args = parser.parse_args()
+
+    start = _time.perf_counter()
+    stations, coefficients, rmse, n_rows = fit(args.inputs, args.workers, args.chunksize, target=args.target)
+    version = write_trained(args.output, stations, coefficients, rmse, n_rows, args.version)
+    print(f"{args.output}: version {version}, {len(stations)} stations, {int(n_rows.sum())} rows, "
+          f"{_time.perf_counter() - start:.1f}s")
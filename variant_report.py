@@ -0,0 +1,116 @@
+import argparse
+import sys
+import time as _time
+
+import numpy as np
+
+from crowd_engine import grade_array, peak_array, predict_array
+
+WEEKDAYS = np.arange(7)
+MONTHS = np.arange(1, 13)
+MINUTES = np.arange(24 * 60)
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+# ------------------------
+# 전체 입력 공간의 등급
+# ------------------------
+# 역 x 요일 x 월 x 분 (4역이면 48만 칸) 을 변형마다 한 번의 broadcast 계산으로
+# 등급은 앱 / API 와 같은 반올림 (인원 → 정수, CDI → 소수 둘째 자리) 후에 — StationModel.score_array 와 같은 값
+def grade_cube(artifact, variant):
+    spec = artifact.variants[variant]
+    coefficients = artifact.coefficient_sets[spec["coefficients"]]
+    rows = np.arange(len(artifact.stations))[:, None, None, None]
+    pred = predict_array(rows, (MINUTES / 60)[None, None, None, :], WEEKDAYS[None, :, None, None],
+                         MONTHS[None, None, :, None], coefficients).round()
+
+    # 기준값이 없는 역 (NaN) 은 그날의 하루 최대값 — congestion_model.StationModel.max_value 와 같은 규칙
+    max_values = np.asarray(spec["max_values"], dtype=np.float64)[:, None, None, None]
+    max_values = np.broadcast_to(max_values, pred.shape[:3] + (1,)).copy()
+    missing = np.isnan(max_values)
+    if missing.any():
+        peaks = peak_array(coefficients[:, None, None, :], WEEKDAYS[None, :, None], MONTHS[None, None, :])[1]
+        max_values[missing] = peaks[..., None][missing]
+    return grade_array((pred / max_values).round(2), spec["cutoffs"])
+
+
+def grade_cubes(artifact, variants=None):
+    variants = list(variants or artifact.variants)
+    return variants, np.stack([grade_cube(artifact, name) for name in variants])
+
+
+# ------------------------
+# 비교
+# ------------------------
+def disagreement_matrix(cubes):
+    # [i, j] = 변형 i 와 j 의 등급이 다른 칸의 비율
+    flat = cubes.reshape(len(cubes), -1)
+    out = np.zeros((len(cubes), len(cubes)))
+    for i in range(len(cubes)):
+        out[i] = (flat != flat[i]).mean(axis=1)
+    return out
+
+
+def worst_regions(cubes, stations, top=10):
+    # 변형 간 등급 차이 (최대 - 최소) 를 역 x 요일 x 시각(시간 단위) 으로 모아 평균이 큰 곳부터
+    spread = cubes.max(axis=0).astype(np.int16) - cubes.min(axis=0)      # (역, 요일, 월, 분)
+    by_hour = spread.reshape(spread.shape[:3] + (24, 60)).mean(axis=(2, 4))   # (역, 요일, 시)
+    order = np.argsort(-by_hour, axis=None, kind="stable")[:top]
+    result = []
+    for s, w, h in zip(*np.unravel_index(order, by_hour.shape)):
+        result.append((stations[s], WEEKDAY_NAMES[w], int(h), round(float(by_hour[s, w, h]), 2),
+                        int(spread[s, w, :, h * 60:(h + 1) * 60].max())))
+    return result
+
+
+def changed_fraction(artifact, baseline, variants=None):
+    # 같은 변형을 두 모델 파일로 계산했을 때 등급이 바뀐 칸의 비율 {변형: 비율}
+    names = [v for v in (variants or artifact.variants) if v in baseline.variants]
+    if list(artifact.stations) != list(baseline.stations):
+        raise ValueError("역 목록이 다른 모델 파일끼리는 비교할 수 없습니다")
+    return {v: float((grade_cube(artifact, v) != grade_cube(baseline, v)).mean()) for v in names}
+
+
+def format_matrix(variants, matrix):
+    short = [v.replace("streamlit_", "") for v in variants]
+    lines = ["".ljust(8) + "".join(s.rjust(7) for s in short)]
+    for name, row in zip(short, matrix):
+        lines.append(name.ljust(8) + "".join(f"{v:7.0%}" for v in row))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from congestion_model import MODEL_PATH, load_artifact
+
+    parser = argparse.ArgumentParser(description="변형끼리 / 모델 파일끼리 등급이 얼마나 다른지 전수 비교")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--baseline", help="비교할 이전 모델 파일 — 주면 변형마다 바뀐 칸 비율을 본다")
+    parser.add_argument("--max-changed", type=float, default=None,
+                        help="바뀐 칸 비율이 이 값을 넘는 변형이 있으면 종료 코드 1 (모델 갱신 검사용)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--csv", help="불일치 행렬을 CSV 로 저장할 경로")
+    args = parser.parse_args()
+
+    start = _time.perf_counter()
+    artifact = load_artifact(args.model)
+    variants, cubes = grade_cubes(artifact)
+    matrix = disagreement_matrix(cubes)
+    regions = worst_regions(cubes, artifact.stations, args.top)
+    elapsed = _time.perf_counter() - start
+
+    print(f"model {artifact.model_version}: {len(variants)} variants x {cubes[0].size} cells, {elapsed:.2f}s")
+    print(format_matrix(variants, matrix))
+    print("\n차이가 큰 구간 (역, 요일, 시, 평균 등급 차, 최대 등급 차)")
+    for region in regions:
+        print("  " + "\t".join(str(v) for v in region))
+    if args.csv:
+        import pandas as pd
+        pd.DataFrame(matrix, index=variants, columns=variants).to_csv(args.csv)
+
+    if args.baseline:
+        changed = changed_fraction(artifact, load_artifact(args.baseline))
+        print("\n이전 모델 대비 등급이 바뀐 칸")
+        for name, fraction in changed.items():
+            print(f"  {name}\t{fraction:.1%}")
+        if args.max_changed is not None and max(changed.values(), default=0) > args.max_changed:
+            sys.exit(1)